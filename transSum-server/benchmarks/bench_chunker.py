@@ -0,0 +1,118 @@
+"""
+Chunking micro-benchmark.
+
+Compares TextChunker against the previous per-window rescan (slice the
+window, list every regex match in it) on synthetic multi-hundred-MB
+text, and checks both produce identical chunks.
+
+Usage:
+    uv run python benchmarks/bench_chunker.py                 # 256 MB
+    uv run python benchmarks/bench_chunker.py --mb 64 --chunk-size 2000
+    uv run python benchmarks/bench_chunker.py --skip-legacy --json out.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+from transsum.processing.chunker import Chunk, TextChunker, sentence_index
+
+_WORDS = (
+    "the pipeline merges partial results into one coherent summary while "
+    "chunks overlap slightly so context survives across every boundary "
+    "log line request latency token budget model adapter retry timeout"
+).split()
+
+
+def make_text(megabytes: float, seed: int = 7) -> str:
+    """Deterministic prose-like text of roughly `megabytes` MB."""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(2000):
+        n = rng.randint(4, 30)
+        sentences.append(" ".join(rng.choice(_WORDS) for _ in range(n)).capitalize()
+                         + rng.choice([".", ".", ".", "!", "?"]))
+    block = " ".join(sentences) + "\n\n"
+    target = int(megabytes * 1024 * 1024)
+    return (block * (target // len(block) + 1))[:target]
+
+
+def legacy_chunk(text: str, size: int, overlap: int) -> list[Chunk]:
+    """The previous algorithm: rescan each window with re.finditer."""
+    if len(text) <= size:
+        return [Chunk(index=0, text=text, char_count=len(text))]
+    chunks: list[Chunk] = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            matches = list(re.finditer(r'[.!?]\s', text[start:end]))
+            if matches and start + matches[-1].end() > start:
+                end = start + matches[-1].end()
+        piece = text[start:end].strip()
+        if piece:
+            chunks.append(Chunk(index=len(chunks), text=piece, char_count=len(piece)))
+        if end == len(text):
+            break
+        start = max(start + 1, end - overlap)
+    return chunks
+
+
+def _time(label: str, fn) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t0
+    print(f"  {label:<22} {elapsed:8.3f} s", file=sys.stderr)
+    return elapsed, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mb", type=float, default=256, help="input size in MB")
+    parser.add_argument("--chunk-size", type=int, default=4000)
+    parser.add_argument("--overlap", type=int, default=200)
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the new chunker")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args()
+
+    print(f"Generating {args.mb:g} MB of text…", file=sys.stderr)
+    text = make_text(args.mb)
+    chunker = TextChunker(args.chunk_size, args.overlap)
+    results: dict = {
+        "mb": args.mb, "chars": len(text),
+        "chunk_size": args.chunk_size, "overlap": args.overlap,
+    }
+
+    results["index_s"], index = _time("boundary index", lambda: sentence_index(text))
+    results["index_bytes"] = index.itemsize * len(index)
+    results["chunk_s"], chunks = _time("TextChunker.chunk", lambda: chunker.chunk(text))
+    results["chunks"] = len(chunks)
+
+    # Memory is measured in a separate pass: tracemalloc slows allocation
+    # enough to distort the timings above.
+    tracemalloc.start()
+    chunker.chunk(text)
+    results["peak_traced_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    if not args.skip_legacy:
+        results["legacy_s"], legacy = _time(
+            "legacy window rescan", lambda: legacy_chunk(text, args.chunk_size, args.overlap),
+        )
+        results["identical"] = [c.text for c in legacy] == [c.text for c in chunks]
+        results["speedup"] = results["legacy_s"] / results["chunk_s"]
+
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+"""
+End-to-end pipeline benchmark against a simulated model backend.
+
+Runs ProcessingPipeline over synthetic documents with `SimulatedAdapter`,
+a deterministic stand-in for a model server: every call sleeps for a
+fixed latency plus its output length at a given tokens/sec, and fails
+(then is retried, as the real adapters do) at a given error rate. Model
+time is therefore known exactly, and whatever the pipeline adds on top
+— chunking, prompt building, scheduling, reduce — shows up as wall-time
+and CPU overhead.
+
+Every combination of document size, chunk size, overlap and MAP
+concurrency is run once. Each result row reports wall time, model calls
+and failed attempts, CPU time and traced peak memory per chunk, and how
+far wall time exceeds the ideal model time at that concurrency. Results
+can be written as JSON and compared against an earlier run; the exit
+status is 1 if any row regressed beyond the tolerance.
+
+Usage:
+    uv run python benchmarks/bench_pipeline.py
+    uv run python benchmarks/bench_pipeline.py --sizes-kb 256 1024 --concurrency 1 4 16
+    uv run python benchmarks/bench_pipeline.py --json base.json
+    uv run python benchmarks/bench_pipeline.py --baseline base.json --tolerance 0.15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+
+from bench_chunker import make_text
+
+from transsum.models.base import BaseModelAdapter, ModelResponse
+from transsum.processing.chunker import TextChunker
+from transsum.processing.loader import DocumentLoader
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+
+# Metrics compared against a baseline (higher is worse for each)
+_COMPARED = ("wall_s", "calls", "cpu_ms_per_chunk", "peak_kb_per_chunk")
+
+
+# ── Simulated Backend ───────────────────────────────────────────────────────
+
+class SimulatedAdapter(BaseModelAdapter):
+    """
+    Deterministic fake model server.
+
+    Whether an attempt fails depends only on the seed, the prompt and the
+    attempt number, so runs are reproducible whatever order concurrent
+    calls are made in.
+
+    Args:
+        latency:       Seconds per call before the first token.
+        tokens_per_s:  Output generation speed.
+        output_tokens: Tokens in every answer (capped by max_tokens).
+        error_rate:    Probability that an attempt fails.
+        max_retries:   Attempts per call before it raises.
+        seed:          Seed for the failure pattern.
+    """
+
+    provider = "simulated"
+
+    def __init__(
+        self,
+        latency: float = 0.02,
+        tokens_per_s: float = 20000.0,
+        output_tokens: int = 200,
+        error_rate: float = 0.0,
+        max_retries: int = 3,
+        seed: int = 7,
+    ) -> None:
+        self._model = "simulated"
+        self._latency = latency
+        self._tokens_per_s = tokens_per_s
+        self._output_tokens = output_tokens
+        self._error_rate = error_rate
+        self._max_retries = max_retries
+        self._seed = seed
+        self.calls = 0
+        self.failed_attempts = 0
+        self.model_seconds = 0.0
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> ModelResponse:
+        """Sleep for the simulated generation time and answer with filler."""
+        tokens = min(max_tokens, self._output_tokens)
+        seconds = self._latency + tokens / self._tokens_per_s
+        self.calls += 1
+        for attempt in range(1, self._max_retries + 1):
+            self.model_seconds += seconds
+            await asyncio.sleep(seconds)
+            if random.Random(f"{self._seed}:{attempt}:{prompt}").random() >= self._error_rate:
+                break
+            self.failed_attempts += 1
+        else:
+            raise RuntimeError(f"Simulated failure after {self._max_retries} attempts")
+
+        return ModelResponse(
+            text=" ".join(["token"] * tokens),
+            model=self._model,
+            provider=self.provider,
+            usage={"prompt_tokens": len(prompt) // 4, "completion_tokens": tokens},
+            finish_reason="stop",
+        )
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> AsyncIterator[str]:
+        resp = await self.generate(prompt, max_tokens=max_tokens)
+        yield resp.text
+
+    async def close(self) -> None:
+        pass
+
+
+# ── Runs ────────────────────────────────────────────────────────────────────
+
+async def _run_once(text: str, args, chunk_size: int, overlap: int, concurrency: int):
+    adapter = SimulatedAdapter(
+        latency=args.latency,
+        tokens_per_s=args.tokens_per_s,
+        output_tokens=args.output_tokens,
+        error_rate=args.error_rate,
+        max_retries=args.max_retries,
+    )
+    pipeline = ProcessingPipeline(
+        adapter,
+        TextChunker(chunk_size, overlap),
+        map_concurrency=concurrency,
+        reduce_strategy=args.reduce,
+    )
+    document = DocumentLoader.load_text(text)
+    result = await pipeline.run(document, TaskType.SUMMARIZE)
+    return adapter, result
+
+
+def measure(text: str, args, chunk_size: int, overlap: int, concurrency: int) -> dict:
+    """Run one configuration and return its result row."""
+    config = {
+        "size_kb": len(text) // 1024,
+        "chunk_size": chunk_size,
+        "overlap": overlap,
+        "concurrency": concurrency,
+    }
+    wall0, cpu0 = time.perf_counter(), time.process_time()
+    try:
+        adapter, result = asyncio.run(_run_once(text, args, chunk_size, overlap, concurrency))
+    except RuntimeError as exc:
+        # A call that failed every attempt fails the run, as it would in production
+        return {**config, "error": str(exc)}
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+
+    # Memory is measured in a separate pass: tracemalloc slows allocation
+    # enough to distort the timings above.
+    tracemalloc.start()
+    asyncio.run(_run_once(text, args, chunk_size, overlap, concurrency))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    chunks = result.chunks_processed
+    # Lower bound on wall time: every call's model time spread evenly over the slots
+    ideal = adapter.model_seconds / min(concurrency, chunks)
+    return {
+        **config,
+        "chunks": chunks,
+        "calls": adapter.calls,
+        "failed_attempts": adapter.failed_attempts,
+        "wall_s": round(wall, 4),
+        "model_s": round(adapter.model_seconds, 4),
+        "overhead_pct": round(100 * (wall - ideal) / ideal, 1),
+        "cpu_ms_per_chunk": round(1000 * cpu / chunks, 3),
+        "peak_kb_per_chunk": round(peak / 1024 / chunks, 1),
+    }
+
+
+def _key(row: dict) -> tuple:
+    return row["size_kb"], row["chunk_size"], row["overlap"], row["concurrency"]
+
+
+def compare(rows: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """Describe every metric that got worse than the baseline by more than `tolerance`."""
+    previous = {_key(row): row for row in baseline}
+    regressions = []
+    for row in rows:
+        base = previous.get(_key(row))
+        if base is None:
+            continue
+        for metric in _COMPARED:
+            old, new = base.get(metric), row.get(metric)
+            if old and new is not None and new > old * (1 + tolerance):
+                regressions.append(
+                    f"{metric} {old} → {new} (+{100 * (new / old - 1):.0f}%) at "
+                    "size_kb={}, chunk_size={}, overlap={}, concurrency={}".format(*_key(row))
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[64, 256])
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[2000, 4000])
+    parser.add_argument("--overlaps", type=int, nargs="+", default=[0, 200])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--reduce", choices=["single", "tree"], default="single")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds per call")
+    parser.add_argument("--tokens-per-s", type=float, default=20000.0)
+    parser.add_argument("--output-tokens", type=int, default=200)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against an earlier --json")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative slowdown before a metric is a regression")
+    args = parser.parse_args()
+
+    rows = []
+    for size_kb in args.sizes_kb:
+        text = make_text(size_kb / 1024)
+        for chunk_size, overlap, concurrency in itertools.product(
+            args.chunk_sizes, args.overlaps, args.concurrency,
+        ):
+            if overlap >= chunk_size:
+                continue
+            row = measure(text, args, chunk_size, overlap, concurrency)
+            rows.append(row)
+            if "error" in row:
+                print(f"  {size_kb:>6} KB  chunk {chunk_size:>5}  overlap {overlap:>4}  "
+                      f"c={concurrency:<3} failed: {row['error']}", file=sys.stderr)
+                continue
+            print(
+                f"  {size_kb:>6} KB  chunk {chunk_size:>5}  overlap {overlap:>4}  "
+                f"c={concurrency:<3} {row['chunks']:>5} chunks  {row['wall_s']:8.3f} s  "
+                f"{row['cpu_ms_per_chunk']:7.3f} ms cpu/chunk",
+                file=sys.stderr,
+            )
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "simulation": {
+            "latency": args.latency, "tokens_per_s": args.tokens_per_s,
+            "output_tokens": args.output_tokens, "error_rate": args.error_rate,
+            "max_retries": args.max_retries, "reduce": args.reduce,
+        },
+        "results": rows,
+    }
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        if baseline.get("simulation") != results["simulation"]:
+            print("Baseline used different simulation settings; comparing anyway.",
+                  file=sys.stderr)
+        regressions = compare(rows, baseline["results"], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of the baseline.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
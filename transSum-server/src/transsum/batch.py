@@ -0,0 +1,344 @@
+"""
+Batch processing — many documents through one pipeline in one event loop.
+
+Running the CLI once per file pays interpreter startup, settings load
+and adapter construction every time, and leaves the backend idle while
+each file is loaded. `BatchRunner` instead processes a whole set of
+inputs with one shared adapter:
+
+  - files run concurrently, up to `jobs` at a time;
+  - the adapter is wrapped in a ConcurrencyLimitedAdapter, so model calls
+    in flight stay under one global cap across every document and chunk;
+  - each result is written to its own output file, and one JSON line per
+    input is appended to a results log as soon as that input finishes.
+
+A failed file is logged and counted; it never stops the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import glob
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from transsum.models.base import add_usage
+from transsum.processing.loader import DocumentLoader, PageStream
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+
+logger = logging.getLogger(__name__)
+
+
+# ── Inputs ──────────────────────────────────────────────────────────────────
+
+@dataclass
+class BatchItem:
+    """
+    One input file of a batch.
+
+    Attributes:
+        path:     Resolved path of the file.
+        relative: Path relative to the directory or glob it was found
+                  through; output files mirror this layout.
+    """
+    path: Path
+    relative: Path
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[")
+
+
+def _glob_root(pattern: str) -> Path:
+    """The leading directories of a glob pattern, before any wildcard."""
+    parts = Path(pattern).parts
+    fixed = []
+    for part in parts[:-1]:
+        if _is_glob(part):
+            break
+        fixed.append(part)
+    return Path(*fixed) if fixed else Path(".")
+
+
+def _expand(entry: str, base: Path) -> Iterable[tuple[Path, Path]]:
+    """Yield (path, relative) for one file, directory or glob entry."""
+    supported = DocumentLoader.SUPPORTED_EXTENSIONS
+    target = Path(entry).expanduser()
+    if not target.is_absolute():
+        target = base / target
+
+    if _is_glob(entry):
+        root = _glob_root(str(target))
+        for match in sorted(glob.glob(str(target), recursive=True)):
+            path = Path(match)
+            if path.is_file() and path.suffix.lower() in supported:
+                yield path, path.relative_to(root)
+    elif target.is_dir():
+        for path in sorted(target.rglob("*")):
+            if path.is_file() and path.suffix.lower() in supported:
+                yield path, path.relative_to(target)
+    else:
+        # Named explicitly: a missing or unsupported file is reported per file
+        yield target, Path(target.name)
+
+
+def collect_inputs(
+    entries: Iterable[str],
+    manifest: str | Path | None = None,
+) -> list[BatchItem]:
+    """
+    Expand files, directories and glob patterns into a list of inputs.
+
+    Directories are searched recursively for supported extensions, and
+    so are globs (`**` matches any depth). A manifest lists one entry per
+    line; blank lines and `#` comments are ignored, and relative entries
+    are resolved against the manifest's directory. A file reached through
+    several entries is processed once; distinct files that would share
+    an output name (`a/x.txt` and `b/x.txt` given as two directories) get
+    a numeric suffix on the second.
+
+    Args:
+        entries:  Paths, directories or glob patterns.
+        manifest: Optional file of further entries.
+
+    Returns:
+        Inputs in the order given, each directory or glob sorted by path.
+    """
+    sources = [(entry, Path.cwd()) for entry in entries]
+    if manifest is not None:
+        manifest = Path(manifest)
+        for line in manifest.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                sources.append((line, manifest.parent))
+
+    items: list[BatchItem] = []
+    seen: set[Path] = set()
+    names: set[Path] = set()
+    for entry, base in sources:
+        for path, relative in _expand(entry, base):
+            path = path.resolve()
+            if path in seen:
+                continue
+            seen.add(path)
+            unique, n = relative, 1
+            while unique.with_suffix("") in names:
+                n += 1
+                unique = relative.with_name(f"{relative.stem}-{n}{relative.suffix}")
+            names.add(unique.with_suffix(""))
+            items.append(BatchItem(path, unique))
+    return items
+
+
+def output_path(
+    output_dir: Path,
+    relative: Path,
+    task: TaskType,
+    language: str = "English",
+) -> Path:
+    """
+    Where the result for an input is written.
+
+    `reports/q3.pdf` becomes `reports/q3.summary.md`, or
+    `reports/q3.french.md` when translating into French.
+    """
+    suffix = "summary" if task == TaskType.SUMMARIZE else language.lower().replace(" ", "-")
+    return output_dir / relative.parent / f"{relative.stem}.{suffix}.md"
+
+
+# ── Results ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class BatchRecord:
+    """
+    Outcome for one input — a line of the JSONL results log.
+
+    Attributes:
+        file:          Input path.
+        status:        "ok", "error" or "skipped" (output already present).
+        output:        Output file written (or found, when skipped).
+        error:         Error message when status is "error".
+        words:         Word count of the loaded document.
+        chunks:        Chunks processed.
+        chunks_reused: Chunks answered from the MAP store.
+        model:         Model that produced the output.
+        usage:         Token usage summed over every call.
+        seconds:       Wall time for this input.
+    """
+    file: str
+    status: str
+    output: str | None = None
+    error: str | None = None
+    words: int = 0
+    chunks: int = 0
+    chunks_reused: int = 0
+    model: str = ""
+    usage: dict = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+@dataclass
+class BatchProgress:
+    """
+    Aggregate state of a running batch, for progress displays.
+
+    Attributes:
+        total:   Inputs in the batch.
+        done:    Inputs finished successfully.
+        failed:  Inputs that raised an error.
+        skipped: Inputs whose output already existed.
+        active:  Status message per input currently in flight.
+        usage:   Token usage summed over finished inputs.
+        started: `time.monotonic()` when the batch began.
+    """
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    skipped: int = 0
+    active: dict[str, str] = field(default_factory=dict)
+    usage: dict = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def finished(self) -> int:
+        return self.done + self.failed + self.skipped
+
+
+# ── Runner ──────────────────────────────────────────────────────────────────
+
+class BatchRunner:
+    """
+    Runs a pipeline task over many inputs concurrently.
+
+    The pipeline's adapter should be shared and concurrency-limited (see
+    ConcurrencyLimitedAdapter) — the runner itself only bounds how many
+    files are open at once.
+
+    Args:
+        pipeline:        Pipeline shared by every input.
+        task:            SUMMARIZE or TRANSLATE.
+        output_dir:      Directory for per-file outputs.
+        log_path:        JSONL results log (appended to).
+        language:        Target language (only used for TRANSLATE).
+        jobs:            Maximum inputs in flight.
+        map_concurrency: Per-document MAP concurrency (default: the
+                         pipeline's own).
+        skip_existing:   Skip inputs whose output file already exists.
+        open_document:   Opens an input for streaming (default
+                         `DocumentLoader.open`).
+    """
+
+    def __init__(
+        self,
+        pipeline: ProcessingPipeline,
+        task: TaskType,
+        output_dir: str | Path,
+        log_path: str | Path,
+        *,
+        language: str = "English",
+        jobs: int = 4,
+        map_concurrency: int | None = None,
+        skip_existing: bool = False,
+        open_document: Callable[[Path], PageStream] = DocumentLoader.open,
+    ) -> None:
+        if jobs < 1:
+            raise ValueError(f"jobs must be >= 1 (got {jobs}).")
+        self._pipeline = pipeline
+        self._task = task
+        self._output_dir = Path(output_dir)
+        self._log_path = Path(log_path)
+        self._language = language
+        self._jobs = jobs
+        self._map_concurrency = map_concurrency
+        self._skip_existing = skip_existing
+        self._open = open_document
+        self.progress = BatchProgress()
+
+    async def run(self, items: list[BatchItem]) -> list[BatchRecord]:
+        """
+        Process every input and return the records in input order.
+
+        Inputs are started in order as slots free up, so memory stays
+        bounded by `jobs` open documents however long the list is.
+        """
+        self.progress = BatchProgress(total=len(items))
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        records: list[BatchRecord | None] = [None] * len(items)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for pos in range(len(items)):
+            queue.put_nowait(pos)
+
+        with open(self._log_path, "a", encoding="utf-8") as log:
+            async def _worker() -> None:
+                while not queue.empty():
+                    pos = queue.get_nowait()
+                    record = await self._process(items[pos])
+                    records[pos] = record
+                    log.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+                    log.flush()
+
+            await asyncio.gather(*(_worker() for _ in range(min(self._jobs, len(items)))))
+
+        logger.info(
+            "Batch finished: %d ok, %d failed, %d skipped",
+            self.progress.done, self.progress.failed, self.progress.skipped,
+        )
+        return records
+
+    async def _process(self, item: BatchItem) -> BatchRecord:
+        """Run one input, turning any failure into an error record."""
+        name = str(item.relative)
+        target = output_path(self._output_dir, item.relative, self._task, self._language)
+        if self._skip_existing and target.exists():
+            self.progress.skipped += 1
+            return BatchRecord(file=str(item.path), status="skipped", output=str(target))
+
+        progress = self.progress
+        progress.active[name] = "Loading…"
+        start = time.monotonic()
+
+        def _update(msg: str) -> None:
+            progress.active[name] = msg
+
+        try:
+            document = self._open(item.path)
+            result = await self._pipeline.run(
+                document, self._task,
+                language=self._language,
+                map_concurrency=self._map_concurrency,
+                on_progress=_update,
+            )
+            await asyncio.to_thread(_write_output, target, result.output)
+        except Exception as exc:
+            logger.warning("Batch: %s failed: %s", item.path, exc)
+            progress.failed += 1
+            return BatchRecord(
+                file=str(item.path), status="error",
+                error=f"{type(exc).__name__}: {exc}",
+                seconds=round(time.monotonic() - start, 3),
+            )
+        finally:
+            del progress.active[name]
+
+        progress.done += 1
+        add_usage(progress.usage, result.usage)
+        return BatchRecord(
+            file=str(item.path),
+            status="ok",
+            output=str(target),
+            words=result.document.word_count,
+            chunks=result.chunks_processed,
+            chunks_reused=result.chunks_reused,
+            model=result.model,
+            usage=result.usage,
+            seconds=round(time.monotonic() - start, 3),
+        )
+
+
+def _write_output(target: Path, text: str) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(text.rstrip() + "\n", encoding="utf-8")
@@ -1,9 +1,10 @@
 """
 transSum CLI — Command-Line Interface.
 
-Provides three commands:
+Provides four commands:
     transsum summarize  — Summarize a document or inline text
     transsum translate  — Translate a document or inline text
+    transsum batch      — Summarize or translate many files in one run
     transsum config     — Show current configuration
 
 Usage:
@@ -11,6 +12,7 @@ Usage:
     transsum summarize --text "Long article content here..."
     transsum translate paper.txt --language French
     transsum translate --text "Hello world" -l Japanese -p anthropic
+    transsum batch reports/ "exports/**/*.csv" -o out/
     transsum config
 """
 
@@ -20,19 +22,23 @@ import asyncio
 import logging
 import os
 import sys
+import time
 
 import click
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from transsum.batch import BatchProgress, BatchRunner, collect_inputs
 from transsum.config import Settings, ModelProvider, get_settings
 from transsum.models.factory import create_adapter
+from transsum.models.limits import ConcurrencyLimitedAdapter
 from transsum.processing.loader import DocumentLoader
-from transsum.processing.chunker import TextChunker
 from transsum.processing.pipeline import ProcessingPipeline, TaskType, PipelineResult
+from transsum.processing.text_cache import create_text_cache
 
 console = Console()
 
@@ -50,6 +56,7 @@ def _setup_logging(level: str) -> None:
 def _apply_overrides(
     provider: str | None = None,
     model: str | None = None,
+    compress: float | None = None,
 ) -> Settings:
     """
     Build Settings with CLI flag overrides.
@@ -65,9 +72,23 @@ def _apply_overrides(
             os.environ["OLLAMA_MODEL"] = model
         else:
             os.environ["ANTHROPIC_MODEL"] = model
+    if compress is not None:
+        os.environ["COMPRESS_RATIO"] = str(compress)
     return get_settings()
 
 
+def _load(settings: Settings, file: str | None, text: str | None):
+    """Load inline text, or open a file to be streamed as it is read."""
+    if not file:
+        return DocumentLoader.load_text(text)
+    return DocumentLoader.open(
+        file,
+        pdf_workers=settings.pdf_workers,
+        text_cache=create_text_cache(settings),
+        keep_text=False,
+    )
+
+
 def _print_header(document, settings: Settings, task: TaskType, language: str = "") -> None:
     """Print the pre-processing info panel."""
     details = (
@@ -82,25 +103,131 @@ def _print_header(document, settings: Settings, task: TaskType, language: str =
     console.print(Panel(details, title="📄 transSum", border_style="blue"))
 
 
+def _result_panel(output: str, task: TaskType, complete: bool = True) -> Panel:
+    """Build the output panel (also used while streaming)."""
+    title = (
+        f"✅ {task.value.title()} Complete" if complete
+        else f"⏳ {task.value.title()} in progress…"
+    )
+    return Panel(
+        Markdown(output),
+        title=title,
+        border_style="green" if complete else "yellow",
+        padding=(1, 2),
+    )
+
+
 def _print_result(result: PipelineResult) -> None:
     """Print the formatted result panel and stats."""
     console.print()
-    console.print(Panel(
-        Markdown(result.output),
-        title=f"✅ {result.task.value.title()} Complete",
-        border_style="green",
-        padding=(1, 2),
-    ))
+    console.print(_result_panel(result.output, result.task))
+    _print_stats(result)
+
 
-    # Stats line
+def _print_stats(result: PipelineResult) -> None:
+    """Print the model / chunk / token stats line."""
     prompt_tok = result.usage.get("prompt_tokens", "?")
     comp_tok = result.usage.get("completion_tokens", "?")
+    cached = ""
+    if result.usage.get("cache_read_tokens") or result.usage.get("cache_write_tokens"):
+        cached = (
+            f" (cache: {result.usage.get('cache_read_tokens', 0)} read, "
+            f"{result.usage.get('cache_write_tokens', 0)} written)"
+        )
+    load = ""
+    if result.usage.get("load_ms"):
+        load = f"  •  Model load: {result.usage['load_ms'] / 1000:.1f}s"
     console.print(
         f"\n[dim]Model: {result.model}  •  "
         f"Provider: {result.provider}  •  "
-        f"Chunks: {result.chunks_processed}  •  "
-        f"Tokens: {prompt_tok}↑ {comp_tok}↓[/dim]\n"
+        f"Chunks: {result.chunks_processed}"
+        f"{f' ({result.chunks_reused} reused)' if result.chunks_reused else ''}  •  "
+        f"Tokens: {prompt_tok}↑ {comp_tok}↓{cached}{load}[/dim]\n"
+    )
+
+
+def _print_timings(result: PipelineResult) -> None:
+    """Print where the run spent its time (--timings)."""
+    timings = result.timings.to_dict()
+    latency = timings["map_latency_ms"]
+
+    table = Table(
+        title=f"Timings — {timings['calls']} model calls",
+        header_style="bold cyan",
+        border_style="dim",
+    )
+    table.add_column("Stage", style="bold")
+    table.add_column("Time", justify="right")
+    for stage, ms in timings["stages_ms"].items():
+        table.add_row(stage, f"{ms:,.1f} ms")
+    table.add_row("total", f"{timings['total_ms']:,.1f} ms", style="bold")
+
+    table.add_section()
+    if latency["p50"] is not None:
+        table.add_row(
+            "MAP latency",
+            f"p50 {latency['p50']:,.0f} / p95 {latency['p95']:,.0f} / "
+            f"max {latency['max']:,.0f} ms",
+        )
+    if timings["first_token_ms"] is not None:
+        table.add_row("First token", f"{timings['first_token_ms']:,.1f} ms")
+    table.add_row(
+        "Tokens/s",
+        f"{timings['prompt_tokens_per_s']:,.0f}↑ {timings['completion_tokens_per_s']:,.0f}↓",
+    )
+    console.print(table)
+    console.print()
+
+
+async def _stream(
+    pipeline: ProcessingPipeline,
+    document,
+    task: TaskType,
+    language: str,
+) -> PipelineResult:
+    """Show MAP progress, then render the final output live as it streams."""
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
     )
+    task_id = progress.add_task(description="Processing with LLM…", total=None)
+    live: Live | None = None
+    pieces: list[str] = []
+    last_render = 0.0
+    result: PipelineResult | None = None
+
+    progress.start()
+    try:
+        async for event in pipeline.stream_events(document, task, language=language):
+            if event.kind == "mapped":
+                done = f"{event.completed}/{event.total}" if event.total else event.completed
+                progress.update(task_id, description=f"Processed chunk {done}")
+            elif event.kind == "reduce":
+                progress.update(
+                    task_id, description=f"Merging {event.total} sections into final output…",
+                )
+            elif event.kind == "token":
+                if live is None:
+                    progress.stop()
+                    console.print()
+                    live = Live(console=console, vertical_overflow="visible")
+                    live.start()
+                pieces.append(event.text)
+                # Re-parsing Markdown per token is quadratic; throttle renders
+                if time.monotonic() - last_render > 0.1:
+                    live.update(_result_panel("".join(pieces), task, complete=False))
+                    last_render = time.monotonic()
+            elif event.kind == "done":
+                result = event.result
+                if live:
+                    live.update(_result_panel(result.output, task))
+    finally:
+        progress.stop()
+        if live:
+            live.stop()
+    return result
 
 
 async def _execute(
@@ -108,15 +235,23 @@ async def _execute(
     document,
     task: TaskType,
     language: str = "English",
+    stream: bool = False,
+    timings: bool = False,
 ) -> None:
     """Run the pipeline with progress spinner and formatted output."""
     adapter = create_adapter(settings)
-    chunker = TextChunker(settings.chunk_size, settings.chunk_overlap)
-    pipeline = ProcessingPipeline(adapter, chunker)
+    pipeline = ProcessingPipeline.from_settings(settings, adapter)
 
     try:
         _print_header(document, settings, task, language)
 
+        if stream:
+            result = await _stream(pipeline, document, task, language)
+            _print_stats(result)
+            if timings:
+                _print_timings(result)
+            return
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -133,11 +268,14 @@ async def _execute(
             )
 
         _print_result(result)
+        if timings:
+            _print_timings(result)
 
     except RuntimeError as exc:
         console.print(f"\n[bold red]Error:[/bold red] {exc}\n")
         sys.exit(1)
     finally:
+        await pipeline.close()
         await adapter.close()
 
 
@@ -176,7 +314,14 @@ def main(ctx, log_level):
     help="Override the model provider.",
 )
 @click.option("--model", "-m", help="Override the model name.")
-def summarize(file, text, provider, model):
+@click.option("--stream", is_flag=True, help="Stream the output as it is generated.")
+@click.option("--timings", is_flag=True, help="Show where the run spent its time.")
+@click.option(
+    "--compress",
+    type=click.FloatRange(0.05, 1.0),
+    help="Keep only this share of each chunk's sentences before MAP (e.g. 0.3).",
+)
+def summarize(file, text, provider, model, stream, timings, compress):
     """
     Summarize a document or inline text.
 
@@ -186,6 +331,9 @@ def summarize(file, text, provider, model):
         transsum summarize notes.md --provider anthropic
         transsum summarize --text "Your long text here…"
         transsum summarize paper.txt -m mistral
+        transsum summarize long-report.pdf --stream
+        transsum summarize long-report.pdf --timings
+        transsum summarize meeting-transcript.txt --compress 0.3
     """
     if not file and not text:
         console.print(
@@ -194,9 +342,11 @@ def summarize(file, text, provider, model):
         )
         raise SystemExit(1)
 
-    settings = _apply_overrides(provider, model)
-    doc = DocumentLoader.load(file) if file else DocumentLoader.load_text(text)
-    asyncio.run(_execute(settings, doc, TaskType.SUMMARIZE))
+    settings = _apply_overrides(provider, model, compress)
+    doc = _load(settings, file, text)
+    asyncio.run(_execute(
+        settings, doc, TaskType.SUMMARIZE, stream=stream, timings=timings,
+    ))
 
 
 # Command: translate
@@ -219,7 +369,9 @@ def summarize(file, text, provider, model):
     help="Override the model provider.",
 )
 @click.option("--model", "-m", help="Override the model name.")
-def translate(file, text, language, provider, model):
+@click.option("--stream", is_flag=True, help="Stream the output as it is generated.")
+@click.option("--timings", is_flag=True, help="Show where the run spent its time.")
+def translate(file, text, language, provider, model, stream, timings):
     """
     Translate a document or inline text.
 
@@ -228,6 +380,7 @@ def translate(file, text, language, provider, model):
         transsum translate article.txt --language French
         transsum translate --text "Hello world" -l Japanese
         transsum translate paper.pdf -l German -p anthropic
+        transsum translate paper.pdf -l German --stream
     """
     if not file and not text:
         console.print(
@@ -237,8 +390,188 @@ def translate(file, text, language, provider, model):
         raise SystemExit(1)
 
     settings = _apply_overrides(provider, model)
-    doc = DocumentLoader.load(file) if file else DocumentLoader.load_text(text)
-    asyncio.run(_execute(settings, doc, TaskType.TRANSLATE, language=language))
+    doc = _load(settings, file, text)
+    asyncio.run(_execute(
+        settings, doc, TaskType.TRANSLATE, language=language, stream=stream,
+        timings=timings,
+    ))
+
+
+# Command: batch
+
+def _batch_table(progress: BatchProgress, adapter: ConcurrencyLimitedAdapter) -> Table:
+    """Aggregate batch progress plus one row per file in flight."""
+    elapsed = time.monotonic() - progress.started
+    rate = progress.finished / elapsed * 60 if elapsed else 0.0
+    table = Table(
+        title=(
+            f"transSum batch — {progress.finished}/{progress.total} files  •  "
+            f"[green]{progress.done} ok[/green]  •  [red]{progress.failed} failed[/red]  •  "
+            f"{progress.skipped} skipped"
+        ),
+        caption=(
+            f"LLM calls in flight: {adapter.in_flight}/{adapter.limit}  •  "
+            f"Tokens: {progress.usage.get('prompt_tokens', 0):,}↑ "
+            f"{progress.usage.get('completion_tokens', 0):,}↓  •  "
+            f"{elapsed:.0f}s elapsed, {rate:.1f} files/min"
+        ),
+        header_style="bold cyan",
+        border_style="dim",
+    )
+    table.add_column("File", style="bold", overflow="fold")
+    table.add_column("Status")
+    for name, status in list(progress.active.items()):
+        table.add_row(name, status)
+    return table
+
+
+async def _run_batch(
+    settings: Settings,
+    items,
+    task: TaskType,
+    *,
+    language: str,
+    output_dir: str,
+    log_path: str,
+    concurrency: int,
+    jobs: int,
+    skip_existing: bool,
+) -> BatchProgress:
+    """Process every input with one shared, concurrency-limited adapter."""
+    adapter = ConcurrencyLimitedAdapter(create_adapter(settings), concurrency)
+    pipeline = ProcessingPipeline.from_settings(settings, adapter)
+    text_cache = create_text_cache(settings)
+    runner = BatchRunner(
+        pipeline, task, output_dir, log_path,
+        language=language,
+        jobs=jobs,
+        map_concurrency=concurrency,   # one file may use the whole global cap
+        skip_existing=skip_existing,
+        open_document=lambda path: DocumentLoader.open(
+            path, pdf_workers=settings.pdf_workers, text_cache=text_cache, keep_text=False,
+        ),
+    )
+    try:
+        with Live(
+            get_renderable=lambda: _batch_table(runner.progress, adapter),
+            console=console,
+            refresh_per_second=4,
+        ):
+            await runner.run(items)
+    finally:
+        await pipeline.close()
+        await adapter.close()
+    return runner.progress
+
+
+@main.command()
+@click.argument("inputs", nargs=-1)
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File listing inputs, one path, directory or glob per line.",
+)
+@click.option(
+    "--task",
+    type=click.Choice([t.value for t in TaskType]),
+    default=TaskType.SUMMARIZE.value,
+    show_default=True,
+    help="What to do with each file.",
+)
+@click.option(
+    "--language", "-l",
+    default="English",
+    show_default=True,
+    help="Target language when --task translate.",
+)
+@click.option(
+    "--output-dir", "-o",
+    default="transsum-output",
+    show_default=True,
+    type=click.Path(file_okay=False),
+    help="Directory for per-file outputs (mirrors input subdirectories).",
+)
+@click.option(
+    "--log", "log_path",
+    type=click.Path(dir_okay=False),
+    help="JSONL results log, appended to (default: OUTPUT_DIR/results.jsonl).",
+)
+@click.option(
+    "--concurrency", "-c",
+    type=click.IntRange(1, 100_000),
+    help="Max LLM calls in flight across all files (default: MAP_CONCURRENCY, "
+         "or ANTHROPIC_BATCH_MAX_REQUESTS with ANTHROPIC_BATCH).",
+)
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(1, 100_000),
+    help="Max files processed at once (default: the --concurrency value, at most 256).",
+)
+@click.option("--skip-existing", is_flag=True, help="Skip files whose output already exists.")
+@click.option(
+    "--provider", "-p",
+    type=click.Choice(["ollama", "anthropic"], case_sensitive=False),
+    help="Override the model provider.",
+)
+@click.option("--model", "-m", help="Override the model name.")
+def batch(
+    inputs, manifest, task, language, output_dir, log_path,
+    concurrency, jobs, skip_existing, provider, model,
+):
+    """
+    Summarize or translate many files in one run.
+
+    INPUTS may be files, directories (searched recursively) or quoted
+    glob patterns. Every file shares one adapter, and model calls are
+    capped globally rather than per file.
+
+    \b
+    Examples:
+        transsum batch reports/ -o summaries/
+        transsum batch "exports/**/*.csv" --skip-existing
+        transsum batch --manifest nightly.txt -c 16 -j 8
+        transsum batch docs/ --task translate -l French -o fr/
+    """
+    if not inputs and not manifest:
+        console.print(
+            "[bold red]Error:[/bold red] Provide INPUTS (files, directories, globs) "
+            "or --manifest.\n"
+        )
+        raise SystemExit(1)
+
+    settings = _apply_overrides(provider, model)
+    items = collect_inputs(inputs, manifest)
+    if not items:
+        console.print("[bold red]Error:[/bold red] No supported files matched.\n")
+        raise SystemExit(1)
+
+    if concurrency is None:
+        # Message Batches pay off when every queued prompt can go in one batch
+        batching = (
+            settings.model_provider == ModelProvider.ANTHROPIC and settings.anthropic_batch
+        )
+        concurrency = (
+            settings.anthropic_batch_max_requests if batching else settings.map_concurrency
+        )
+    log_path = log_path or os.path.join(output_dir, "results.jsonl")
+    progress = asyncio.run(_run_batch(
+        settings, items, TaskType(task),
+        language=language,
+        output_dir=output_dir,
+        log_path=log_path,
+        concurrency=concurrency,
+        jobs=jobs or min(concurrency, 256),
+        skip_existing=skip_existing,
+    ))
+
+    elapsed = time.monotonic() - progress.started
+    console.print(
+        f"\n[bold]{progress.done}[/bold] ok  •  [bold red]{progress.failed}[/bold red] failed  •  "
+        f"{progress.skipped} skipped  •  {elapsed:.1f}s\n"
+        f"[dim]Outputs: {output_dir}  •  Log: {log_path}[/dim]\n"
+    )
+    if progress.failed:
+        sys.exit(1)
 
 
 # Command: config
@@ -267,12 +600,46 @@ def config():
     table.add_row("", "")
     table.add_row("Anthropic Model", settings.anthropic_model)
     table.add_row("Anthropic Key", key_display)
+    table.add_row("Prompt Caching", "on" if settings.anthropic_prompt_cache else "off")
+    table.add_row(
+        "Message Batches",
+        f"on (window {settings.anthropic_batch_window:g}s, "
+        f"poll {settings.anthropic_batch_poll:g}s, "
+        f"≤{settings.anthropic_batch_max_requests:,} requests)"
+        if settings.anthropic_batch else "off",
+    )
     table.add_row("", "")
     table.add_row("Chunk Size", f"{settings.chunk_size:,} chars")
     table.add_row("Chunk Overlap", f"{settings.chunk_overlap:,} chars")
+    table.add_row("Chunking Mode", settings.chunking_mode)
+    if settings.chunking_mode == "tokens":
+        table.add_row(
+            "Chunk Tokens",
+            f"{settings.chunk_tokens:,} ({settings.overlap_tokens:,} overlap, "
+            f"{settings.token_estimator})",
+        )
     table.add_row("Max Retries", str(settings.max_retries))
+    table.add_row("Map Concurrency", str(settings.map_concurrency))
+    table.add_row("PDF Workers", str(settings.pdf_workers or "auto"))
+    table.add_row("Reduce Strategy", settings.reduce_strategy)
+    table.add_row(
+        "Pre-compression",
+        f"{settings.compress_method}, keep {settings.compress_ratio:.0%}"
+        if settings.compress_ratio < 1 else "off",
+    )
     table.add_row("Timeout", f"{settings.request_timeout}s")
     table.add_row("", "")
+    table.add_row(
+        "Response Cache",
+        f"{settings.cache_path} ({settings.cache_max_mb} MB)"
+        if settings.cache_enabled else "off",
+    )
+    table.add_row(
+        "Text Cache",
+        f"{settings.text_cache_path} ({settings.text_cache_max_mb} MB)"
+        if settings.text_cache_enabled else "off",
+    )
+    table.add_row("", "")
     table.add_row("Log Level", settings.log_level)
     table.add_row("MCP Port", str(settings.mcp_server_port))
 
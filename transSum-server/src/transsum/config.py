@@ -59,6 +59,17 @@ class Settings(BaseSettings):
         default="llama3.1",
         description="Ollama model tag to use (e.g. llama3.1, mistral).",
     )
+    ollama_keep_alive: str = Field(
+        default="30m",
+        pattern=r"^-?\d+$|^(\d+(\.\d+)?(ms|s|m|h))+$",
+        description="How long Ollama keeps the model loaded after a request: "
+                    "a duration ('30m', '1h'), seconds, or -1 for indefinitely.",
+    )
+    ollama_preload: bool = Field(
+        default=True,
+        description="Load the Ollama model when the MCP server starts instead "
+                    "of on the first request.",
+    )
 
     # ── Anthropic ───────────────────────────────────────────────────────
     anthropic_api_key: Optional[str] = Field(
@@ -69,6 +80,52 @@ class Settings(BaseSettings):
         default="claude-sonnet-4-20250514",
         description="Anthropic model identifier.",
     )
+    anthropic_prompt_cache: bool = Field(
+        default=False,
+        description="Mark the system prompt and the instructions shared by "
+                    "every chunk with cache_control (prompt caching). Prefixes "
+                    "under the model's caching minimum are sent unmarked.",
+    )
+    anthropic_batch: bool = Field(
+        default=False,
+        description="Send Anthropic requests through the Message Batches API "
+                    "(asynchronous, half price, separate rate limits).",
+    )
+    anthropic_batch_window: float = Field(
+        default=5.0, ge=0.0, le=600.0,
+        description="Seconds without a new request before queued requests "
+                    "are submitted as a batch.",
+    )
+    anthropic_batch_poll: float = Field(
+        default=30.0, ge=1.0, le=3600.0,
+        description="Seconds between status checks of a submitted batch.",
+    )
+    anthropic_batch_max_requests: int = Field(
+        default=10000, ge=1, le=100000,
+        description="Requests per batch; a full queue is submitted at once.",
+    )
+
+    # ── Failover ────────────────────────────────────────────────────────
+    fallback_providers: str = Field(
+        default="",
+        description="Comma-separated providers to fail over to, in order, when "
+                    "MODEL_PROVIDER errors or times out (e.g. 'anthropic').",
+    )
+    failover_timeout: float = Field(
+        default=0.0, ge=0.0, le=600.0,
+        description="Seconds before a backend's call counts as failed and the "
+                    "next provider is tried (0 = only REQUEST_TIMEOUT).",
+    )
+    hedge_requests: bool = Field(
+        default=False,
+        description="Also send slow calls to the next provider; the first "
+                    "answer wins and the other is cancelled.",
+    )
+    hedge_after: float = Field(
+        default=0.0, ge=0.0, le=600.0,
+        description="Seconds before a call is hedged (0 = the provider's "
+                    "recent p95 latency).",
+    )
 
     # ── Processing ──────────────────────────────────────────────────────
     chunk_size: int = Field(
@@ -79,15 +136,143 @@ class Settings(BaseSettings):
         default=200, ge=0, le=2000,
         description="Characters of overlap between consecutive chunks.",
     )
+    chunking_mode: Literal["fixed", "content", "tokens"] = Field(
+        default="fixed",
+        description="'fixed' sliding windows, 'content'-defined boundaries "
+                    "that stay put when the document is edited, or 'tokens' "
+                    "to pack sentences up to CHUNK_TOKENS.",
+    )
+    chunk_tokens: int = Field(
+        default=1000, ge=50, le=200000,
+        description="Maximum estimated tokens per chunk (chunking_mode=tokens).",
+    )
+    overlap_tokens: int = Field(
+        default=50, ge=0, le=20000,
+        description="Tokens of overlap between chunks (chunking_mode=tokens).",
+    )
+    token_estimator: Literal["heuristic", "tiktoken"] = Field(
+        default="heuristic",
+        description="'heuristic' script-aware estimate, or exact 'tiktoken' "
+                    "counts (requires the tiktoken package).",
+    )
     max_retries: int = Field(
         default=3, ge=1, le=10,
         description="Number of retry attempts for failed LLM calls.",
     )
+    map_concurrency: int = Field(
+        default=4, ge=1, le=64,
+        description="Maximum chunk prompts in flight during the MAP phase.",
+    )
+    reduce_strategy: Literal["single", "tree"] = Field(
+        default="single",
+        description="'single' merges all partials in one call; 'tree' merges "
+                    "neighbouring summaries hierarchically within a token budget.",
+    )
+    reduce_token_budget: int = Field(
+        default=8000, ge=500, le=200000,
+        description="Approximate input tokens per tree-reduce merge prompt.",
+    )
+    strip_boilerplate: bool = Field(
+        default=False,
+        description="Drop header, footer and disclaimer lines repeated across "
+                    "the pages of a PDF before summarizing it.",
+    )
+    dedupe_chunks: bool = Field(
+        default=True,
+        description="Reuse the MAP result of an earlier identical chunk (or, with "
+                    "DEDUPE_SIMILARITY below 1, a near-identical summary chunk) "
+                    "instead of a new LLM call.",
+    )
+    dedupe_similarity: float = Field(
+        default=1.0, ge=0.5, le=1.0,
+        description="Word-shingle similarity at which a summary chunk counts as a "
+                    "near-duplicate (1.0 = exact copies only; lower values reuse "
+                    "the summary of a chunk that differs in its details).",
+    )
+    compress_ratio: float = Field(
+        default=1.0, gt=0.0, le=1.0,
+        description="Share of each chunk kept by the extractive pre-pass before "
+                    "MAP when summarizing (1.0 = off).",
+    )
+    compress_method: Literal["tfidf", "textrank"] = Field(
+        default="tfidf",
+        description="'tfidf' centroid scoring, or 'textrank' graph ranking "
+                    "(requires the numpy package).",
+    )
+    translate_merge: Literal["llm", "stitch"] = Field(
+        default="llm",
+        description="'llm' sends the whole translation through a final LLM pass; "
+                    "'stitch' joins translated chunks on their overlap locally.",
+    )
+    stitch_min_confidence: float = Field(
+        default=0.3, ge=0.0, le=1.0,
+        description="Overlap agreement below which a translation seam is "
+                    "merged by the model (on a small window around it).",
+    )
+    pdf_workers: int = Field(
+        default=0, ge=0, le=64,
+        description="Processes for PDF text extraction (0 = one per CPU, 1 = serial). "
+                    "PDFs under 16 pages are always extracted serially.",
+    )
+    rate_limit_rpm: int = Field(
+        default=0, ge=0,
+        description="Requests per minute to allow the provider (0 = unlimited).",
+    )
+    rate_limit_tpm: int = Field(
+        default=0, ge=0,
+        description="Input plus output tokens per minute to allow the provider "
+                    "(0 = unlimited).",
+    )
+    rate_limit_state: str = Field(
+        default="",
+        description="SQLite file through which processes sharing one API key "
+                    "share its rate limits (empty = limits per process).",
+    )
     request_timeout: int = Field(
         default=120, ge=10, le=600,
         description="HTTP timeout in seconds for LLM requests.",
     )
 
+    # ── Response Cache ──────────────────────────────────────────────────
+    cache_enabled: bool = Field(
+        default=False,
+        description="Serve repeat LLM requests from a local SQLite cache.",
+    )
+    cache_path: str = Field(
+        default="~/.cache/transsum/responses.sqlite3",
+        description="Location of the response cache database.",
+    )
+    cache_max_mb: int = Field(
+        default=256, ge=1, le=100_000,
+        description="Size cap for cached response text, in megabytes.",
+    )
+    cache_ttl: int = Field(
+        default=7 * 24 * 3600, ge=0,
+        description="Seconds a cached response stays valid (0 = never expire).",
+    )
+
+    map_store_enabled: bool = Field(
+        default=False,
+        description="Store per-chunk MAP results and reuse them for unchanged chunks.",
+    )
+    map_store_path: str = Field(
+        default="~/.cache/transsum/map_results.sqlite3",
+        description="Location of the per-chunk MAP result store.",
+    )
+
+    text_cache_enabled: bool = Field(
+        default=False,
+        description="Cache text extracted from PDFs and reuse it for unchanged files.",
+    )
+    text_cache_path: str = Field(
+        default="~/.cache/transsum/extracted",
+        description="Directory of the extracted-text cache.",
+    )
+    text_cache_max_mb: int = Field(
+        default=512, ge=1, le=100_000,
+        description="Size cap for the extracted-text cache, in megabytes.",
+    )
+
     # ── Logging ─────────────────────────────────────────────────────────
     log_level: str = Field(default="INFO")
 
@@ -97,6 +282,10 @@ class Settings(BaseSettings):
         default="stdio",
         description="MCP transport: 'stdio' for local clients, 'streamable-http' for remote.",
     )
+    mcp_metrics: bool = Field(
+        default=True,
+        description="Serve Prometheus metrics at /metrics over streamable-http.",
+    )
 
     # ── Validators ──────────────────────────────────────────────────────
 
@@ -112,6 +301,22 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("fallback_providers")
+    @classmethod
+    def _known_fallbacks(cls, v, info):
+        names = [name.strip().lower() for name in v.split(",") if name.strip()]
+        for name in names:
+            if name not in {p.value for p in ModelProvider}:
+                raise ValueError(
+                    f"FALLBACK_PROVIDERS: unknown provider {name!r} "
+                    "(expected 'ollama' or 'anthropic')."
+                )
+        if ModelProvider.ANTHROPIC.value in names and not info.data.get("anthropic_api_key"):
+            raise ValueError(
+                "ANTHROPIC_API_KEY is required when FALLBACK_PROVIDERS includes anthropic."
+            )
+        return ",".join(names)
+
     @field_validator("chunk_overlap")
     @classmethod
     def _overlap_less_than_size(cls, v, info):
@@ -122,6 +327,16 @@ class Settings(BaseSettings):
             )
         return v
 
+    @field_validator("overlap_tokens")
+    @classmethod
+    def _overlap_less_than_tokens(cls, v, info):
+        size = info.data.get("chunk_tokens", 1000)
+        if v >= size:
+            raise ValueError(
+                f"OVERLAP_TOKENS ({v}) must be less than CHUNK_TOKENS ({size})."
+            )
+        return v
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -0,0 +1,249 @@
+"""
+Prometheus metrics for the MCP server.
+
+A small in-process registry, rendered in the Prometheus text exposition
+format at ``/metrics`` when the server runs over streamable-http.
+Recording is a tuple lookup and a few additions — the server runs on
+one event loop, so no locks — and nothing is formatted until a scrape,
+so collection stays on in the hot path.
+
+`ServerMetrics` holds the server's metrics: tool calls, errors and
+in-flight requests, pipeline stage and LLM call latency, token counts,
+chunk reuse and response-cache hits.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
+from transsum.processing.pipeline import PipelineResult
+
+# Seconds; spans a cached answer up to a long document on a local model
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+# ── Registry ────────────────────────────────────────────────────────────────
+
+class _Metric:
+    """One metric family: a value per combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def _label_text(self, key: tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labels, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, value in self._values.items():
+            lines.append(f"{self.name}{self._label_text(key)} {_number(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set(self, value: float, **labels: str) -> None:
+        """Copy a total that is counted elsewhere (e.g. a cache's hit count)."""
+        self._values[self._key(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(Counter):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = _BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labels)
+        self.buckets = buckets
+        # Per label set: [count per bucket (last is +Inf)..., sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for key, series in self._series.items():
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, float("inf")), series):
+                cumulative += count
+                le = 'le="' + ("+Inf" if bound == float("inf") else _number(bound)) + '"'
+                lines.append(f"{self.name}_bucket{self._label_text(key, le)} {_number(cumulative)}")
+            lines.append(f"{self.name}_sum{self._label_text(key)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{self._label_text(key)} {_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics plus callbacks that refresh externally counted values at scrape time."""
+
+    def __init__(self) -> None:
+        self._metrics: list[_Metric] = []
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Histogram:
+        return self._register(Histogram(name, help, labels))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """Call `collect` before every render."""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        for collect in self._collectors:
+            collect()
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+# ── Server Metrics ──────────────────────────────────────────────────────────
+
+class ServerMetrics:
+    """The MCP server's metrics and the hooks that record them."""
+
+    def __init__(self) -> None:
+        self.registry = registry = MetricsRegistry()
+        self.tool_calls = registry.counter(
+            "transsum_tool_calls_total", "Tool invocations by outcome.", ("tool", "status"),
+        )
+        self.tool_errors = registry.counter(
+            "transsum_tool_errors_total", "Failed tool invocations by exception type.",
+            ("tool", "error"),
+        )
+        self.tools_in_flight = registry.gauge(
+            "transsum_tools_in_flight", "Tool invocations currently running.", ("tool",),
+        )
+        self.tool_seconds = registry.histogram(
+            "transsum_tool_duration_seconds", "Wall time of tool invocations.", ("tool",),
+        )
+        self.stage_seconds = registry.histogram(
+            "transsum_pipeline_stage_seconds",
+            "Time per pipeline stage and run (queue sums waits for a MAP slot).",
+            ("stage",),
+        )
+        self.llm_seconds = registry.histogram(
+            "transsum_llm_call_duration_seconds", "Latency of model calls.",
+            ("provider", "model", "kind"),
+        )
+        self.tokens = registry.counter(
+            "transsum_tokens_total", "Tokens reported by the model.",
+            ("provider", "model", "type"),
+        )
+        self.chunks = registry.counter(
+            "transsum_chunks_total", "Chunks processed, and those reused from the MAP store.",
+            ("status",),
+        )
+        self.cache_lookups = registry.counter(
+            "transsum_response_cache_lookups_total", "Response cache lookups by result.",
+            ("result",),
+        )
+
+    @asynccontextmanager
+    async def track(self, tool: str) -> AsyncIterator[None]:
+        """Count, time and track in-flight state of one tool invocation."""
+        self.tools_in_flight.inc(tool=tool)
+        started = time.perf_counter()
+        status = "cancelled"
+        try:
+            yield
+            status = "ok"
+        except Exception as exc:
+            status = "error"
+            self.tool_errors.inc(tool=tool, error=type(exc).__name__)
+            raise
+        finally:
+            self.tools_in_flight.dec(tool=tool)
+            self.tool_calls.inc(tool=tool, status=status)
+            self.tool_seconds.observe(time.perf_counter() - started, tool=tool)
+
+    def record(self, result: PipelineResult) -> None:
+        """Record a finished pipeline run's timings, token counts and chunk reuse."""
+        timings = result.timings
+        for stage, seconds in timings.stages.items():
+            self.stage_seconds.observe(seconds, stage=stage)
+        for call in timings.calls:
+            self.llm_seconds.observe(
+                call.latency_s, kind=call.kind,
+                provider=call.provider or result.provider, model=call.model or result.model,
+            )
+        for kind, count in result.usage.items():
+            if kind.endswith("_tokens"):
+                self.tokens.inc(
+                    count, provider=result.provider, model=result.model,
+                    type=kind.removesuffix("_tokens"),
+                )
+        self.chunks.inc(result.chunks_processed - result.chunks_reused, status="mapped")
+        self.chunks.inc(result.chunks_reused, status="reused")
+
+    def record_cache(self, stats: dict) -> None:
+        """Copy a ResponseCache's hit and miss totals."""
+        self.cache_lookups.set(stats["hits"], result="hit")
+        self.cache_lookups.set(stats["misses"], result="miss")
@@ -20,32 +20,64 @@ Register in claude_desktop_config.json:
 
 import json
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
 from urllib.parse import unquote, urlparse
 
+import anyio
 from mcp.server.fastmcp import Context, FastMCP
-from mcp.types import SamplingMessage, TextContent
 from mcp.server.fastmcp.prompts.base import Message, UserMessage
+from mcp.types import SamplingMessage, TextContent
 from pydantic import Field
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
 from transsum.config import ModelProvider, get_settings
+from transsum.mcp.metrics import ServerMetrics
+from transsum.models.cache import CachingAdapter
 from transsum.models.factory import create_adapter
-from transsum.processing.loader import DocumentLoader, _FORMAT_READERS
-from transsum.processing.chunker import TextChunker
+from transsum.models.pool import AdapterPool
+from transsum.processing.loader import _FORMAT_READERS, DocumentLoader
 from transsum.processing.pipeline import ProcessingPipeline, TaskType
+from transsum.processing.text_cache import create_text_cache
 
 _settings = get_settings()
-mcp = FastMCP("transsum", log_level="ERROR", port=_settings.mcp_server_port)
+_pool = AdapterPool()
+_text_cache = create_text_cache(_settings)
+_metrics = ServerMetrics()
 
 
-async def _build_pipeline() -> tuple[ProcessingPipeline, Any]:
-    """Create a pipeline + adapter from current config."""
-    settings = get_settings()
-    adapter = create_adapter(settings)
-    chunker = TextChunker(settings.chunk_size, settings.chunk_overlap)
-    pipeline = ProcessingPipeline(adapter, chunker)
-    return pipeline, adapter
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[AdapterPool]:
+    """Give every session the process-wide adapter pool."""
+    async with _pool.lease() as pool:
+        yield pool
+
+
+mcp = FastMCP(
+    "transsum", log_level="ERROR", port=_settings.mcp_server_port, lifespan=_lifespan,
+)
+
+
+@asynccontextmanager
+async def _pipeline(ctx: Context | None) -> AsyncIterator[ProcessingPipeline]:
+    """
+    Yield a pipeline for one tool call.
+
+    Inside an MCP request the adapter comes from the shared pool and stays
+    open for the next call; without a context (direct calls) a one-off
+    adapter is created and closed afterwards.
+    """
+    pool: AdapterPool | None = ctx.request_context.lifespan_context if ctx else None
+    adapter = pool.get(_settings) if pool else create_adapter(_settings)
+    pipeline = ProcessingPipeline.from_settings(_settings, adapter)
+    try:
+        yield pipeline
+    finally:
+        await pipeline.close()
+        if pool is None:
+            await adapter.close()
 
 
 _QUALITY_SYSTEM = (
@@ -145,6 +177,7 @@ def get_config() -> str:
         "chunk_size": settings.chunk_size,
         "chunk_overlap": settings.chunk_overlap,
         "max_retries": settings.max_retries,
+        "map_concurrency": settings.map_concurrency,
         "timeout": settings.request_timeout,
         "api_key_set": settings.anthropic_api_key is not None,
     }, indent=2)
@@ -191,6 +224,7 @@ def get_config_key(key: str) -> str:
         "chunk_size": settings.chunk_size,
         "chunk_overlap": settings.chunk_overlap,
         "max_retries": settings.max_retries,
+        "map_concurrency": settings.map_concurrency,
         "timeout": settings.request_timeout,
     }
     if key not in allowed:
@@ -210,43 +244,47 @@ async def summarize_text(
 ) -> str:
     """Summarize a block of text into a concise, structured summary.
     Handles long texts automatically via intelligent chunking."""
-    pipeline, adapter = await _build_pipeline()
-    try:
-        doc = DocumentLoader.load_text(text)
-        result = await pipeline.run(doc, TaskType.SUMMARIZE, ctx=ctx)
+    async with _metrics.track("summarize_text"):
+        async with _pipeline(ctx) as pipeline:
+            doc = DocumentLoader.load_text(text)
+            result = await pipeline.run(doc, TaskType.SUMMARIZE, ctx=ctx)
+        _metrics.record(result)
         quality = await _quality_check(ctx, result.output, text)
-        return json.dumps({
-            "summary": result.output,
-            "model": result.model,
-            "provider": result.provider,
-            "chunks_processed": result.chunks_processed,
-            **quality,
-        }, indent=2, ensure_ascii=False)
-    finally:
-        await adapter.close()
+    return json.dumps({
+        "summary": result.output,
+        "model": result.model,
+        "provider": result.provider,
+        "chunks_processed": result.chunks_processed,
+        "timings": result.timings.to_dict(),
+        **quality,
+    }, indent=2, ensure_ascii=False)
 
 
 @mcp.tool()
 async def translate_text(
     text: str = Field(description="The text to translate"),
-    target_language: str = Field(default="English", description="Target language (e.g. 'English', 'Japanese')"),
+    target_language: str = Field(
+        default="English", description="Target language (e.g. 'English', 'Japanese')",
+    ),
     ctx: Context = None,
 ) -> str:
     """Translate text into a specified target language.
     Supports any language pair the underlying model handles."""
-    pipeline, adapter = await _build_pipeline()
-    try:
-        doc = DocumentLoader.load_text(text)
-        result = await pipeline.run(doc, TaskType.TRANSLATE, language=target_language, ctx=ctx)
-        return json.dumps({
-            "translation": result.output,
-            "target_language": target_language,
-            "model": result.model,
-            "provider": result.provider,
-            "chunks_processed": result.chunks_processed,
-        }, indent=2, ensure_ascii=False)
-    finally:
-        await adapter.close()
+    async with _metrics.track("translate_text"):
+        async with _pipeline(ctx) as pipeline:
+            doc = DocumentLoader.load_text(text)
+            result = await pipeline.run(
+                doc, TaskType.TRANSLATE, language=target_language, ctx=ctx,
+            )
+        _metrics.record(result)
+    return json.dumps({
+        "translation": result.output,
+        "target_language": target_language,
+        "model": result.model,
+        "provider": result.provider,
+        "chunks_processed": result.chunks_processed,
+        "timings": result.timings.to_dict(),
+    }, indent=2, ensure_ascii=False)
 
 
 @mcp.tool()
@@ -256,23 +294,51 @@ async def summarize_file(
 ) -> str:
     """Load a document file and produce a summary.
     Supports .txt, .md, .pdf, .html, .csv, .json files."""
-    pipeline, adapter = await _build_pipeline()
-    try:
+    async with _metrics.track("summarize_file"):
         await _check_roots(ctx, file_path)
-        doc = DocumentLoader.load(file_path)
-        result = await pipeline.run(doc, TaskType.SUMMARIZE, ctx=ctx)
+        # Pages are extracted off the event loop while earlier chunks are mapped
+        pages = DocumentLoader.open(
+            file_path, pdf_workers=_settings.pdf_workers, text_cache=_text_cache,
+        )
+        async with _pipeline(ctx) as pipeline:
+            result = await pipeline.run(pages, TaskType.SUMMARIZE, ctx=ctx)
+        _metrics.record(result)
+        doc = result.document
         quality = await _quality_check(ctx, result.output, doc.content)
-        return json.dumps({
-            "summary": result.output,
-            "filename": doc.filename,
-            "word_count": doc.word_count,
-            "model": result.model,
-            "provider": result.provider,
-            "chunks_processed": result.chunks_processed,
-            **quality,
-        }, indent=2, ensure_ascii=False)
-    finally:
-        await adapter.close()
+    return json.dumps({
+        "summary": result.output,
+        "filename": doc.filename,
+        "word_count": doc.word_count,
+        "model": result.model,
+        "provider": result.provider,
+        "chunks_processed": result.chunks_processed,
+        "timings": result.timings.to_dict(),
+        **quality,
+    }, indent=2, ensure_ascii=False)
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────────
+
+
+def _collect_cache_stats() -> None:
+    """Sum hit/miss totals over the pooled adapters' response caches."""
+    stats = [a.cache.stats for a in _pool.adapters if isinstance(a, CachingAdapter)]
+    if stats:
+        _metrics.record_cache({k: sum(s[k] for s in stats) for k in ("hits", "misses")})
+
+
+_metrics.registry.add_collector(_collect_cache_stats)
+
+
+async def metrics(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint (streamable-http only)."""
+    return PlainTextResponse(
+        _metrics.registry.render(), media_type="text/plain; version=0.0.4",
+    )
+
+
+if _settings.mcp_metrics:
+    mcp.custom_route("/metrics", methods=["GET"])(metrics)
 
 
 # ── Prompts ───────────────────────────────────────────────────────────────────
@@ -302,7 +368,8 @@ def translate_prompt(text: str, language: str = "English") -> list[Message]:
     return [
         UserMessage(
             content=(
-                f"Please translate the following text into {language} using the translate_text tool. "
+                f"Please translate the following text into {language} "
+                "using the translate_text tool. "
                 "Preserve the original meaning, tone, and formatting."
                 f"\n\n{text}"
             )
@@ -345,4 +412,16 @@ if __name__ == "__main__":
             file=sys.stderr,
         )
 
-    mcp.run(transport=_transport)
+    async def _serve() -> None:
+        # Hold a lease for the whole process so pooled adapters survive
+        # between sessions and are closed only on shutdown.
+        async with _pool.lease(), anyio.create_task_group() as tasks:
+            if _settings.ollama_preload:
+                # Load the model while the client connects, not on its first call
+                tasks.start_soon(_pool.get(_settings).warm_up)
+            if _transport == "streamable-http":
+                await mcp.run_streamable_http_async()
+            else:
+                await mcp.run_stdio_async()
+
+    anyio.run(_serve)
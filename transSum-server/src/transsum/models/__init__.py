@@ -1,6 +1,6 @@
 """Model adapters — unified interface over Ollama & Anthropic."""
 
-from transsum.models.base import BaseModelAdapter, ModelResponse
+from transsum.models.base import BaseModelAdapter, ModelResponse, RateLimitError
 from transsum.models.factory import create_adapter
 
-__all__ = ["BaseModelAdapter", "ModelResponse", "create_adapter"]
\ No newline at end of file
+__all__ = ["BaseModelAdapter", "ModelResponse", "RateLimitError", "create_adapter"]
\ No newline at end of file
@@ -4,6 +4,15 @@ Adapter for Anthropic's Messages API (Claude family).
 Uses the official `anthropic` Python SDK with full async support
 and native streaming via the .stream() context manager.
 
+With prompt caching enabled, the system prompt and the prompt prefix
+shared by every chunk are marked with `cache_control`, so repeat calls
+read them from Anthropic's cache (a tenth of the input price, and a
+shorter time to first token) instead of reprocessing them. Caching only
+takes effect once that prefix reaches the model's minimum cacheable
+length (1,024 tokens, 2,048 on Haiku). Shorter prefixes are sent
+unmarked, with a warning: the pipeline's own chunk instructions are far
+below the minimum, so the setting only pays off for long shared prefixes.
+
 Docs: https://docs.anthropic.com/en/api/messages
 """
 
@@ -14,13 +23,32 @@ from typing import AsyncIterator
 
 import anthropic
 
-from transsum.models.base import BaseModelAdapter, ModelResponse
+from transsum.models.base import BaseModelAdapter, ModelResponse, RateLimitError
+from transsum.models.ratelimit import RateLimitHeaders, rate_limit_headers
 
 logger = logging.getLogger(__name__)
 
+# Shortest prefix Anthropic caches, in tokens
+_CACHE_MIN_TOKENS = 1024
+_CACHE_MIN_TOKENS_HAIKU = 2048
+
 
 class AnthropicAdapter(BaseModelAdapter):
-    """Async adapter for the Anthropic Messages API."""
+    """
+    Async adapter for the Anthropic Messages API.
+
+    Args:
+        api_key:     Anthropic API key.
+        model:       Model identifier.
+        timeout:     HTTP timeout in seconds.
+        max_retries: SDK retry attempts for failed requests.
+        base_url:    Optional API endpoint (a proxy or gateway, or a
+                     local stand-in in tests).
+        prompt_cache: Mark the stable prompt prefix (`cache_prefix`)
+                     with `cache_control`.
+    """
+
+    provider = "anthropic"
 
     def __init__(
         self,
@@ -28,14 +56,111 @@ class AnthropicAdapter(BaseModelAdapter):
         model: str = "claude-sonnet-4-20250514",
         timeout: int = 120,
         max_retries: int = 3,
+        base_url: str | None = None,
+        prompt_cache: bool = False,
     ) -> None:
         self._model = model
+        self._prompt_cache = prompt_cache
+        self._cache_warned = False
         self._client = anthropic.AsyncAnthropic(
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
+            base_url=base_url,
         )
-        logger.info("AnthropicAdapter ready → model: %s", model)
+        logger.info("%s ready → model: %s", type(self).__name__, model)
+
+    def _params(
+        self,
+        prompt: str,
+        system: str,
+        temperature: float,
+        max_tokens: int,
+        cache_prefix: int = 0,
+    ) -> dict:
+        """Messages API request parameters for one prompt."""
+        content: str | list[dict] = prompt
+        prefixed = 0 < cache_prefix < len(prompt)
+        cached = len(system) + (cache_prefix if prefixed else 0)
+        if self._prompt_cache and self._cacheable(cached):
+            if prefixed:
+                # A breakpoint caches everything before it, system prompt included
+                content = [
+                    {"type": "text", "text": prompt[:cache_prefix],
+                     "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": prompt[cache_prefix:]},
+                ]
+            elif system:
+                system = [
+                    {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}},
+                ]
+
+        params: dict = {
+            "model": self._model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": content}],
+        }
+        if system:
+            params["system"] = system
+        return params
+
+    def _cacheable(self, chars: int) -> bool:
+        """
+        Whether a prefix of `chars` characters can reach the caching minimum.
+
+        Counted generously (three characters per token): marking a prefix
+        that turns out too short costs nothing, missing one costs the cache.
+        """
+        minimum = _CACHE_MIN_TOKENS_HAIKU if "haiku" in self._model else _CACHE_MIN_TOKENS
+        if chars / 3 >= minimum:
+            return True
+        if not self._cache_warned:
+            self._cache_warned = True
+            logger.warning(
+                "ANTHROPIC_PROMPT_CACHE has no effect: the shared prompt prefix "
+                "(~%d tokens) is below the %d-token minimum %s caches.",
+                chars // 4, minimum, self._model,
+            )
+        return False
+
+    def _response(self, message, headers=None) -> ModelResponse:
+        """Convert a Messages API `Message` into a ModelResponse."""
+        return ModelResponse(
+            text=message.content[0].text,
+            model=self._model,
+            provider="anthropic",
+            usage=self._usage(message.usage),
+            finish_reason=message.stop_reason,
+            rate_limits=rate_limit_headers(headers or {}),
+        )
+
+    @staticmethod
+    def _rate_limited(exc: anthropic.APIStatusError) -> RateLimitError:
+        """A 429 or 529 (overloaded) response, once the SDK's own retries ran out."""
+        headers = rate_limit_headers(exc.response.headers)
+        return RateLimitError(
+            "Anthropic rate limit reached. Wait a moment and retry.",
+            retry_after=RateLimitHeaders.parse(headers).retry_after,
+            headers=headers,
+        )
+
+    @staticmethod
+    def _usage(usage) -> dict:
+        """
+        Token counts, plus cache reads and writes when the API reports them.
+
+        `prompt_tokens` counts only the uncached part of the input.
+        """
+        counts = {
+            "prompt_tokens": usage.input_tokens,
+            "completion_tokens": usage.output_tokens,
+        }
+        if usage.cache_read_input_tokens is not None:
+            counts["cache_read_tokens"] = usage.cache_read_input_tokens
+        if usage.cache_creation_input_tokens is not None:
+            counts["cache_write_tokens"] = usage.cache_creation_input_tokens
+        return counts
 
     # ── Batch Generation ────────────────────────────────────────────────
 
@@ -46,38 +171,21 @@ class AnthropicAdapter(BaseModelAdapter):
         system: str = "",
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_prefix: int = 0,
     ) -> ModelResponse:
         """Send prompt to Anthropic and return the full response."""
-        kwargs: dict = {
-            "model": self._model,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": [{"role": "user", "content": prompt}],
-        }
-        if system:
-            kwargs["system"] = system
+        kwargs = self._params(prompt, system, temperature, max_tokens, cache_prefix)
 
         try:
-            message = await self._client.messages.create(**kwargs)
+            raw = await self._client.messages.with_raw_response.create(**kwargs)
         except anthropic.AuthenticationError:
             raise RuntimeError(
                 "Anthropic authentication failed. Check your ANTHROPIC_API_KEY."
             )
-        except anthropic.RateLimitError:
-            raise RuntimeError(
-                "Anthropic rate limit reached. Wait a moment and retry."
-            )
+        except (anthropic.RateLimitError, anthropic.OverloadedError) as exc:
+            raise self._rate_limited(exc) from exc
 
-        return ModelResponse(
-            text=message.content[0].text,
-            model=self._model,
-            provider="anthropic",
-            usage={
-                "prompt_tokens": message.usage.input_tokens,
-                "completion_tokens": message.usage.output_tokens,
-            },
-            finish_reason=message.stop_reason,
-        )
+        return self._response(raw.parse(), raw.headers)
 
     # ── Streaming ───────────────────────────────────────────────────────
 
@@ -88,20 +196,17 @@ class AnthropicAdapter(BaseModelAdapter):
         system: str = "",
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_prefix: int = 0,
     ) -> AsyncIterator[str]:
         """Stream response tokens one at a time."""
-        kwargs: dict = {
-            "model": self._model,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "messages": [{"role": "user", "content": prompt}],
-        }
-        if system:
-            kwargs["system"] = system
+        kwargs = self._params(prompt, system, temperature, max_tokens, cache_prefix)
 
-        async with self._client.messages.stream(**kwargs) as stream:
-            async for text in stream.text_stream:
-                yield text
+        try:
+            async with self._client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except (anthropic.RateLimitError, anthropic.OverloadedError) as exc:
+            raise self._rate_limited(exc) from exc
 
     # ── Cleanup ─────────────────────────────────────────────────────────
 
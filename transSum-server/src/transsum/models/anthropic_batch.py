@@ -0,0 +1,248 @@
+"""
+Adapter for Anthropic's Message Batches API.
+
+Batches are processed asynchronously (usually within the hour, at most
+24 hours) at half the price of the Messages API and under separate rate
+limits — the right trade for overnight corpus runs, where throughput and
+cost matter and latency does not.
+
+The pipeline needs no batch-specific code. `generate()` queues its
+request and waits; once no new request has arrived for
+`ANTHROPIC_BATCH_WINDOW` seconds (or the queue is full) everything
+queued is submitted as one batch, polled until it ends, and each waiting
+call resumes with its own result. A batch run of many documents thus
+sends every MAP prompt in one batch, then the reduce prompts in the
+next, as the pipelines reach that stage.
+
+Docs: https://docs.anthropic.com/en/docs/build-with-claude/batch-processing
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import anthropic
+
+from transsum.models.anthropic_adapter import AnthropicAdapter
+from transsum.models.base import ModelResponse
+
+logger = logging.getLogger(__name__)
+
+# Per-request failures worth resubmitting in a later batch
+_RETRYABLE_ERRORS = {"api_error", "overloaded_error", "rate_limit_error"}
+
+
+@dataclass(eq=False)
+class _Request:
+    custom_id: str
+    params: dict
+    future: asyncio.Future
+    attempts: int = 0
+
+
+class AnthropicBatchAdapter(AnthropicAdapter):
+    """
+    Anthropic adapter that sends requests through Message Batches.
+
+    Args:
+        api_key:       Anthropic API key.
+        model:         Model identifier.
+        timeout:       HTTP timeout in seconds.
+        max_retries:   SDK retries per HTTP call; also how many times an
+                       expired or transiently failed request is
+                       resubmitted in a later batch.
+        window:        Seconds without a new request before the queue is
+                       submitted.
+        poll_interval: Seconds between batch status checks.
+        max_requests:  Requests per batch.
+        base_url:      Optional API endpoint.
+        prompt_cache:  Mark the stable prompt prefix with `cache_control`
+                       (best effort within a batch).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-sonnet-4-20250514",
+        timeout: int = 120,
+        max_retries: int = 3,
+        *,
+        window: float = 5.0,
+        poll_interval: float = 30.0,
+        max_requests: int = 10000,
+        base_url: str | None = None,
+        prompt_cache: bool = False,
+    ) -> None:
+        super().__init__(
+            api_key, model, timeout, max_retries,
+            base_url=base_url, prompt_cache=prompt_cache,
+        )
+        self._window = window
+        self._poll_interval = poll_interval
+        self._max_requests = max_requests
+        self._max_attempts = max_retries
+        self._ids = itertools.count()
+        self._queue: list[_Request] = []
+        self._last_queued = 0.0
+        self._flusher: asyncio.Task | None = None
+        self._batches: set[asyncio.Task] = set()
+        self._submitted: set[_Request] = set()     # sent, not yet answered
+        self.batches_submitted = 0
+
+    # ── Generation ──────────────────────────────────────────────────────
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> ModelResponse:
+        """Queue the prompt for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        request = _Request(
+            custom_id=f"req-{next(self._ids)}",
+            params=self._params(prompt, system, temperature, max_tokens, cache_prefix),
+            future=loop.create_future(),
+        )
+        self._enqueue(request)
+        return await request.future
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> AsyncIterator[str]:
+        """Batches don't stream: the whole response arrives as one piece."""
+        resp = await self.generate(
+            prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+            cache_prefix=cache_prefix,
+        )
+        yield resp.text
+
+    # ── Batching ────────────────────────────────────────────────────────
+
+    def _enqueue(self, request: _Request) -> None:
+        self._queue.append(request)
+        self._last_queued = asyncio.get_running_loop().time()
+        if len(self._queue) >= self._max_requests:
+            self._submit()
+        elif self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_when_idle())
+
+    async def _flush_when_idle(self) -> None:
+        """Submit the queue once no request has arrived for `window` seconds."""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._queue:
+                delay = self._last_queued + self._window - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    self._submit()
+        finally:
+            self._flusher = None
+
+    def _submit(self) -> None:
+        requests = self._queue[:self._max_requests]
+        del self._queue[:self._max_requests]
+        self._submitted.update(requests)
+        task = asyncio.create_task(self._run_batch(requests))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, requests: list[_Request]) -> None:
+        """Submit one batch, wait for it to end and deliver its results."""
+        pending = {r.custom_id: r for r in requests}
+        error = RuntimeError("Request missing from batch results.")
+        try:
+            batches = self._client.messages.batches
+            batch = await batches.create(requests=[
+                {"custom_id": r.custom_id, "params": r.params} for r in requests
+            ])
+            self.batches_submitted += 1
+            logger.info("Submitted message batch %s (%d requests)", batch.id, len(requests))
+
+            while batch.processing_status != "ended":
+                await asyncio.sleep(self._poll_interval)
+                if all(r.future.done() for r in requests):
+                    # Every caller gave up (e.g. its pipeline failed)
+                    await batches.cancel(batch.id)
+                    logger.info("Cancelled message batch %s: no callers left", batch.id)
+                    return
+                batch = await batches.retrieve(batch.id)
+
+            counts = batch.request_counts
+            logger.info(
+                "Message batch %s ended: %d succeeded, %d errored, %d expired",
+                batch.id, counts.succeeded, counts.errored, counts.expired,
+            )
+            async for entry in await batches.results(batch.id):
+                request = pending.pop(entry.custom_id, None)
+                if request is not None and not request.future.done():
+                    self._deliver(request, entry.result)
+        except anthropic.AuthenticationError:
+            error = RuntimeError("Anthropic authentication failed. Check your ANTHROPIC_API_KEY.")
+        except asyncio.CancelledError:
+            error = RuntimeError("Adapter closed before the batch finished.")
+            raise
+        except Exception as exc:
+            error = RuntimeError(f"Anthropic message batch failed: {exc}")
+        finally:
+            # Whatever the batch didn't answer must not leave a caller waiting
+            self._fail(pending.values(), error)
+            self._submitted.difference_update(requests)
+
+    def _deliver(self, request: _Request, result) -> None:
+        """Resolve one request from its batch result, or queue a retry."""
+        if result.type == "succeeded":
+            request.future.set_result(self._response(result.message))
+            return
+
+        if result.type == "errored":
+            error = result.error.error
+            retryable = error.type in _RETRYABLE_ERRORS
+            reason = f"{error.type}: {error.message}"
+        else:                                   # "expired" or "canceled"
+            retryable = result.type == "expired"
+            reason = result.type
+
+        request.attempts += 1
+        if retryable and request.attempts <= self._max_attempts:
+            logger.warning("Batch request %s %s; resubmitting", request.custom_id, reason)
+            self._enqueue(request)
+        else:
+            request.future.set_exception(
+                RuntimeError(f"Anthropic batch request failed ({reason}).")
+            )
+
+    @staticmethod
+    def _fail(requests, exc: Exception) -> None:
+        for request in requests:
+            if not request.future.done():
+                request.future.set_exception(exc)
+
+    # ── Cleanup ─────────────────────────────────────────────────────────
+
+    async def close(self) -> None:
+        """Stop waiting on batches, fail queued and submitted calls, close the client."""
+        tasks = [t for t in (self._flusher, *self._batches) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # A batch task cancelled before it started never ran its cleanup
+        self._fail(self._submitted, RuntimeError("Adapter closed before the batch finished."))
+        self._submitted.clear()
+        self._fail(self._queue, RuntimeError("Adapter closed before the batch was sent."))
+        self._queue.clear()
+        await super().close()
@@ -9,8 +9,9 @@ and a one-line addition to the factory.
 from __future__ import annotations
 
 import abc
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Optional
 
 
 @dataclass
@@ -24,12 +25,58 @@ class ModelResponse:
         provider:       Which backend was used ("ollama" / "anthropic").
         usage:          Token counts — {"prompt_tokens": N, "completion_tokens": N}.
         finish_reason:  Why generation stopped (e.g. "stop", "length").
+        rate_limits:    Rate-limit headers the provider sent with the
+                        response (lower-case names), if any.
     """
     text: str
     model: str
     provider: str
     usage: dict = field(default_factory=dict)
-    finish_reason: Optional[str] = None
+    finish_reason: str | None = None
+    rate_limits: dict = field(default_factory=dict)
+
+
+def add_usage(total: dict, usage: dict) -> None:
+    """
+    Accumulate a response's `usage` into `total`.
+
+    Token counts add up. `load_ms` keeps the longest value instead:
+    calls that wait on the same model load overlap, so their load times
+    describe one wait, not several.
+    """
+    for key, value in usage.items():
+        if key == "load_ms":
+            total[key] = max(total.get(key, 0), value)
+        else:
+            total[key] = total.get(key, 0) + value
+
+
+# Adapters that choose a backend per call (the router) set this to the
+# (provider, model) that served a stream, since a stream returns only text.
+# Set from within the stream, it is visible to the task consuming it.
+streamed_by: ContextVar[tuple[str, str] | None] = ContextVar("streamed_by", default=None)
+
+
+class RateLimitError(RuntimeError):
+    """
+    The provider rejected a request for exceeding a rate limit (or for
+    being overloaded) and it may succeed if sent again later.
+
+    Attributes:
+        retry_after: Seconds the provider asked callers to wait, if it said.
+        headers:     Rate-limit headers of the rejected response.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        retry_after: float | None = None,
+        headers: dict | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.headers = headers or {}
 
 
 class BaseModelAdapter(abc.ABC):
@@ -37,9 +84,22 @@ class BaseModelAdapter(abc.ABC):
     Contract for LLM adapters.
 
     Every concrete adapter (Ollama, Anthropic, future providers)
-    must implement these three methods.
+    must implement the three abstract methods, set `provider`, and store its
+    model identifier in `self._model`.
+
+    `cache_prefix` is the length of the leading part of `prompt` that
+    is identical across many calls (task instructions shared by every
+    chunk). Adapters whose backend supports explicit prompt caching may
+    mark that prefix; others ignore it — the prompt is always complete.
     """
 
+    provider: str = "unknown"
+
+    @property
+    def model(self) -> str:
+        """Identifier of the model this adapter talks to."""
+        return self._model
+
     @abc.abstractmethod
     async def generate(
         self,
@@ -48,6 +108,7 @@ class BaseModelAdapter(abc.ABC):
         system: str = "",
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_prefix: int = 0,
     ) -> ModelResponse:
         """Send a single prompt and return the complete response."""
 
@@ -59,9 +120,16 @@ class BaseModelAdapter(abc.ABC):
         system: str = "",
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_prefix: int = 0,
     ) -> AsyncIterator[str]:
         """Yield response tokens incrementally as they arrive."""
 
+    async def warm_up(self) -> None:
+        """
+        Prepare the backend ahead of the first call (e.g. load the model
+        into memory). Best effort and a no-op by default.
+        """
+
     @abc.abstractmethod
     async def close(self) -> None:
         """Release held resources (HTTP connections, etc.)."""
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""
+Persistent, content-addressed cache for LLM responses.
+
+`CachingAdapter` wraps any BaseModelAdapter and answers repeat requests
+from a local SQLite file instead of calling the backend. Entries are
+keyed by a SHA-256 of everything that influences the output (provider,
+model, system prompt, prompt, temperature, max_tokens), so re-running a
+job on unchanged input costs nothing.
+
+The store is bounded: entries older than the TTL are ignored and purged,
+and when the total cached text exceeds the size cap the least recently
+used entries are evicted. Every lookup commits (a hit updates its last
+access), so `CachingAdapter` runs them in a worker thread, never on the
+event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from transsum.models.base import BaseModelAdapter, ModelResponse, streamed_by
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key           TEXT PRIMARY KEY,
+    text          TEXT NOT NULL,
+    model         TEXT NOT NULL,
+    provider      TEXT NOT NULL,
+    finish_reason TEXT,
+    size          INTEGER NOT NULL,
+    created_at    REAL NOT NULL,
+    last_access   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed LRU store of model responses.
+
+    Methods may be called from any thread, one at a time under a lock.
+
+    Args:
+        path:      Database file (parent directories are created).
+        max_bytes: Cap on the total size of cached text.
+        ttl:       Seconds an entry stays valid; 0 means never expire.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int, ttl: int = 0) -> None:
+        self._path = Path(path).expanduser()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from worker threads, one at a time under `_lock`
+        self._db = sqlite3.connect(self._path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.executescript(_SCHEMA)
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Hash every input that can change the model's answer."""
+        payload = json.dumps(
+            [provider, model, system, prompt, temperature, max_tokens],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> ModelResponse | None:
+        """Return the cached response for `key`, or None on a miss."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key: str) -> ModelResponse | None:
+        row = self._db.execute(
+            "SELECT text, model, provider, finish_reason, created_at "
+            "FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        now = time.time()
+        if row is None or (self._ttl and now - row[4] > self._ttl):
+            if row is not None:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+            self.misses += 1
+            return None
+
+        self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        self.hits += 1
+        text, model, provider, finish_reason, _ = row
+        # A hit sends nothing to the backend, so it reports no token usage
+        return ModelResponse(
+            text=text, model=model, provider=provider, finish_reason=finish_reason,
+        )
+
+    def put(self, key: str, response: ModelResponse) -> None:
+        """Store `response` under `key`, evicting LRU entries if over the cap."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, response.text, response.model, response.provider,
+                    response.finish_reason, len(response.text.encode("utf-8")), now, now,
+                ),
+            )
+            self._evict(now)
+            self._db.commit()
+
+    def _evict(self, now: float) -> None:
+        if self._ttl:
+            self._db.execute("DELETE FROM responses WHERE created_at < ?", (now - self._ttl,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        )
+        doomed: list[tuple[str]] = []
+        for key, size in rows:
+            if total <= self._max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+        logger.debug("Response cache evicted %d entries", len(doomed))
+
+    @property
+    def stats(self) -> dict:
+        """Hit / miss / eviction counters and current entry count."""
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class CachingAdapter(BaseModelAdapter):
+    """
+    Adapter wrapper that serves repeat requests from a ResponseCache.
+
+    Streams are cached too: a hit replays the stored text as one piece,
+    and a miss is recorded once the stream has finished, attributed to
+    the backend that served it (see `streamed_by`). Cache reads and
+    writes run in a worker thread.
+    """
+
+    def __init__(self, inner: BaseModelAdapter, cache: ResponseCache) -> None:
+        self._inner = inner
+        self._cache = cache
+
+    @property
+    def provider(self) -> str:
+        return self._inner.provider
+
+    @property
+    def model(self) -> str:
+        return self._inner.model
+
+    @property
+    def cache(self) -> ResponseCache:
+        return self._cache
+
+    def _key(self, prompt: str, system: str, temperature: float, max_tokens: int) -> str:
+        return ResponseCache.make_key(
+            self.provider, self.model, system, prompt, temperature, max_tokens,
+        )
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> ModelResponse:
+        """Return a cached response, or call the backend and cache its answer."""
+        key = self._key(prompt, system, temperature, max_tokens)
+        cached = await asyncio.to_thread(self._cache.get, key)
+        if cached is not None:
+            return cached
+
+        resp = await self._inner.generate(
+            prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+            cache_prefix=cache_prefix,
+        )
+        await asyncio.to_thread(self._cache.put, key, resp)
+        return resp
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> AsyncIterator[str]:
+        """Replay a cached response, or stream from the backend and cache it."""
+        key = self._key(prompt, system, temperature, max_tokens)
+        cached = await asyncio.to_thread(self._cache.get, key)
+        if cached is not None:
+            streamed_by.set((cached.provider, cached.model))
+            yield cached.text
+            return
+
+        streamed_by.set(None)
+        pieces: list[str] = []
+        async for token in self._inner.stream(
+            prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+            cache_prefix=cache_prefix,
+        ):
+            pieces.append(token)
+            yield token
+        # A router behind this adapter records which backend it used
+        provider, model = streamed_by.get() or (self.provider, self.model)
+        await asyncio.to_thread(self._cache.put, key, ModelResponse(
+            text="".join(pieces), model=model, provider=provider,
+        ))
+
+    async def warm_up(self) -> None:
+        """Warm up the wrapped adapter."""
+        await self._inner.warm_up()
+
+    async def close(self) -> None:
+        """Close the wrapped adapter and the cache database."""
+        logger.info(
+            "Response cache: %d hits, %d misses, %d evictions",
+            self._cache.hits, self._cache.misses, self._cache.evictions,
+        )
+        await self._inner.close()
+        self._cache.close()
@@ -16,6 +16,12 @@ def create_adapter(settings: Settings) -> BaseModelAdapter:
     """
     Instantiate the correct adapter based on current configuration.
 
+    With FALLBACK_PROVIDERS, one adapter is built per provider and a
+    RouterAdapter fails over (and optionally hedges) across them. When
+    RATE_LIMIT_RPM or RATE_LIMIT_TPM is set, each provider's adapter is
+    wrapped in a RateLimitedAdapter; when CACHE_ENABLED is set, the whole
+    is wrapped in a CachingAdapter, so cache hits cost no quota.
+
     Args:
         settings: Validated application settings.
 
@@ -25,7 +31,65 @@ def create_adapter(settings: Settings) -> BaseModelAdapter:
     Raises:
         ValueError: If the provider name is not recognised.
     """
-    if settings.model_provider == ModelProvider.OLLAMA:
+    providers = [settings.model_provider]
+    providers += [p for p in settings.fallback_providers.split(",") if p]
+    backends = [_rate_limited(_create_backend(settings, p), settings, p) for p in providers]
+
+    if len(backends) == 1:
+        adapter = backends[0]
+    else:
+        from transsum.models.router import RouterAdapter
+
+        adapter = RouterAdapter(
+            backends,
+            timeout=settings.failover_timeout or None,
+            hedge=settings.hedge_requests,
+            hedge_after=settings.hedge_after or None,
+        )
+
+    if settings.cache_enabled:
+        from transsum.models.cache import CachingAdapter, ResponseCache
+
+        adapter = CachingAdapter(adapter, ResponseCache(
+            settings.cache_path,
+            max_bytes=settings.cache_max_mb * 1024 * 1024,
+            ttl=settings.cache_ttl,
+        ))
+
+    return adapter
+
+
+def _rate_limited(
+    adapter: BaseModelAdapter,
+    settings: Settings,
+    provider: str,
+) -> BaseModelAdapter:
+    """Wrap `adapter` in a RateLimitedAdapter when limits are configured."""
+    # Message Batches have their own, much larger limits
+    batched = provider == ModelProvider.ANTHROPIC and settings.anthropic_batch
+    if not (settings.rate_limit_rpm or settings.rate_limit_tpm) or batched:
+        return adapter
+
+    from transsum.models.ratelimit import RateLimitedAdapter, RateLimiter
+    from transsum.processing.tokens import create_estimator
+
+    return RateLimitedAdapter(
+        adapter,
+        RateLimiter(
+            settings.rate_limit_rpm, settings.rate_limit_tpm,
+            state_path=settings.rate_limit_state or None,
+            key=f"{adapter.provider}/{adapter.model}",
+        ),
+        # The backends retry rate-limited calls themselves; retrying here
+        # as well would multiply the attempts
+        max_retries=1,
+        estimate=create_estimator(settings).count,
+    )
+
+
+def _create_backend(settings: Settings, provider: str) -> BaseModelAdapter:
+    """Build the adapter for one provider, without any wrappers."""
+    if provider == ModelProvider.OLLAMA:
         from transsum.models.ollama import OllamaAdapter
 
         return OllamaAdapter(
@@ -33,9 +97,24 @@ def create_adapter(settings: Settings) -> BaseModelAdapter:
             model=settings.ollama_model,
             timeout=settings.request_timeout,
             max_retries=settings.max_retries,
+            keep_alive=settings.ollama_keep_alive,
+        )
+
+    if provider == ModelProvider.ANTHROPIC and settings.anthropic_batch:
+        from transsum.models.anthropic_batch import AnthropicBatchAdapter
+
+        return AnthropicBatchAdapter(
+            api_key=settings.anthropic_api_key,
+            model=settings.anthropic_model,
+            timeout=settings.request_timeout,
+            max_retries=settings.max_retries,
+            window=settings.anthropic_batch_window,
+            poll_interval=settings.anthropic_batch_poll,
+            max_requests=settings.anthropic_batch_max_requests,
+            prompt_cache=settings.anthropic_prompt_cache,
         )
 
-    if settings.model_provider == ModelProvider.ANTHROPIC:
+    if provider == ModelProvider.ANTHROPIC:
         from transsum.models.anthropic_adapter import AnthropicAdapter
 
         return AnthropicAdapter(
@@ -43,6 +122,7 @@ def create_adapter(settings: Settings) -> BaseModelAdapter:
             model=settings.anthropic_model,
             timeout=settings.request_timeout,
             max_retries=settings.max_retries,
+            prompt_cache=settings.anthropic_prompt_cache,
         )
 
-    raise ValueError(f"Unknown model provider: {settings.model_provider!r}")
\ No newline at end of file
+    raise ValueError(f"Unknown model provider: {provider!r}")
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Global limit on model calls in flight.
+
+The pipeline's MAP semaphore bounds the calls made for one document.
+When many documents share one adapter (CLI batch mode), the total load
+on the backend is the sum of those bounds; `ConcurrencyLimitedAdapter`
+caps it across every caller instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from transsum.models.base import BaseModelAdapter, ModelResponse
+
+
+class ConcurrencyLimitedAdapter(BaseModelAdapter):
+    """
+    Adapter wrapper that allows at most `limit` calls in flight.
+
+    A streamed call holds its slot until the stream is exhausted or closed.
+
+    Args:
+        inner: Adapter to forward calls to.
+        limit: Maximum concurrent generate/stream calls.
+    """
+
+    def __init__(self, inner: BaseModelAdapter, limit: int) -> None:
+        if limit < 1:
+            raise ValueError(f"limit must be >= 1 (got {limit}).")
+        self._inner = inner
+        self._slots = asyncio.Semaphore(limit)
+        self._limit = limit
+        self.in_flight = 0
+
+    @property
+    def provider(self) -> str:
+        return self._inner.provider
+
+    @property
+    def model(self) -> str:
+        return self._inner.model
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> ModelResponse:
+        """Wait for a free slot, then forward the call."""
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                return await self._inner.generate(
+                    prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+                    cache_prefix=cache_prefix,
+                )
+            finally:
+                self.in_flight -= 1
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> AsyncIterator[str]:
+        """Wait for a free slot, then stream from the wrapped adapter."""
+        async with self._slots:
+            self.in_flight += 1
+            try:
+                async for token in self._inner.stream(
+                    prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+                    cache_prefix=cache_prefix,
+                ):
+                    yield token
+            finally:
+                self.in_flight -= 1
+
+    async def warm_up(self) -> None:
+        """Warm up the wrapped adapter."""
+        await self._inner.warm_up()
+
+    async def close(self) -> None:
+        """Close the wrapped adapter."""
+        await self._inner.close()
@@ -2,26 +2,53 @@
 Adapter for locally-running Ollama servers.
 
 Communicates over HTTP using the /api/chat endpoint.
-Supports both batch (full response) and streaming modes.
+Supports both batch (full response) and streaming modes. Failed
+requests are retried after a jittered exponential backoff.
+
+Loading a model into memory takes seconds to tens of seconds, and Ollama
+unloads an idle model after five minutes by default. The adapter sends
+`keep_alive` with every request so the model stays resident between
+documents, and `warm_up()` loads it ahead of the first request.
 
 Ollama API docs: https://github.com/ollama/ollama/blob/main/docs/api.md
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
+import time
 from typing import AsyncIterator
 
 import httpx
 
-from transsum.models.base import BaseModelAdapter, ModelResponse
+from transsum.models.base import BaseModelAdapter, ModelResponse, RateLimitError
+from transsum.models.ratelimit import RateLimitHeaders, backoff_delay, rate_limit_headers
 
 logger = logging.getLogger(__name__)
 
+# A warm model still reports a `load_duration` of a few milliseconds;
+# anything shorter than this was not a load from disk
+_COLD_LOAD_MS = 500
+
 
 class OllamaAdapter(BaseModelAdapter):
-    """Async adapter for Ollama's local chat API."""
+    """
+    Async adapter for Ollama's local chat API.
+
+    Args:
+        base_url:    Ollama server URL.
+        model:       Model tag.
+        timeout:     HTTP timeout in seconds.
+        max_retries: Attempts per generate call.
+        keep_alive:  How long Ollama keeps the model loaded after each
+                     request — a duration ("30m", "1h"), seconds, or -1
+                     for indefinitely. None leaves the server default.
+    """
+
+    provider = "ollama"
 
     def __init__(
         self,
@@ -29,10 +56,15 @@ class OllamaAdapter(BaseModelAdapter):
         model: str = "llama3.1",
         timeout: int = 120,
         max_retries: int = 3,
+        *,
+        keep_alive: str | int | None = None,
     ) -> None:
         self._base_url = base_url.rstrip("/")
         self._model = model
         self._max_retries = max_retries
+        if isinstance(keep_alive, str) and re.fullmatch(r"-?\d+", keep_alive):
+            keep_alive = int(keep_alive)    # Ollama reads bare numbers as seconds
+        self._keep_alive = keep_alive
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(timeout),
@@ -51,18 +83,15 @@ class OllamaAdapter(BaseModelAdapter):
         system: str = "",
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_prefix: int = 0,
     ) -> ModelResponse:
-        """Send prompt to Ollama and return the full response."""
-        messages = self._build_messages(prompt, system)
-        payload = {
-            "model": self._model,
-            "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
+        """
+        Send prompt to Ollama and return the full response.
+
+        `cache_prefix` needs no handling: Ollama reuses its KV cache for
+        a prompt prefix it has just processed.
+        """
+        payload = self._payload(prompt, system, temperature, max_tokens, stream=False)
 
         last_error: Exception | None = None
         for attempt in range(1, self._max_retries + 1):
@@ -75,11 +104,9 @@ class OllamaAdapter(BaseModelAdapter):
                     text=data["message"]["content"],
                     model=self._model,
                     provider="ollama",
-                    usage={
-                        "prompt_tokens": data.get("prompt_eval_count", 0),
-                        "completion_tokens": data.get("eval_count", 0),
-                    },
+                    usage=self._usage(data),
                     finish_reason=data.get("done_reason"),
+                    rate_limits=rate_limit_headers(resp.headers),
                 )
 
             except httpx.ConnectError as exc:
@@ -101,9 +128,16 @@ class OllamaAdapter(BaseModelAdapter):
                     "Ollama timeout (attempt %d/%d)", attempt, self._max_retries,
                 )
 
-        raise RuntimeError(
-            f"Ollama request failed after {self._max_retries} attempts: {last_error}"
-        ) from last_error
+            if attempt < self._max_retries:
+                await asyncio.sleep(backoff_delay(attempt, _retry_after(last_error)))
+
+        message = f"Ollama request failed after {self._max_retries} attempts: {last_error}"
+        if _is_busy(last_error):
+            headers = rate_limit_headers(last_error.response.headers)
+            raise RateLimitError(
+                message, retry_after=_retry_after(last_error), headers=headers,
+            ) from last_error
+        raise RuntimeError(message) from last_error
 
     # ── Streaming ───────────────────────────────────────────────────────
 
@@ -114,18 +148,10 @@ class OllamaAdapter(BaseModelAdapter):
         system: str = "",
         temperature: float = 0.3,
         max_tokens: int = 4096,
+        cache_prefix: int = 0,
     ) -> AsyncIterator[str]:
         """Stream response tokens one at a time."""
-        messages = self._build_messages(prompt, system)
-        payload = {
-            "model": self._model,
-            "messages": messages,
-            "stream": True,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }
+        payload = self._payload(prompt, system, temperature, max_tokens, stream=True)
 
         async with self._client.stream("POST", "/api/chat", json=payload) as resp:
             resp.raise_for_status()
@@ -137,8 +163,86 @@ class OllamaAdapter(BaseModelAdapter):
                 if token:
                     yield token
 
+    # ── Model Lifecycle ─────────────────────────────────────────────────
+
+    async def is_loaded(self) -> bool:
+        """Whether the model is currently in memory, per `/api/ps`."""
+        resp = await self._client.get("/api/ps")
+        resp.raise_for_status()
+        wanted = _with_tag(self._model)
+        return any(
+            _with_tag(entry.get("model") or entry.get("name", "")) == wanted
+            for entry in resp.json().get("models", [])
+        )
+
+    async def warm_up(self) -> None:
+        """
+        Load the model now, unless `/api/ps` shows it is already loaded.
+
+        A request without a prompt makes Ollama load the model and apply
+        `keep_alive` without generating anything. Failures are logged,
+        not raised: the model then simply loads on the first request.
+        """
+        try:
+            if await self.is_loaded():
+                logger.info("Ollama model %s already loaded", self._model)
+                return
+            start = time.perf_counter()
+            payload: dict = {"model": self._model}
+            if self._keep_alive is not None:
+                payload["keep_alive"] = self._keep_alive
+            resp = await self._client.post("/api/generate", json=payload)
+            resp.raise_for_status()
+        except httpx.HTTPError as exc:
+            logger.warning("Ollama warm-up of %s failed: %s", self._model, exc)
+            return
+        load_ns = resp.json().get("load_duration")
+        seconds = load_ns / 1e9 if load_ns else time.perf_counter() - start
+        logger.info("Ollama model %s loaded in %.1fs", self._model, seconds)
+
     # ── Helpers ─────────────────────────────────────────────────────────
 
+    def _payload(
+        self,
+        prompt: str,
+        system: str,
+        temperature: float,
+        max_tokens: int,
+        *,
+        stream: bool,
+    ) -> dict:
+        """Request body for `/api/chat`."""
+        payload = {
+            "model": self._model,
+            "messages": self._build_messages(prompt, system),
+            "stream": stream,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        }
+        if self._keep_alive is not None:
+            payload["keep_alive"] = self._keep_alive
+        return payload
+
+    @staticmethod
+    def _usage(data: dict) -> dict:
+        """
+        Token counts from a chat response, plus `load_ms` when the
+        request had to wait for the model to be loaded into memory.
+
+        Ollama reports a `load_duration` of a few milliseconds even for
+        a model that is already loaded; only a cold load counts.
+        """
+        usage = {
+            "prompt_tokens": data.get("prompt_eval_count", 0),
+            "completion_tokens": data.get("eval_count", 0),
+        }
+        load_ms = data.get("load_duration", 0) // 1_000_000
+        if load_ms >= _COLD_LOAD_MS:
+            usage["load_ms"] = load_ms
+        return usage
+
     @staticmethod
     def _build_messages(prompt: str, system: str) -> list[dict]:
         """Construct the messages array for Ollama's chat API."""
@@ -151,4 +255,23 @@ class OllamaAdapter(BaseModelAdapter):
     async def close(self) -> None:
         """Shut down the underlying HTTP client."""
         await self._client.aclose()
-        logger.debug("OllamaAdapter closed.")
\ No newline at end of file
+        logger.debug("OllamaAdapter closed.")
+
+
+def _with_tag(name: str) -> str:
+    """`llama3.1` → `llama3.1:latest`, as `/api/ps` reports it."""
+    return name if ":" in name.rsplit("/", 1)[-1] else f"{name}:latest"
+
+
+def _is_busy(exc: Exception | None) -> bool:
+    """429 from a gateway, or 503 from Ollama when its request queue is full."""
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in (429, 503)
+    )
+
+
+def _retry_after(exc: Exception | None) -> float | None:
+    if not _is_busy(exc):
+        return None
+    return RateLimitHeaders.parse(exc.response.headers).retry_after
@@ -0,0 +1,75 @@
+"""
+Long-lived adapter pool for servers.
+
+Building an adapter opens a fresh HTTP client (httpx or the Anthropic
+SDK), so creating and closing one per request throws away pooled
+TCP/TLS connections and keep-alive. `AdapterPool` keeps one adapter per
+distinct configuration and hands the same instance to every caller.
+
+Lifetime is lease-based: each user (an MCP session, the server process)
+holds a lease while it runs, and the adapters are closed when the last
+lease is released.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from transsum.config import Settings
+from transsum.models.base import BaseModelAdapter
+from transsum.models.factory import create_adapter
+
+logger = logging.getLogger(__name__)
+
+
+class AdapterPool:
+    """Shares one adapter per configuration across many requests."""
+
+    def __init__(self) -> None:
+        self._adapters: dict[str, BaseModelAdapter] = {}
+        self._leases = 0
+
+    @staticmethod
+    def key_for(settings: Settings) -> str:
+        """Fingerprint of the configuration an adapter is built from."""
+        return hashlib.sha256(settings.model_dump_json().encode("utf-8")).hexdigest()
+
+    @property
+    def adapters(self) -> list[BaseModelAdapter]:
+        """The adapters currently pooled."""
+        return list(self._adapters.values())
+
+    def get(self, settings: Settings) -> BaseModelAdapter:
+        """Return the pooled adapter for `settings`, creating it on first use."""
+        key = self.key_for(settings)
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            adapter = create_adapter(settings)
+            self._adapters[key] = adapter
+            logger.info(
+                "Adapter pool: new %s adapter (%d pooled)",
+                adapter.provider, len(self._adapters),
+            )
+        return adapter
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[AdapterPool]:
+        """Keep the pool open while the block runs; close it after the last lease."""
+        self._leases += 1
+        try:
+            yield self
+        finally:
+            self._leases -= 1
+            if self._leases == 0:
+                await self.close()
+
+    async def close(self) -> None:
+        """Close every pooled adapter."""
+        adapters, self._adapters = list(self._adapters.values()), {}
+        for adapter in adapters:
+            await adapter.close()
+        if adapters:
+            logger.info("Adapter pool closed (%d adapters)", len(adapters))
@@ -0,0 +1,485 @@
+"""
+Client-side rate limiting shared by every adapter.
+
+Providers enforce requests-per-minute and tokens-per-minute quotas and
+answer anything over them with HTTP 429. With MAP calls running in
+parallel, ignoring that turns one rejection into a burst of them.
+`RateLimitedAdapter` wraps any adapter and
+
+  - waits on a `RateLimiter` — token buckets for requests and tokens per
+    minute — before each call;
+  - corrects the token bucket with the usage each response reports, and
+    with the provider's own rate-limit headers when it sends them;
+  - on a `RateLimitError`, pauses every caller of the limiter for the
+    provider's `retry-after` (or a jittered exponential backoff) and
+    retries.
+
+Several processes sharing one API key can share one quota: give their
+limiters the same SQLite state file and the buckets live there, updated
+under SQLite's write lock, instead of in each process. The lock is
+taken in a worker thread, so waiting for it never blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import TypeVar
+
+from transsum.models.base import BaseModelAdapter, ModelResponse, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_BACKOFF_BASE = 1.0     # seconds before the first retry (before jitter)
+_BACKOFF_CAP = 60.0
+
+_DURATION = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|s|m|h))+")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+# ── Backoff ─────────────────────────────────────────────────────────────────
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (1-based).
+
+    The provider's `retry-after` wins when given; a little jitter is
+    added so that callers told the same time don't all return at once.
+    Otherwise the delay doubles per attempt up to a cap, and a random
+    half of it is jitter.
+    """
+    if retry_after is not None:
+        return retry_after + random.uniform(0, _BACKOFF_BASE)
+    delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+# ── Headers ─────────────────────────────────────────────────────────────────
+
+@dataclass
+class RateLimitHeaders:
+    """
+    What a provider's response headers say about its rate limits.
+
+    Reset times are seconds from now. Anthropic sends
+    `anthropic-ratelimit-{requests,tokens}-{remaining,reset}`; OpenAI-
+    compatible gateways send `x-ratelimit-{remaining,reset}-{requests,tokens}`.
+
+    Attributes:
+        retry_after:        Seconds to wait before the next request.
+        requests_remaining: Requests left in the current window.
+        requests_reset:     Seconds until the request quota is full again.
+        tokens_remaining:   Tokens left in the current window.
+        tokens_reset:       Seconds until the token quota is full again.
+    """
+    retry_after: float | None = None
+    requests_remaining: int | None = None
+    requests_reset: float | None = None
+    tokens_remaining: int | None = None
+    tokens_reset: float | None = None
+
+    @classmethod
+    def parse(cls, headers) -> RateLimitHeaders:
+        """Read the rate-limit headers from any mapping of header names."""
+        h = {k.lower(): v for k, v in headers.items()}
+
+        def first(*names: str) -> str | None:
+            return next((h[n] for n in names if n in h), None)
+
+        def count(*names: str) -> int | None:
+            value = first(*names)
+            try:
+                return int(float(value)) if value is not None else None
+            except ValueError:
+                return None
+
+        return cls(
+            retry_after=_seconds_until(first("retry-after")),
+            requests_remaining=count(
+                "anthropic-ratelimit-requests-remaining", "x-ratelimit-remaining-requests",
+            ),
+            requests_reset=_seconds_until(first(
+                "anthropic-ratelimit-requests-reset", "x-ratelimit-reset-requests",
+            )),
+            tokens_remaining=count(
+                "anthropic-ratelimit-tokens-remaining", "x-ratelimit-remaining-tokens",
+            ),
+            tokens_reset=_seconds_until(first(
+                "anthropic-ratelimit-tokens-reset", "x-ratelimit-reset-tokens",
+            )),
+        )
+
+
+def rate_limit_headers(headers) -> dict:
+    """The subset of `headers` worth keeping on a ModelResponse."""
+    return {
+        k.lower(): v for k, v in headers.items()
+        if "ratelimit" in k.lower() or k.lower() == "retry-after"
+    }
+
+
+def _seconds_until(value: str | None) -> float | None:
+    """
+    Parse a reset time: seconds ("20"), a duration ("1m30s", "250ms"),
+    an RFC 3339 timestamp or an HTTP date.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    if _DURATION.fullmatch(value):
+        return sum(float(n) * _DURATION_UNITS[u] for n, u in _DURATION_PART.findall(value))
+    try:
+        when = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if when.tzinfo is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+# ── Bucket State ────────────────────────────────────────────────────────────
+
+@dataclass
+class _State:
+    requests: float
+    tokens: float
+    updated: float
+    paused_until: float = 0.0
+
+
+class _MemoryStore:
+    """Bucket state for one process."""
+
+    def __init__(self, initial: _State) -> None:
+        self._state = initial
+
+    def update(self, fn: Callable[[_State], T]) -> T:
+        return fn(self._state)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key          TEXT PRIMARY KEY,
+    requests     REAL NOT NULL,
+    tokens       REAL NOT NULL,
+    updated      REAL NOT NULL,
+    paused_until REAL NOT NULL
+);
+"""
+
+
+class _SqliteStore:
+    """Bucket state in a SQLite file, shared by every process that opens it."""
+
+    def __init__(self, path: str | Path, key: str, initial: _State) -> None:
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Used from worker threads, one at a time under `_lock`
+        self._db = sqlite3.connect(
+            path, timeout=10, isolation_level=None, check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._db.executescript(_SCHEMA)
+        self._db.execute(
+            "INSERT OR IGNORE INTO buckets VALUES (?, ?, ?, ?, ?)",
+            (key, initial.requests, initial.tokens, initial.updated, initial.paused_until),
+        )
+        self._key = key
+
+    def update(self, fn: Callable[[_State], T]) -> T:
+        """
+        Run `fn` on the stored state under an exclusive write lock.
+
+        Blocks for as long as another process holds the lock (up to the
+        connection timeout); call it from a worker thread.
+        """
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT requests, tokens, updated, paused_until FROM buckets WHERE key = ?",
+                    (self._key,),
+                ).fetchone()
+                state = _State(*row)
+                result = fn(state)
+                self._db.execute(
+                    "UPDATE buckets SET requests = ?, tokens = ?, updated = ?, "
+                    "paused_until = ? WHERE key = ?",
+                    (state.requests, state.tokens, state.updated, state.paused_until, self._key),
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            return result
+
+    def close(self) -> None:
+        self._db.close()
+
+
+# ── Limiter ─────────────────────────────────────────────────────────────────
+
+class RateLimiter:
+    """
+    Token buckets for requests and tokens per minute, plus a shared pause.
+
+    Each bucket holds up to one minute's quota and refills continuously.
+    A call waits until both buckets can cover it; token costs are
+    reserved up front and corrected with `settle()` once the response
+    reports its usage. Waiters in one process are served in arrival
+    order. A shared state file is only touched from worker threads.
+
+    Args:
+        rpm:        Requests per minute (0 = unlimited).
+        tpm:        Tokens per minute, input plus output (0 = unlimited).
+        state_path: SQLite file holding the buckets, to share them with
+                    other processes; None keeps them in memory.
+        key:        Name of the quota within the state file.
+    """
+
+    def __init__(
+        self,
+        rpm: int = 0,
+        tpm: int = 0,
+        *,
+        state_path: str | Path | None = None,
+        key: str = "default",
+    ) -> None:
+        self._rpm = rpm
+        self._tpm = tpm
+        initial = _State(requests=rpm, tokens=tpm, updated=time.time())
+        self._store = (
+            _SqliteStore(state_path, key, initial) if state_path else _MemoryStore(initial)
+        )
+        self._turn = asyncio.Lock()
+
+    def _refill(self, state: _State, now: float) -> None:
+        elapsed = max(0.0, now - state.updated)
+        if self._rpm:
+            state.requests = min(self._rpm, state.requests + elapsed * self._rpm / 60)
+        if self._tpm:
+            state.tokens = min(self._tpm, state.tokens + elapsed * self._tpm / 60)
+        state.updated = max(state.updated, now)
+
+    def _take(self, tokens: int) -> Callable[[_State], float]:
+        """State update that takes one request and `tokens`, or returns the wait."""
+        def take(state: _State) -> float:
+            now = time.time()
+            self._refill(state, now)
+            wait = max(0.0, state.paused_until - now)
+            if self._rpm and state.requests < 1:
+                wait = max(wait, (1 - state.requests) * 60 / self._rpm)
+            # A call larger than the whole bucket goes through once it is full
+            need = min(tokens, self._tpm)
+            if self._tpm and state.tokens < need:
+                wait = max(wait, (need - state.tokens) * 60 / self._tpm)
+            if wait == 0:
+                state.requests -= 1
+                state.tokens -= tokens
+            return wait
+        return take
+
+    async def _update(self, fn: Callable[[_State], T]) -> T:
+        """Apply `fn` to the bucket state, off the event loop if it is shared."""
+        if isinstance(self._store, _SqliteStore):
+            return await asyncio.to_thread(self._store.update, fn)
+        return self._store.update(fn)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until one request costing `tokens` fits within the limits."""
+        async with self._turn:
+            while (wait := await self._update(self._take(tokens))) > 0:
+                await asyncio.sleep(wait)
+
+    async def settle(self, reserved: int, used: int) -> None:
+        """Correct the token bucket once a call's real usage is known."""
+        if not self._tpm or used == reserved:
+            return
+
+        def adjust(state: _State) -> None:
+            state.tokens = min(self._tpm, state.tokens + reserved - used)
+        await self._update(adjust)
+
+    async def pause(self, seconds: float) -> None:
+        """Hold every call for `seconds`, in this process and any sharing the state."""
+        def extend(state: _State) -> None:
+            state.paused_until = max(state.paused_until, time.time() + seconds)
+        await self._update(extend)
+
+    async def observe(self, headers: RateLimitHeaders) -> None:
+        """Bring the buckets in line with what the provider reports."""
+        if headers.retry_after:
+            await self.pause(headers.retry_after)
+        if headers.requests_remaining == 0 and headers.requests_reset:
+            await self.pause(headers.requests_reset)
+
+        def sync(state: _State) -> None:
+            # The provider also counts what other clients of the key used
+            if self._rpm and headers.requests_remaining is not None:
+                state.requests = min(state.requests, headers.requests_remaining)
+            if self._tpm and headers.tokens_remaining is not None:
+                state.tokens = min(state.tokens, headers.tokens_remaining)
+        await self._update(sync)
+
+    def close(self) -> None:
+        if isinstance(self._store, _SqliteStore):
+            self._store.close()
+
+
+# ── Adapter ─────────────────────────────────────────────────────────────────
+
+class RateLimitedAdapter(BaseModelAdapter):
+    """
+    Adapter wrapper that keeps calls within a RateLimiter's quota and
+    retries calls the provider rejected as rate limited.
+
+    Each call reserves its estimated input plus `max_tokens` of output,
+    and is settled to the usage it reports (or, for a stream, to the
+    estimated size of its output). A call that fails for any other
+    reason than a rate limit gets its reservation back.
+
+    A stream is only retried if it failed before yielding anything.
+    Backends that already retry rate-limited calls themselves (the
+    Anthropic SDK, the Ollama adapter) should be wrapped with
+    `max_retries=1`, so that attempts don't multiply.
+
+    Args:
+        inner:       Adapter to forward calls to.
+        limiter:     Quota shared by every call (and possibly processes).
+        max_retries: Attempts per call, the first included.
+        estimate:    Token count estimate for a prompt; the default
+                     assumes four characters per token.
+    """
+
+    def __init__(
+        self,
+        inner: BaseModelAdapter,
+        limiter: RateLimiter,
+        max_retries: int = 3,
+        estimate: Callable[[str], int] | None = None,
+    ) -> None:
+        self._inner = inner
+        self._limiter = limiter
+        self._max_retries = max_retries
+        self._estimate = estimate or (lambda text: len(text) // 4)
+
+    @property
+    def provider(self) -> str:
+        return self._inner.provider
+
+    @property
+    def model(self) -> str:
+        return self._inner.model
+
+    @property
+    def limiter(self) -> RateLimiter:
+        return self._limiter
+
+    async def _rejected(self, exc: RateLimitError, attempt: int, reserved: int) -> None:
+        """Refund the rejected call and pause everyone before the retry."""
+        await self._limiter.settle(reserved, 0)
+        await self._limiter.observe(RateLimitHeaders.parse(exc.headers))
+        if attempt >= self._max_retries:
+            raise exc
+        delay = backoff_delay(attempt, exc.retry_after)
+        logger.warning(
+            "%s rate limited (attempt %d/%d); retrying in %.1fs",
+            self.provider, attempt, self._max_retries, delay,
+        )
+        await self._limiter.pause(delay)
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> ModelResponse:
+        """Wait for quota, call the wrapped adapter, retry if rate limited."""
+        reserved = self._estimate(system + prompt) + max_tokens
+        for attempt in itertools.count(1):
+            await self._limiter.acquire(reserved)
+            try:
+                resp = await self._inner.generate(
+                    prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+                    cache_prefix=cache_prefix,
+                )
+            except RateLimitError as exc:
+                await self._rejected(exc, attempt, reserved)
+                continue
+            except Exception:
+                await self._limiter.settle(reserved, 0)
+                raise
+            if resp.usage:
+                used = resp.usage.get("prompt_tokens", 0) + resp.usage.get("completion_tokens", 0)
+                await self._limiter.settle(reserved, used)
+            await self._limiter.observe(RateLimitHeaders.parse(resp.rate_limits))
+            return resp
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> AsyncIterator[str]:
+        """Wait for quota, then stream; retry if rejected before any output."""
+        prompt_tokens = self._estimate(system + prompt)
+        reserved = prompt_tokens + max_tokens
+        for attempt in itertools.count(1):
+            await self._limiter.acquire(reserved)
+            pieces: list[str] = []
+            try:
+                async for token in self._inner.stream(
+                    prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+                    cache_prefix=cache_prefix,
+                ):
+                    pieces.append(token)
+                    yield token
+            except RateLimitError as exc:
+                if pieces:
+                    raise
+                await self._rejected(exc, attempt, reserved)
+                continue
+            except Exception:
+                # Output already streamed was still generated
+                used = prompt_tokens + self._estimate("".join(pieces)) if pieces else 0
+                await self._limiter.settle(reserved, used)
+                raise
+            # Streams report no usage: estimate the output the same way
+            await self._limiter.settle(reserved, prompt_tokens + self._estimate("".join(pieces)))
+            return
+
+    async def warm_up(self) -> None:
+        """Warm up the wrapped adapter."""
+        await self._inner.warm_up()
+
+    async def close(self) -> None:
+        """Close the wrapped adapter and the limiter's state file."""
+        await self._inner.close()
+        self._limiter.close()
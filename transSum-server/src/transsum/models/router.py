@@ -0,0 +1,228 @@
+"""
+Failover and hedged requests over several backends.
+
+`RouterAdapter` presents an ordered list of adapters as one. A call goes
+to the first backend; if it fails or times out, the next one is tried,
+so an Ollama outage or an Anthropic overload degrades to the fallback
+instead of failing the document.
+
+With hedging on, a call that is still unanswered after the primary's
+usual p95 latency is also sent to the next backend; whichever answers
+first wins and the other call is cancelled. A long document is as slow
+as its slowest chunk call, so trimming the tail of the per-call latency
+distribution shortens whole runs — at the cost of duplicating about one
+call in twenty.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from transsum.models.base import BaseModelAdapter, ModelResponse, streamed_by
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_WINDOW = 200   # recent successful calls kept per backend
+_MIN_SAMPLES = 20       # calls observed before hedging on the p95
+
+
+class RouterAdapter(BaseModelAdapter):
+    """
+    Adapter over an ordered list of backends with failover and hedging.
+
+    Streams fail over only before their first token, and are not hedged.
+
+    Args:
+        backends:    Adapters in order of preference (at least one).
+        timeout:     Seconds before a backend's call counts as failed and
+                     the next backend is tried; None waits for the
+                     backend's own timeout.
+        hedge:       Also send slow calls to the next backend.
+        hedge_after: Seconds before hedging; None uses the p95 latency of
+                     the backend's recent calls (no hedging until
+                     enough calls have been seen).
+    """
+
+    provider = "router"
+
+    def __init__(
+        self,
+        backends: list[BaseModelAdapter],
+        *,
+        timeout: float | None = None,
+        hedge: bool = False,
+        hedge_after: float | None = None,
+    ) -> None:
+        if not backends:
+            raise ValueError("RouterAdapter needs at least one backend.")
+        self._backends = backends
+        self._timeout = timeout
+        self._hedge = hedge
+        self._hedge_after = hedge_after
+        self._latencies = [deque(maxlen=_LATENCY_WINDOW) for _ in backends]
+        self.failovers = 0
+        self.hedges = 0
+
+    @property
+    def model(self) -> str:
+        return ",".join(f"{b.provider}/{b.model}" for b in self._backends)
+
+    @property
+    def backends(self) -> list[BaseModelAdapter]:
+        return self._backends
+
+    def hedge_delay(self, index: int) -> float | None:
+        """Seconds to wait on backend `index` before hedging, or None."""
+        if self._hedge_after is not None:
+            return self._hedge_after
+        samples = self._latencies[index]
+        if len(samples) < _MIN_SAMPLES:
+            return None
+        return sorted(samples)[math.ceil(len(samples) * 0.95) - 1]
+
+    # ── Generation ──────────────────────────────────────────────────────
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> ModelResponse:
+        """Answer from the first backend that succeeds (or, hedged, the fastest)."""
+        def call(backend: BaseModelAdapter) -> Awaitable[ModelResponse]:
+            return backend.generate(
+                prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+                cache_prefix=cache_prefix,
+            )
+        return await self._route(call)
+
+    async def _route(
+        self, call: Callable[[BaseModelAdapter], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        running: dict[asyncio.Task, tuple[int, float]] = {}
+        next_index = 0
+        last_error: BaseException | None = None
+
+        def launch() -> None:
+            nonlocal next_index
+            backend = self._backends[next_index]
+            coro = call(backend)
+            if self._timeout is not None:
+                coro = asyncio.wait_for(coro, self._timeout)
+            running[asyncio.create_task(coro)] = (next_index, time.monotonic())
+            next_index += 1
+
+        launch()
+        try:
+            while running:
+                wait = None
+                if self._hedge and len(running) == 1 and next_index < len(self._backends):
+                    index, started = next(iter(running.values()))
+                    delay = self.hedge_delay(index)
+                    if delay is not None:
+                        wait = max(0.0, started + delay - time.monotonic())
+
+                done, _ = await asyncio.wait(
+                    running, timeout=wait, return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self.hedges += 1
+                    logger.info(
+                        "No answer from %s after %.1fs; hedging to %s",
+                        self._name(index), wait, self._name(next_index),
+                    )
+                    launch()
+                    continue
+
+                for task in done:
+                    index, started = running.pop(task)
+                    if task.exception() is None:
+                        self._latencies[index].append(time.monotonic() - started)
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning("%s failed: %s", self._name(index), _describe(last_error))
+
+                if not running and next_index < len(self._backends):
+                    self.failovers += 1
+                    logger.warning("Failing over to %s", self._name(next_index))
+                    launch()
+        finally:
+            # The losing (or abandoned) calls
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        raise RuntimeError(
+            f"All {len(self._backends)} backends failed; last error: {_describe(last_error)}"
+        ) from last_error
+
+    # ── Streaming ───────────────────────────────────────────────────────
+
+    async def stream(
+        self,
+        prompt: str,
+        *,
+        system: str = "",
+        temperature: float = 0.3,
+        max_tokens: int = 4096,
+        cache_prefix: int = 0,
+    ) -> AsyncIterator[str]:
+        """Stream from the first backend that produces a token."""
+        last_error: BaseException | None = None
+        for index, backend in enumerate(self._backends):
+            if index:
+                self.failovers += 1
+                logger.warning("Failing over to %s", self._name(index))
+            tokens = backend.stream(
+                prompt, system=system, temperature=temperature, max_tokens=max_tokens,
+                cache_prefix=cache_prefix,
+            )
+            try:
+                first = await asyncio.wait_for(anext(tokens), self._timeout)
+            except StopAsyncIteration:
+                return
+            except Exception as exc:
+                last_error = exc
+                logger.warning("%s failed: %s", self._name(index), _describe(exc))
+                await tokens.aclose()
+                continue
+
+            streamed_by.set((backend.provider, backend.model))
+            yield first
+            async for token in tokens:
+                yield token
+            return
+
+        raise RuntimeError(
+            f"All {len(self._backends)} backends failed; last error: {_describe(last_error)}"
+        ) from last_error
+
+    # ── Lifecycle ───────────────────────────────────────────────────────
+
+    def _name(self, index: int) -> str:
+        backend = self._backends[index]
+        return f"{backend.provider}/{backend.model}"
+
+    async def warm_up(self) -> None:
+        """Warm up every backend."""
+        await asyncio.gather(*(b.warm_up() for b in self._backends))
+
+    async def close(self) -> None:
+        """Close every backend."""
+        for backend in self._backends:
+            await backend.close()
+
+
+def _describe(exc: BaseException | None) -> str:
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return "timed out"
+    return f"{type(exc).__name__}: {exc}" if exc else "unknown error"
@@ -1,11 +1,25 @@
 """Document processing — loading, chunking, and orchestration."""
 
-from transsum.processing.loader import DocumentLoader, Document
-from transsum.processing.chunker import TextChunker, Chunk
-from transsum.processing.pipeline import ProcessingPipeline, TaskType, PipelineResult
+from transsum.processing.loader import DocumentLoader, Document, PageStream
+from transsum.processing.chunker import (
+    TextChunker, ContentDefinedChunker, TokenChunker, Chunk, ChunkSpan,
+    ChunkStream, create_chunker,
+)
+from transsum.processing.text_cache import ExtractedTextCache, create_text_cache
+from transsum.processing.tokens import (
+    TokenEstimator, HeuristicEstimator, TiktokenEstimator, create_estimator,
+)
+from transsum.processing.pipeline import (
+    ProcessingPipeline, TaskType, PipelineResult, PipelineEvent,
+)
+from transsum.processing.timings import PipelineTimings, CallTiming
 
 __all__ = [
-    "DocumentLoader", "Document",
-    "TextChunker", "Chunk",
-    "ProcessingPipeline", "TaskType", "PipelineResult",
+    "DocumentLoader", "Document", "PageStream",
+    "ExtractedTextCache", "create_text_cache",
+    "TextChunker", "ContentDefinedChunker", "TokenChunker", "Chunk", "ChunkSpan",
+    "ChunkStream", "create_chunker",
+    "TokenEstimator", "HeuristicEstimator", "TiktokenEstimator", "create_estimator",
+    "ProcessingPipeline", "TaskType", "PipelineResult", "PipelineEvent",
+    "PipelineTimings", "CallTiming",
 ]
\ No newline at end of file
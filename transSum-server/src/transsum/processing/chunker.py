@@ -10,10 +10,34 @@ from __future__ import annotations
 
 import logging
 import re
+import zlib
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from transsum.processing.tokens import HeuristicEstimator, TokenEstimator, create_estimator
+
+if TYPE_CHECKING:
+    from transsum.config import Settings
 
 logger = logging.getLogger(__name__)
 
+_SENTENCE_END = re.compile(r'[.!?]\s')
+
+
+def sentence_index(text: str) -> array:
+    """
+    Offsets just past every sentence end (.!? + whitespace) in `text`.
+
+    Built in a single regex pass and stored as a compact sorted array of
+    unsigned ints ('I', or 'Q' for texts too long for 32-bit offsets),
+    so chunkers can bisect into it instead of rescanning each window.
+    """
+    typecode = "I" if len(text) < 2**32 else "Q"
+    return array(typecode, (m.end() for m in _SENTENCE_END.finditer(text)))
+
 
 @dataclass
 class Chunk:
@@ -35,6 +59,74 @@ class Chunk:
         return self.text[:80].replace("\n", " ") + ("…" if len(self.text) > 80 else "")
 
 
+class ChunkSpan:
+    """
+    A chunk stored as offsets into its parent text instead of a copy.
+
+    Exposes the same fields as Chunk, but `text` is sliced from the
+    source only when read — normally while the prompt is built — so a
+    document's chunks cost a few dozen bytes each rather than a second
+    copy of the document (more with overlap).
+
+    Attributes:
+        index:      Zero-based position in the sequence.
+        start, end: Character offsets of the chunk in the source text.
+    """
+
+    __slots__ = ("index", "start", "end", "_source")
+
+    def __init__(self, index: int, source: str, start: int, end: int) -> None:
+        self.index = index
+        self.start = start
+        self.end = end
+        self._source = source
+
+    @classmethod
+    def stripped(cls, index: int, source: str, start: int, end: int) -> ChunkSpan | None:
+        """Span of source[start:end] minus surrounding whitespace, or None if blank."""
+        while start < end and source[start].isspace():
+            start += 1
+        while end > start and source[end - 1].isspace():
+            end -= 1
+        return cls(index, source, start, end) if end > start else None
+
+    @property
+    def text(self) -> str:
+        """The chunk content (a fresh slice of the source)."""
+        return self._source[self.start:self.end]
+
+    @property
+    def char_count(self) -> int:
+        return self.end - self.start
+
+    @property
+    def preview(self) -> str:
+        """First 80 characters for logging / display."""
+        head = self._source[self.start:min(self.end, self.start + 80)]
+        return head.replace("\n", " ") + ("…" if self.char_count > 80 else "")
+
+    def gap_to(self, following: ChunkSpan) -> str:
+        """
+        Source text between this chunk and the next, non-overlapping one.
+
+        Streamed chunks may be cut from successive buffers; the gap is
+        then the whitespace stripped from the end of this chunk plus that
+        stripped from the start of `following`. "" if the chunks overlap
+        or were cut mid-word.
+        """
+        if following._source is self._source:
+            return self._source[self.end:following.start] if self.end <= following.start else ""
+        end, start = self.end, following.start
+        while end < len(self._source) and self._source[end].isspace():
+            end += 1
+        while start > 0 and following._source[start - 1].isspace():
+            start -= 1
+        return self._source[self.end:end] + following._source[start:following.start]
+
+    def __repr__(self) -> str:
+        return f"ChunkSpan(index={self.index}, start={self.start}, end={self.end})"
+
+
 class TextChunker:
     """
     Splits text into overlapping, sentence-aware chunks.
@@ -42,8 +134,9 @@ class TextChunker:
     Algorithm:
       1. If the full text fits in one chunk, return it as-is.
       2. Otherwise, advance a sliding window of `chunk_size` chars.
-      3. At each step, look backwards from the window edge for a
-         sentence-ending punctuation mark followed by whitespace.
+      3. At each step, snap the window edge back to the last
+         sentence-ending punctuation mark followed by whitespace, found
+         by bisecting a boundary index built once for the whole text.
       4. Slide forward by (chunk_end − overlap) to start the next chunk.
 
     Args:
@@ -60,37 +153,34 @@ class TextChunker:
         self._size = chunk_size
         self._overlap = overlap
 
-    def chunk(self, text: str) -> list[Chunk]:
+    def chunk(self, text: str) -> list[ChunkSpan]:
         """
-        Split `text` into a list of Chunk objects.
+        Split `text` into ChunkSpans (offsets into `text`, no copies).
 
         Short texts (≤ chunk_size) are returned as a single chunk.
         """
         # Fast path: fits in one chunk
         if len(text) <= self._size:
-            return [Chunk(index=0, text=text, char_count=len(text))]
+            return [ChunkSpan(0, text, 0, len(text))]
 
-        chunks: list[Chunk] = []
+        boundaries = sentence_index(text)
+        chunks: list[ChunkSpan] = []
         start = 0
-        idx = 0
 
         while start < len(text):
             end = min(start + self._size, len(text))
 
             # Try to snap to a sentence boundary
             if end < len(text):
-                boundary = self._find_sentence_boundary(text, start, end)
+                boundary = self._find_sentence_boundary(boundaries, start, end)
                 if boundary > start:
                     end = boundary
 
-            chunk_text = text[start:end].strip()
-            if chunk_text:
-                chunks.append(Chunk(
-                    index=idx,
-                    text=chunk_text,
-                    char_count=len(chunk_text),
-                ))
-                idx += 1
+            span = ChunkSpan.stripped(len(chunks), text, start, end)
+            if span is not None:
+                chunks.append(span)
+            if end == len(text):
+                break
 
             # Advance with overlap
             start = max(start + 1, end - self._overlap)
@@ -101,20 +191,322 @@ class TextChunker:
         )
         return chunks
 
+    def stream(self) -> ChunkStream:
+        """
+        Start incremental chunking of text that arrives in pieces.
+
+        Chunks are released as soon as their boundaries are final and are
+        identical to `chunk()` on the whole (stripped) text.
+        """
+        return _WindowChunkStream(self._size, self._overlap)
+
     # ── Internal ────────────────────────────────────────────────────────
 
     @staticmethod
-    def _find_sentence_boundary(text: str, start: int, end: int) -> int:
+    def _find_sentence_boundary(boundaries: array, start: int, end: int) -> int:
         """
-        Scan backwards from `end` within [start, end) for the last
-        sentence-ending punctuation (.!?) followed by whitespace.
+        Find the last sentence end (.!? + whitespace) lying entirely
+        within [start, end), by bisecting the sorted boundary index.
 
         Returns the character position just after the whitespace,
         or `end` if no boundary is found.
         """
-        search_zone = text[start:end]
-        matches = list(re.finditer(r'[.!?]\s', search_zone))
-        if matches:
-            # Return absolute position after the matched whitespace
-            return start + matches[-1].end()
-        return end
\ No newline at end of file
+        i = bisect_right(boundaries, end) - 1
+        # The two-char match must start at or after `start`
+        if i >= 0 and boundaries[i] >= start + 2:
+            return boundaries[i]
+        return end
+
+
+class ContentDefinedChunker(TextChunker):
+    """
+    Splits text at boundaries chosen by the content itself.
+
+    Fixed windows shift every later boundary when text is inserted near
+    the top; here each sentence end is a candidate cut, accepted when a
+    hash of the `window` characters before it passes a test. An edit only
+    moves the cuts next to it, so unchanged chunks keep their exact text
+    and their MAP results can be reused.
+
+    Algorithm:
+      1. Build the sentence boundary index in one pass.
+      2. At each boundary, hash the end of the sentence just closed (at
+         most `window` chars, CRC-32) and cut if
+         `hash % target < sentence_length`. Longer sentences are likelier
+         cuts, so chunks average ~`target` chars whatever the sentence
+         length. Hashing only the current sentence keeps an edit from
+         moving cuts in the sentences after it.
+      3. Ignore cuts before `chunk_size // 4` chars; at `chunk_size`,
+         force a cut at the last boundary seen (or mid-text if none).
+
+    Chunks do not overlap — overlap would tie each chunk to its
+    neighbour's text and defeat reuse.
+
+    Args:
+        chunk_size: Maximum characters per chunk.
+        window:     Maximum characters hashed at each candidate boundary.
+    """
+
+    def __init__(self, chunk_size: int = 4000, window: int = 48) -> None:
+        super().__init__(chunk_size, 0)
+        self._window = window
+        self._min = chunk_size // 4
+        self._target = chunk_size // 2
+
+    def chunk(self, text: str) -> list[ChunkSpan]:
+        """Split `text` into content-anchored ChunkSpans."""
+        if len(text) <= self._size:
+            return [ChunkSpan(0, text, 0, len(text))]
+
+        cuts: list[int] = []
+        start = 0
+        prev = 0
+        last_candidate = 0
+        for pos in sentence_index(text):
+            while pos - start > self._size:
+                start = last_candidate if last_candidate > start else start + self._size
+                cuts.append(start)
+            sentence_start = prev
+            span = pos - prev
+            prev = pos
+            last_candidate = pos
+            if pos - start < self._min:
+                continue
+            anchor = text[max(sentence_start, pos - self._window):pos]
+            anchor = anchor.encode("utf-8", "surrogatepass")
+            if zlib.crc32(anchor) % self._target < span:
+                cuts.append(pos)
+                start = pos
+        while len(text) - start > self._size:
+            start = last_candidate if last_candidate > start else start + self._size
+            cuts.append(start)
+
+        chunks: list[ChunkSpan] = []
+        for a, b in zip([0, *cuts], [*cuts, len(text)]):
+            span = ChunkSpan.stripped(len(chunks), text, a, b)
+            if span is not None:
+                chunks.append(span)
+
+        logger.info(
+            "Content-chunked %d chars → %d chunks (max=%d)",
+            len(text), len(chunks), self._size,
+        )
+        return chunks
+
+    def stream(self) -> ChunkStream:
+        """Buffer the whole text, then chunk it (see ChunkStream)."""
+        return ChunkStream(self)
+
+
+class TokenChunker(TextChunker):
+    """
+    Packs whole sentences into chunks sized in model tokens, not characters.
+
+    A character budget has to be sized for the worst-case script, so it
+    overflows on CJK text and wastes most of the context on English.
+    Measuring through a TokenEstimator lets every chunk fill the budget.
+
+    Algorithm:
+      1. If the whole text fits `chunk_tokens`, return it as-is.
+      2. Split at sentence boundaries and estimate each sentence;
+         sentences over budget are split at spaces (or hard-cut).
+      3. Greedily pack consecutive sentences up to `chunk_tokens`.
+      4. Start the next chunk with trailing sentences of the previous
+         one totalling at most `overlap_tokens`.
+
+    Args:
+        chunk_tokens:   Maximum estimated tokens per chunk (default 1000).
+        overlap_tokens: Tokens of whole-sentence overlap (default 50).
+        estimator:      Token estimator (default HeuristicEstimator).
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = 1000,
+        overlap_tokens: int = 50,
+        estimator: TokenEstimator | None = None,
+    ) -> None:
+        super().__init__(chunk_tokens, overlap_tokens)
+        self._estimator = estimator or HeuristicEstimator()
+
+    def chunk(self, text: str) -> list[ChunkSpan]:
+        count = self._estimator.count
+        if count(text) <= self._size:
+            return [ChunkSpan(0, text, 0, len(text))]
+
+        units: list[tuple[int, int, int]] = []   # (start, end, tokens)
+        prev = 0
+        for pos in [*sentence_index(text), len(text)]:
+            if pos > prev:
+                units.extend(self._fit(text, prev, pos))
+                prev = pos
+
+        chunks: list[ChunkSpan] = []
+        i = 0
+        while i < len(units):
+            j = i
+            tokens = 0
+            while j < len(units) and (j == i or tokens + units[j][2] <= self._size):
+                tokens += units[j][2]
+                j += 1
+
+            span = ChunkSpan.stripped(len(chunks), text, units[i][0], units[j - 1][1])
+            if span is not None:
+                chunks.append(span)
+            if j == len(units):
+                break
+
+            # Step back over whole sentences to seed the overlap
+            k = j
+            carried = 0
+            while k - 1 > i and carried + units[k - 1][2] <= self._overlap:
+                carried += units[k - 1][2]
+                k -= 1
+            i = k
+
+        logger.info(
+            "Token-chunked %d chars → %d chunks (max=%d tokens, estimator=%s)",
+            len(text), len(chunks), self._size, self._estimator.name,
+        )
+        return chunks
+
+    def stream(self) -> ChunkStream:
+        """Buffer the whole text, then chunk it (see ChunkStream)."""
+        return ChunkStream(self)
+
+    def _fit(self, text: str, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+        """Yield pieces of text[start:end] that each fit the token budget."""
+        count = self._estimator.count
+        while start < end:
+            tokens = count(text[start:end])
+            if tokens <= self._size:
+                yield start, end, tokens
+                return
+            # Guess a cut from the token density, then shrink until it fits
+            limit = start + max(1, (end - start) * self._size // tokens)
+            while True:
+                space = text.rfind(" ", start + 1, limit)
+                cut = space + 1 if space > start else limit
+                tokens = count(text[start:cut])
+                if tokens <= self._size or cut - start <= 1:
+                    break
+                limit = start + max(1, (cut - start) * 9 // 10)
+            yield start, cut, tokens
+            start = cut
+
+
+# ── Incremental Chunking ────────────────────────────────────────────────────
+
+class ChunkStream:
+    """
+    Incremental chunking: `feed()` text as it arrives, `close()` at the end.
+
+    Each call returns the chunks that became final, numbered in order.
+    This base class simply buffers everything and chunks on `close()`;
+    chunkers whose cut points can be settled early return a subclass
+    that releases chunks while text is still arriving.
+    """
+
+    def __init__(self, chunker: TextChunker) -> None:
+        self._chunker = chunker
+        self._pieces: list[str] = []
+
+    def feed(self, text: str) -> list[ChunkSpan]:
+        """Add the next piece of text; return chunks that are now final."""
+        self._pieces.append(text)
+        return []
+
+    def close(self) -> list[ChunkSpan]:
+        """Signal the end of the text; return the remaining chunks."""
+        text = "".join(self._pieces).strip()
+        self._pieces = []
+        return self._chunker.chunk(text) if text else []
+
+
+class _WindowChunkStream(ChunkStream):
+    """
+    Streaming form of TextChunker's sliding window.
+
+    A window is final once text extends past its edge, so it is cut as
+    soon as that text arrives. Only the unconsumed tail of the input is
+    kept; spans refer to the tail they were cut from.
+    """
+
+    def __init__(self, size: int, overlap: int) -> None:
+        self._size = size
+        self._overlap = overlap
+        self._text = ""              # input from document offset `_base` on
+        self._base = 0
+        self._start = 0              # document offset of the next chunk
+        self._scanned = 0            # document offset indexed for boundaries
+        self._boundaries = array("Q")
+        self._count = 0
+
+    def feed(self, text: str) -> list[ChunkSpan]:
+        if not self._text and self._base == 0:
+            text = text.lstrip()     # match the stripped Document content
+        if not text:
+            return []
+        self._text += text
+        self._index()
+        # Trailing whitespace may yet be stripped, so it doesn't count as
+        # text beyond a window edge
+        tail_ws = len(self._text) - len(self._text.rstrip())
+        return self._drain(self._base + len(self._text) - tail_ws, final=False)
+
+    def close(self) -> list[ChunkSpan]:
+        self._text = self._text.rstrip()
+        length = self._base + len(self._text)
+        del self._boundaries[bisect_right(self._boundaries, length):]
+        return self._drain(length, final=True)
+
+    def _index(self) -> None:
+        """Extend the boundary index over newly arrived text."""
+        # A match straddling the previous end starts one char before it
+        pos = max(self._scanned - 1 - self._base, 0)
+        for m in _SENTENCE_END.finditer(self._text, pos):
+            end = self._base + m.end()
+            if end > self._scanned:
+                self._boundaries.append(end)
+        self._scanned = self._base + len(self._text)
+
+    def _drain(self, limit: int, *, final: bool) -> list[ChunkSpan]:
+        """Cut every window that can no longer change."""
+        text, base = self._text, self._base
+        length = base + len(text)
+        out: list[ChunkSpan] = []
+        while self._start < length if final else self._start + self._size < limit:
+            start = self._start
+            end = min(start + self._size, length)
+            if end < length:
+                boundary = TextChunker._find_sentence_boundary(self._boundaries, start, end)
+                if boundary > start:
+                    end = boundary
+            span = ChunkSpan.stripped(self._count, text, start - base, end - base)
+            if span is not None:
+                out.append(span)
+                self._count += 1
+            if end == length:
+                self._start = length
+                break
+            self._start = max(start + 1, end - self._overlap)
+
+        # Forget input and boundaries before the next chunk
+        if self._start > base:
+            self._text = text[self._start - base:]
+            self._base = self._start
+            del self._boundaries[:bisect_right(self._boundaries, self._start)]
+        return out
+
+
+# ── Factory ─────────────────────────────────────────────────────────────────
+
+def create_chunker(settings: Settings) -> TextChunker:
+    """Build the chunker selected by CHUNKING_MODE."""
+    if settings.chunking_mode == "content":
+        return ContentDefinedChunker(settings.chunk_size)
+    if settings.chunking_mode == "tokens":
+        return TokenChunker(
+            settings.chunk_tokens, settings.overlap_tokens, create_estimator(settings),
+        )
+    return TextChunker(settings.chunk_size, settings.chunk_overlap)
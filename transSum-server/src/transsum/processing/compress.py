@@ -0,0 +1,198 @@
+"""
+Extractive pre-compression of chunks before the MAP phase.
+
+Long, redundant inputs — hour-long meeting transcripts, chatty logs —
+send every sentence to the model even though a fraction carries the
+content. `ExtractiveCompressor` scores the sentences of a chunk and
+keeps the best ones, in their original order, until it reaches a target
+share of the chunk's characters. Only summaries are compressed.
+
+Two scorers are available:
+
+  - TfidfScorer    — cosine similarity of each sentence's TF-IDF vector
+                     with the chunk's centroid (no dependencies)
+  - TextRankScorer — PageRank over the sentence similarity graph,
+                     vectorised with the optional `numpy` package
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transsum.config import Settings
+
+# A sentence ends at .!? plus whitespace (as in the chunker) or at a line break
+_SENTENCE = re.compile(r".*?(?:[.!?]\s+|\n+|$)", re.DOTALL)
+_WORD = re.compile(r"\w+")
+
+_LABEL_WORDS = 4      # unpunctuated units shorter than this are labels, always kept
+_MIN_SENTENCES = 8    # chunks with fewer scored sentences are left alone
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split `text` into sentences that concatenate back to `text` exactly."""
+    return [m.group() for m in _SENTENCE.finditer(text) if m.group()]
+
+
+def _is_label(sentence: str, words: list[str]) -> bool:
+    """Headings, speaker names, timestamps: short and without closing punctuation."""
+    return len(words) < _LABEL_WORDS and not sentence.rstrip().endswith((".", "!", "?"))
+
+
+def _tf_idf(sentences: list[list[str]]) -> list[dict[str, float]]:
+    """TF-IDF vector per sentence, treating each sentence as a document."""
+    df = Counter(word for words in sentences for word in set(words))
+    n = len(sentences)
+    idf = {word: math.log(n / count) + 1.0 for word, count in df.items()}
+    return [
+        {word: tf * idf[word] for word, tf in Counter(words).items()}
+        for words in sentences
+    ]
+
+
+# ── Scorers ─────────────────────────────────────────────────────────────────
+
+class SentenceScorer(ABC):
+    """Rates how central each sentence is to its chunk (higher is better)."""
+
+    name: str
+
+    @abstractmethod
+    def score(self, sentences: list[list[str]]) -> list[float]:
+        """One score per sentence, given each sentence's lowercased words."""
+
+
+class TfidfScorer(SentenceScorer):
+    """Cosine similarity between each sentence and the chunk's TF-IDF centroid."""
+
+    name = "tfidf"
+
+    def score(self, sentences: list[list[str]]) -> list[float]:
+        vectors = _tf_idf(sentences)
+        centroid: Counter[str] = Counter()
+        for vector in vectors:
+            centroid.update(vector)
+        centroid_norm = math.sqrt(sum(w * w for w in centroid.values())) or 1.0
+
+        scores = []
+        for vector in vectors:
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            dot = sum(w * centroid[word] for word, w in vector.items())
+            scores.append(dot / (norm * centroid_norm))
+        return scores
+
+
+class TextRankScorer(SentenceScorer):
+    """
+    PageRank over sentences linked by the cosine similarity of their TF-IDF vectors.
+
+    Args:
+        damping:    PageRank damping factor.
+        iterations: Maximum power-iteration steps.
+    """
+
+    name = "textrank"
+
+    def __init__(self, damping: float = 0.85, iterations: int = 50) -> None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "numpy is required for COMPRESS_METHOD=textrank. "
+                "Install it with: pip install numpy"
+            )
+        self._np = numpy
+        self._damping = damping
+        self._iterations = iterations
+
+    def score(self, sentences: list[list[str]]) -> list[float]:
+        np = self._np
+        vectors = _tf_idf(sentences)
+        vocab: dict[str, int] = {}
+        rows, cols, values = [], [], []
+        for row, vector in enumerate(vectors):
+            for word, weight in vector.items():
+                rows.append(row)
+                cols.append(vocab.setdefault(word, len(vocab)))
+                values.append(weight)
+
+        matrix = np.zeros((len(vectors), len(vocab)))
+        matrix[rows, cols] = values
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+        similarity = matrix @ matrix.T
+        np.fill_diagonal(similarity, 0.0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        # Isolated sentences link to every sentence equally
+        n = len(vectors)
+        transition = np.where(out_weight > 0, similarity / out_weight.clip(min=1e-12), 1 / n)
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(self._iterations):
+            updated = (1 - self._damping) / n + self._damping * (transition.T @ rank)
+            converged = np.abs(updated - rank).sum() < 1e-6
+            rank = updated
+            if converged:
+                break
+        return rank.tolist()
+
+
+# ── Compressor ──────────────────────────────────────────────────────────────
+
+class ExtractiveCompressor:
+    """
+    Keeps the highest-scoring sentences of a chunk, in their original order.
+
+    Sentences are added best first until they cover `ratio` of the
+    chunk's characters. Labels — headings, speaker names, timestamps:
+    short units without closing punctuation — are always kept, and
+    chunks with too few sentences to rank are passed through unchanged.
+
+    Args:
+        ratio:  Share of each chunk's characters to keep (0 < ratio <= 1).
+        scorer: Sentence scorer (default TfidfScorer).
+    """
+
+    def __init__(self, ratio: float, scorer: SentenceScorer | None = None) -> None:
+        if not 0 < ratio <= 1:
+            raise ValueError(f"Compression ratio must be in (0, 1] (got {ratio}).")
+        self._ratio = ratio
+        self._scorer = scorer or TfidfScorer()
+
+    @property
+    def name(self) -> str:
+        """Identifies the output, e.g. for the MAP store key ("tfidf:0.3")."""
+        return f"{self._scorer.name}:{self._ratio}"
+
+    def compress(self, text: str) -> str:
+        """Return the kept sentences of `text`, in order."""
+        sentences = split_sentences(text)
+        words = [_WORD.findall(s.lower()) for s in sentences]
+        ranked = [i for i, s in enumerate(sentences) if not _is_label(s, words[i])]
+        if self._ratio >= 1 or len(ranked) < _MIN_SENTENCES:
+            return text
+
+        keep = set(range(len(sentences))) - set(ranked)
+        budget = self._ratio * len(text) - sum(len(sentences[i]) for i in keep)
+        scores = self._scorer.score([words[i] for i in ranked])
+        for _, i in sorted(zip(scores, ranked), key=lambda pair: -pair[0]):
+            if budget <= 0:
+                break
+            keep.add(i)
+            budget -= len(sentences[i])
+
+        return "".join(sentences[i] for i in sorted(keep))
+
+
+# ── Factory ─────────────────────────────────────────────────────────────────
+
+def create_compressor(settings: Settings) -> ExtractiveCompressor | None:
+    """Build the compressor selected by COMPRESS_RATIO and COMPRESS_METHOD, if any."""
+    if settings.compress_ratio >= 1:
+        return None
+    scorer = TextRankScorer() if settings.compress_method == "textrank" else TfidfScorer()
+    return ExtractiveCompressor(settings.compress_ratio, scorer)
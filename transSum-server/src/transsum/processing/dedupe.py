@@ -0,0 +1,181 @@
+"""
+Boilerplate and duplicate-chunk removal ahead of the MAP phase.
+
+PDF reports repeat the same running headers, footers, disclaimers and
+table headings on every page, and a MAP call for every copy is wasted
+spend. Two passes catch them:
+
+  - `BoilerplateFilter` drops lines that recur on a large share of a
+    streamed document's pages. In the lines at the top and bottom of a
+    page digits are masked, so "Page 3 of 40" matches "Page 4 of 40";
+    elsewhere lines must match exactly, so table rows that differ only
+    in their figures are kept.
+  - `ChunkDeduplicator` recognises chunks that are exact or near-exact
+    copies of an earlier chunk, so the pipeline reuses that chunk's MAP
+    result instead of calling the model again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import re
+from collections import Counter, defaultdict
+
+_DIGITS = re.compile(r"\d+")
+
+_EDGE_LINES = 2      # lines at each end of a page treated as header/footer
+_SHINGLE_WORDS = 5   # words per shingle
+_SKETCH_SIZE = 64    # smallest shingle hashes kept per chunk
+_INDEX_HASHES = 4    # of those, how many a chunk is indexed under
+
+
+def _line_keys(lines: list[str]) -> list[str | None]:
+    """Comparison key per line (None for blank lines); see module docstring."""
+    filled = [i for i, line in enumerate(lines) if line.strip()]
+    edges = set(filled[:_EDGE_LINES] + filled[-_EDGE_LINES:])
+    keys: list[str | None] = [None] * len(lines)
+    for i in filled:
+        key = " ".join(lines[i].split()).lower()
+        keys[i] = _DIGITS.sub("#", key) if i in edges else key
+    return keys
+
+
+# ── Page Boilerplate ────────────────────────────────────────────────────────
+
+class BoilerplateFilter:
+    """
+    Strips lines that repeat across the pages of a document.
+
+    A line is boilerplate once it has appeared on at least `min_pages`
+    pages and on at least `min_ratio` of the pages seen so far. The first
+    `window` pages are held back and filtered together; after that each
+    page is released as soon as it is fed, so streaming is delayed by
+    `window` pages at most. Lines that only start repeating later are
+    stripped from the pages that follow. The first copy of each
+    boilerplate line is kept, so the text is never left empty.
+
+    Args:
+        min_pages: Fewest pages a line must appear on.
+        min_ratio: Smallest share of pages a line must appear on.
+        window:    Pages held back before the first is released.
+    """
+
+    def __init__(self, min_pages: int = 3, min_ratio: float = 0.5, window: int = 5) -> None:
+        self._min_pages = min_pages
+        self._min_ratio = min_ratio
+        self._window = window
+        self._counts: Counter[str] = Counter()
+        self._pages = 0
+        self._held: list[str] | None = []
+        self._emitted: set[str] = set()
+        self.boilerplate: set[str] = set()
+        self.lines_removed = 0
+
+    def feed(self, page: str) -> list[str]:
+        """Add a page; return the filtered pages that are ready, in order."""
+        keys = set(_line_keys(page.split("\n")))
+        keys.discard(None)
+        self._counts.update(keys)
+        self._pages += 1
+        if self._held is not None:
+            self._held.append(page)
+            return self._release() if self._pages >= self._window else []
+        self._learn(keys)
+        return [self._strip(page)]
+
+    def close(self) -> list[str]:
+        """Release the pages still held back (a document shorter than the window)."""
+        return self._release() if self._held is not None else []
+
+    def _release(self) -> list[str]:
+        self._learn(self._counts)
+        held, self._held = self._held, None
+        return [self._strip(page) for page in held]
+
+    def _learn(self, keys) -> None:
+        threshold = max(self._min_pages, self._min_ratio * self._pages)
+        self.boilerplate.update(key for key in keys if self._counts[key] >= threshold)
+
+    def _strip(self, page: str) -> str:
+        if not self.boilerplate:
+            return page
+        lines = page.split("\n")
+        kept = []
+        for line, key in zip(lines, _line_keys(lines)):
+            if key not in self.boilerplate:
+                kept.append(line)
+            elif key in self._emitted:
+                self.lines_removed += 1
+            else:
+                self._emitted.add(key)
+                kept.append(line)
+        return "\n".join(kept)
+
+
+# ── Duplicate Chunks ────────────────────────────────────────────────────────
+
+class ChunkDeduplicator:
+    """
+    Finds chunks that repeat an earlier chunk of the same document.
+
+    Exact copies are matched by hash, ignoring case and spacing unless
+    `normalize` is off (a translation of "Id" is not one of "ID"). With
+    `similarity` below 1, near-copies are matched too: each chunk is
+    reduced to a bottom-k sketch of its hashed word 5-grams, indexed
+    under its few smallest hashes, and checked against the chunks that
+    share one of them. A chunk whose estimated Jaccard similarity with
+    an earlier one reaches `similarity` counts as its copy. Each lookup
+    touches only those candidates, not every earlier chunk.
+
+    Args:
+        similarity: Minimum similarity for a near-copy; 1.0 matches exact
+                    copies only.
+        normalize:  Ignore case and spacing when matching exact copies.
+    """
+
+    def __init__(self, similarity: float = 0.9, *, normalize: bool = True) -> None:
+        self._similarity = similarity
+        self._normalize = normalize
+        self._exact: dict[bytes, int] = {}
+        self._sketches: dict[int, list[int]] = {}
+        self._index: defaultdict[int, list[int]] = defaultdict(list)
+
+    def register(self, pos: int, text: str) -> int | None:
+        """Return the position of an earlier copy of `text`, or remember it as `pos`."""
+        words = text.lower().split()
+        exact = " ".join(words) if self._normalize else text
+        digest = hashlib.blake2b(exact.encode("utf-8"), digest_size=16).digest()
+        original = self._exact.get(digest)
+        if original is not None:
+            return original
+        if self._similarity >= 1.0:
+            self._exact[digest] = pos
+            return None
+
+        sketch = _sketch(words)
+        candidates = {c for h in sketch[:_INDEX_HASHES] for c in self._index.get(h, ())}
+        for candidate in sorted(candidates):
+            if _similarity(sketch, self._sketches[candidate]) >= self._similarity:
+                # Later exact copies of this chunk resolve to the same original
+                self._exact[digest] = candidate
+                return candidate
+        self._exact[digest] = pos
+        self._sketches[pos] = sketch
+        for h in sketch[:_INDEX_HASHES]:
+            self._index[h].append(pos)
+        return None
+
+
+def _sketch(words: list[str]) -> list[int]:
+    """The smallest shingle hashes of `words`, ascending."""
+    n = _SHINGLE_WORDS
+    shingles = {" ".join(words[i:i + n]) for i in range(max(1, len(words) - n + 1))}
+    return heapq.nsmallest(_SKETCH_SIZE, {hash(s) for s in shingles})
+
+
+def _similarity(a: list[int], b: list[int]) -> float:
+    """Bottom-k estimate of the Jaccard similarity of two shingle sets."""
+    common = set(a) & set(b)
+    union = heapq.nsmallest(_SKETCH_SIZE, set(a) | set(b))
+    return sum(h in common for h in union) / len(union)
@@ -8,9 +8,23 @@ so downstream code never needs to know the original file type.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import io
 import logging
+import math
+import mmap
+import multiprocessing
+import os
+import re
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transsum.processing.text_cache import ExtractedTextCache
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +56,142 @@ class Document:
         )
 
 
+class PageStream:
+    """
+    A document whose text is extracted page by page, on demand.
+
+    Iterate it with `async for` to receive the text as soon as each page
+    has been extracted (extraction runs in a worker thread, so the event
+    loop stays free). Concatenating the pieces gives the same text as
+    `DocumentLoader.load`; once they have all been read, `document` holds
+    the equivalent Document. Without `keep_text`, that Document has the
+    counts but no content, and no piece is held once it has been
+    consumed.
+
+    Attributes:
+        filename:  Original filename.
+        file_type: File extension (e.g. ".pdf").
+        separator: Inserted between consecutive pieces ("\n\n" between
+                   PDF pages, nothing between blocks of a text file).
+        keep_text: Keep the pieces to fill `document.content`.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        file_type: str,
+        pages: Iterator[str],
+        separator: str = "\n\n",
+        keep_text: bool = True,
+    ) -> None:
+        self.filename = filename
+        self.file_type = file_type
+        self.separator = separator
+        self.keep_text = keep_text
+        self._pages = pages
+        self._seen: list[str] = []
+        self._started = False
+        self._document: Document | None = None
+
+    @property
+    def summary_line(self) -> str:
+        """One-line description for CLI output."""
+        if self._document is not None:
+            return self._document.summary_line
+        return f"{self.filename} ({self.file_type}) — streaming"
+
+    @property
+    def document(self) -> Document:
+        """The complete Document, available once every page has been read."""
+        if self._document is None:
+            raise RuntimeError(f"{self.filename} has not been fully read yet.")
+        return self._document
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        if self._started:
+            raise RuntimeError("A PageStream can only be read once.")
+        self._started = True
+        stats = _TextStats()
+        first = True
+        pending: asyncio.Future | None = None
+        try:
+            while True:
+                # Shielded, so a cancelled read still knows when the
+                # worker thread has finished with the page iterator
+                pending = asyncio.ensure_future(asyncio.to_thread(next, self._pages, None))
+                if (page := await asyncio.shield(pending)) is None:
+                    break
+                piece = page if first else self.separator + page
+                first = False
+                stats.feed(piece)
+                if self.keep_text:
+                    self._seen.append(piece)
+                yield piece
+        finally:
+            # Closing the iterator stops extraction and shuts down its
+            # process pool when the stream is abandoned part-way
+            if pending is not None and not pending.done():
+                loop = asyncio.get_running_loop()
+                pending.add_done_callback(
+                    lambda _: loop.run_in_executor(None, self._close_pages)
+                )
+            else:
+                await asyncio.to_thread(self._close_pages)
+
+        if not stats.char_count:
+            raise ValueError(f"File is empty after extraction: {self.filename}")
+        content = "".join(self._seen).strip()
+        self._seen = []
+        self._document = Document(
+            content=content,
+            filename=self.filename,
+            file_type=self.file_type,
+            char_count=stats.char_count,
+            word_count=stats.word_count,
+        )
+        logger.info("Streamed: %s", self._document.summary_line)
+
+    def _close_pages(self) -> None:
+        close = getattr(self._pages, "close", None)
+        if close is not None:
+            close()
+
+
+class _TextStats:
+    """
+    Running character and word counts over text fed piece by piece.
+
+    Counts match `len(text.strip())` and `len(text.split())` for the
+    concatenated pieces, without building the stripped copy or the list
+    of words — the word list alone is several times the size of the text.
+    """
+
+    def __init__(self) -> None:
+        self._chars = 0          # since the first non-whitespace character
+        self._trailing = 0       # length of the whitespace run at the end
+        self._in_word = False    # the text so far ends inside a word
+        self.word_count = 0
+
+    @property
+    def char_count(self) -> int:
+        return self._chars - self._trailing
+
+    def feed(self, piece: str) -> None:
+        if not self._chars:
+            piece = piece.lstrip()
+        # Split in bounded slices, so no temporary list grows with the input
+        for start in range(0, len(piece), _STATS_SLICE):
+            part = piece[start:start + _STATS_SLICE]
+            words = len(part.split())
+            if self._in_word and not part[0].isspace():
+                words -= 1       # a word straddling the previous slice
+            self.word_count += words
+            self._in_word = not part[-1].isspace()
+            tail = len(part) - len(part.rstrip())
+            self._trailing = self._trailing + tail if tail == len(part) else tail
+            self._chars += len(part)
+
+
 # ── Format Registry ────────────────────────────────────────────────────────
 
 _FORMAT_READERS: dict[str, str] = {
@@ -65,13 +215,39 @@ class DocumentLoader:
 
     # ── Load from File ──────────────────────────────────────────────────
 
+    @staticmethod
+    def _resolve(path: str | Path) -> tuple[Path, str]:
+        """Check that `path` exists and has a supported extension."""
+        path = Path(path).resolve()
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        ext = path.suffix.lower()
+        if ext not in _FORMAT_READERS:
+            supported = ", ".join(sorted(_FORMAT_READERS))
+            raise ValueError(
+                f"Unsupported file type '{ext}'. Supported: {supported}"
+            )
+        return path, ext
+
     @classmethod
-    def load(cls, path: str | Path) -> Document:
+    def load(
+        cls,
+        path: str | Path,
+        *,
+        pdf_workers: int = 1,
+        text_cache: ExtractedTextCache | None = None,
+    ) -> Document:
         """
         Load a document from a file path.
 
         Args:
-            path: Absolute or relative path to the file.
+            path:        Absolute or relative path to the file.
+            pdf_workers: Processes for PDF text extraction (0 = one per
+                         CPU, 1 = serial).
+            text_cache:  Optional cache of extracted PDF text; an unchanged
+                         file is read back instead of re-extracted.
 
         Returns:
             A populated Document.
@@ -80,34 +256,69 @@ class DocumentLoader:
             FileNotFoundError: If the path doesn't exist.
             ValueError: If the format is unsupported or the file is empty.
         """
-        path = Path(path).resolve()
-
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        ext = path.suffix.lower()
-        if ext not in _FORMAT_READERS:
-            supported = ", ".join(sorted(_FORMAT_READERS))
-            raise ValueError(
-                f"Unsupported file type '{ext}'. Supported: {supported}"
-            )
+        path, ext = cls._resolve(path)
 
-        reader = getattr(cls, _FORMAT_READERS[ext])
-        content: str = reader(path).strip()
+        if ext == ".pdf":
+            content = cls._read_pdf(path, pdf_workers, text_cache).strip()
+        else:
+            reader = getattr(cls, _FORMAT_READERS[ext])
+            content = reader(path).strip()
 
         if not content:
             raise ValueError(f"File is empty after extraction: {path.name}")
 
+        stats = _TextStats()
+        stats.feed(content)
         doc = Document(
             content=content,
             filename=path.name,
             file_type=ext,
             char_count=len(content),
-            word_count=len(content.split()),
+            word_count=stats.word_count,
         )
         logger.info("Loaded: %s", doc.summary_line)
         return doc
 
+    @classmethod
+    def open(
+        cls,
+        path: str | Path,
+        *,
+        pdf_workers: int = 1,
+        text_cache: ExtractedTextCache | None = None,
+        keep_text: bool = True,
+    ) -> PageStream:
+        """
+        Open a document for page-by-page streaming.
+
+        PDFs are extracted one page at a time as the stream is read, so a
+        pipeline can start on the first pages while later ones are still
+        being parsed. Plain-text formats are decoded block by block from a
+        memory map, so even a multi-GB log export is chunked and mapped
+        long before it has been decoded in full.
+
+        Args:
+            path:        Absolute or relative path to the file.
+            pdf_workers: Processes for PDF text extraction (0 = one per
+                         CPU, 1 = serial). Pages still arrive in order.
+            text_cache:  Optional cache of extracted PDF text; on a hit the
+                         cached pages arrive at once.
+            keep_text:   Keep the text for the stream's `document`; pass
+                         False when only its counts are needed.
+
+        Raises:
+            FileNotFoundError: If the path doesn't exist.
+            ValueError: If the format is unsupported (or, while reading,
+                        if the file turns out to be empty).
+        """
+        path, ext = cls._resolve(path)
+        if ext == ".pdf":
+            pages = cls._pdf_pages(path, pdf_workers, text_cache)
+            return PageStream(path.name, ext, pages, keep_text=keep_text)
+        return PageStream(
+            path.name, ext, _iter_text_blocks(path), separator="", keep_text=keep_text,
+        )
+
     # ── Load from String ────────────────────────────────────────────────
 
     @classmethod
@@ -121,24 +332,91 @@ class DocumentLoader:
         if not content:
             raise ValueError("Input text is empty.")
 
+        stats = _TextStats()
+        stats.feed(content)
         return Document(
             content=content,
             filename=filename,
             file_type=".txt",
             char_count=len(content),
-            word_count=len(content.split()),
+            word_count=stats.word_count,
         )
 
     # ── Format-Specific Readers ─────────────────────────────────────────
 
     @staticmethod
     def _read_text(path: Path) -> str:
-        """Read any plain-text format."""
-        return path.read_text(encoding="utf-8", errors="replace")
+        """
+        Read any plain-text format.
+
+        The file is decoded straight out of a memory map: no intermediate
+        bytes copy, and ASCII whitespace at either end is trimmed before
+        decoding so the caller's strip() rarely has to copy the result.
+        Newlines are normalised to "\n", as with universal-newline reads;
+        only files containing "\r" are decoded block by block for that,
+        so the result is never copied to normalise it.
+        """
+        with open(path, "rb") as fh:
+            if not os.fstat(fh.fileno()).st_size:
+                return ""
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                found = _NON_SPACE.search(mm)
+                if found is None:
+                    return ""
+                start, end = found.start(), len(mm)
+                while mm[end - 1] in _SPACE_BYTES:
+                    end -= 1
+                if mm.find(b"\r", start, end) != -1:
+                    return "".join(_decode_blocks(mm, start, end))
+                with memoryview(mm) as view, view[start:end] as body:
+                    return str(body, "utf-8", "replace")
+
+    @classmethod
+    def _read_pdf(
+        cls,
+        path: Path,
+        workers: int = 1,
+        text_cache: ExtractedTextCache | None = None,
+    ) -> str:
+        """Extract text from all pages of a PDF (the pages `open` streams, joined)."""
+        return "\n\n".join(cls._pdf_pages(path, workers, text_cache))
+
+    @classmethod
+    def _pdf_pages(
+        cls,
+        path: Path,
+        workers: int,
+        text_cache: ExtractedTextCache | None,
+    ) -> Iterator[str]:
+        """PDF page texts, freshly extracted or read back from `text_cache`."""
+        if text_cache is None:
+            yield from cls._iter_pdf_pages(path, workers)
+            return
+
+        key = text_cache.key_for(path)
+        cached = text_cache.get_pages(key)
+        if cached is not None:
+            logger.info("Extracted text cache hit: %s", path.name)
+            yield from cached
+            return
+
+        pages: list[str] = []
+        for page in cls._iter_pdf_pages(path, workers):
+            pages.append(page)
+            yield page
+        # Only reached once every page was extracted
+        text_cache.put_pages(key, pages)
 
     @staticmethod
-    def _read_pdf(path: Path) -> str:
-        """Extract text from all pages of a PDF."""
+    def _iter_pdf_pages(path: Path, workers: int = 1) -> Iterator[str]:
+        """
+        Yield the text of each PDF page in order, extracting lazily.
+
+        pypdf extraction is pure Python and CPU-bound, so with more than
+        one worker the page range is split into batches extracted by a
+        process pool. Small files stay serial: starting the pool would
+        cost more than it saves.
+        """
         try:
             from pypdf import PdfReader
         except ImportError:
@@ -148,5 +426,88 @@ class DocumentLoader:
             )
 
         reader = PdfReader(str(path))
-        pages = [page.extract_text() or "" for page in reader.pages]
-        return "\n\n".join(pages)
\ No newline at end of file
+        count = len(reader.pages)
+        workers = min(workers or os.cpu_count() or 1, count)
+        if workers <= 1 or count < _PARALLEL_MIN_PAGES:
+            for page in reader.pages:
+                yield page.extract_text() or ""
+            return
+
+        # Several batches per worker keeps the load even and lets the
+        # first pages reach a streaming consumer early
+        size = math.ceil(count / (workers * 4))
+        logger.info("Extracting %d PDF pages with %d processes", count, workers)
+        # Spawned, not forked: streaming runs this from a worker thread
+        pool = ProcessPoolExecutor(
+            workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pdf_worker,
+            initargs=(str(path),),
+        )
+        try:
+            batches = [
+                pool.submit(_extract_pages, start, min(start + size, count))
+                for start in range(0, count, size)
+            ]
+            for batch in batches:
+                yield from batch.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
+# ── Plain-Text Decoding ─────────────────────────────────────────────────────
+
+_TEXT_BLOCK = 1 << 20     # bytes decoded per streamed block
+_STATS_SLICE = 1 << 16    # characters counted per split() in _TextStats
+
+_NON_SPACE = re.compile(rb"\S")
+_SPACE_BYTES = frozenset(b" \t\n\r\f\v")
+
+
+def _iter_text_blocks(path: Path) -> Iterator[str]:
+    """
+    Yield a UTF-8 file's text block by block, decoding from a memory map.
+
+    The incremental decoders carry a multi-byte character or a "\r\n"
+    that straddles two blocks over to the next one, so the blocks
+    concatenate to exactly what `_read_text` returns (before trimming).
+    """
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _decode_blocks(mm, 0, size)
+
+
+def _decode_blocks(mm: mmap.mmap, start: int, end: int) -> Iterator[str]:
+    """Decode mm[start:end] as UTF-8, block by block, with universal newlines."""
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True,
+    )
+    with memoryview(mm) as view:
+        for pos in range(start, end, _TEXT_BLOCK):
+            with view[pos:min(pos + _TEXT_BLOCK, end)] as block:
+                if text := decoder.decode(block):
+                    yield text
+    if tail := decoder.decode(b"", final=True):
+        yield tail
+
+
+# ── Parallel PDF Extraction ────────────────────────────────────────────────
+
+# Below this many pages, extraction stays in-process
+_PARALLEL_MIN_PAGES = 16
+
+_worker_reader = None   # each pool process opens its own PdfReader
+
+
+def _init_pdf_worker(path: str) -> None:
+    global _worker_reader
+    from pypdf import PdfReader
+    _worker_reader = PdfReader(path)
+
+
+def _extract_pages(start: int, stop: int) -> list[str]:
+    """Extract pages [start, stop) in a pool process."""
+    return [_worker_reader.pages[i].extract_text() or "" for i in range(start, stop)]
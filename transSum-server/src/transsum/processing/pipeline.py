@@ -3,25 +3,45 @@ Processing pipeline — orchestrates the full document-to-output flow.
 
 Short documents:  Single LLM call (fast path).
 Long documents:   Map-Reduce pattern:
-                    1. MAP   — process each chunk independently
-                    2. REDUCE — merge partial results into one coherent output
+                    1. MAP   — process each chunk independently, with up to
+                               `map_concurrency` LLM calls in flight
+                    2. REDUCE — merge partial results into one coherent output,
+                               either in one call or as a token-budgeted tree
+                               that starts merging while MAP is still running;
+                               translations can instead be stitched locally
+                               on their chunk overlaps
 
 Supports both summarisation and translation tasks.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from collections.abc import Callable
-from typing import AsyncIterator
+from typing import TYPE_CHECKING, Literal
 
 from mcp.server.fastmcp import Context
 
-from transsum.models.base import BaseModelAdapter, ModelResponse
-from transsum.processing.chunker import Chunk, TextChunker
-from transsum.processing.loader import Document
+from transsum.models.base import BaseModelAdapter, ModelResponse, add_usage, streamed_by
+from transsum.models.cache import ResponseCache
+from transsum.processing.chunker import ChunkSpan, TextChunker, create_chunker
+from transsum.processing.compress import ExtractiveCompressor, create_compressor
+from transsum.processing.dedupe import BoilerplateFilter, ChunkDeduplicator
+from transsum.processing.loader import Document, PageStream
+from transsum.processing.reducer import TreeReducer
+from transsum.processing.stitch import Overlap, SeamAligner, create_aligner
+from transsum.processing.timings import CallTiming, PipelineTimings
+from transsum.processing.tokens import HeuristicEstimator, TokenEstimator, create_estimator
+
+if TYPE_CHECKING:
+    from transsum.config import Settings
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +65,35 @@ class PipelineResult:
     model: str
     provider: str
     usage: dict = field(default_factory=dict)
+    chunks_reused: int = 0
+    timings: PipelineTimings = field(default_factory=PipelineTimings)
+
+
+@dataclass
+class PipelineEvent:
+    """
+    One step of a pipeline run, as yielded by `stream_events`.
+
+    Attributes:
+        kind:      "chunks" (document split), "mapped" (a chunk finished
+                   MAP), "reduce" (final merge starting), "token" (a piece
+                   of final output) or "done" (run finished).
+        text:      Chunk output for "mapped", output text for "token".
+        index:     One-based chunk position for "mapped".
+        completed: Chunks finished so far ("mapped"; for "chunks", how
+                   many had already finished when the count became known).
+        total:     Chunk count ("chunks", "mapped", "done") or number of
+                   sections being merged ("reduce"). For a streamed
+                   document, "mapped" events carry 0 until the count is
+                   known, and "chunks" arrives once the input has ended.
+        result:    The PipelineResult, for "done" only.
+    """
+    kind: Literal["chunks", "mapped", "reduce", "token", "done"]
+    text: str = ""
+    index: int = 0
+    completed: int = 0
+    total: int = 0
+    result: PipelineResult | None = None
 
 
 # ── Prompt Templates ────────────────────────────────────────────────────────
@@ -62,10 +111,13 @@ _SYSTEM_PROMPTS = {
     ),
 }
 
+# Chunk prompts are (shared instructions, per-chunk part). The shared part
+# comes first and is identical for every chunk of a run, so backends can
+# cache it as a prompt prefix.
 _CHUNK_SUMMARIZE = (
-    "Summarize the following text section (chunk {idx} of {total}).\n"
-    "Focus on key points and important details.\n\n"
-    "---\n{text}\n---"
+    "Summarize the text section below.\n"
+    "Focus on key points and important details.\n\n",
+    "Section (chunk {idx}{of_total}):\n---\n{text}\n---",
 )
 
 _FINAL_SUMMARIZE = (
@@ -76,10 +128,17 @@ _FINAL_SUMMARIZE = (
     "{combined}"
 )
 
+_PARTIAL_SUMMARIZE = (
+    "Below are summaries of consecutive sections of one part of a document "
+    'titled "{filename}".\n\n'
+    "Combine them into ONE summary of this part. Keep key facts, figures "
+    "and conclusions; eliminate redundancy.\n\n"
+    "{combined}"
+)
+
 _CHUNK_TRANSLATE = (
-    "Translate the following text into **{language}** "
-    "(chunk {idx} of {total}).\n\n"
-    "---\n{text}\n---"
+    "Translate the text section below into **{language}**.\n\n",
+    "Section (chunk {idx}{of_total}):\n---\n{text}\n---",
 )
 
 _FINAL_TRANSLATE = (
@@ -89,6 +148,52 @@ _FINAL_TRANSLATE = (
     "{combined}"
 )
 
+_SEAM_TRANSLATE = (
+    "Two consecutive sections translated into **{language}** overlap: both "
+    "translate the original passage below.\n\n"
+    "Original:\n---\n{overlap}\n---\n\n"
+    "End of the first section:\n---\n{left}\n---\n\n"
+    "Start of the second section:\n---\n{right}\n---\n\n"
+    "Join the end of the first section to the start of the second as one "
+    "continuous text, keeping each sentence exactly once. "
+    "Output ONLY the joined text."
+)
+
+_SEAM_JOIN = (
+    "Two consecutive sections translated into **{language}** were cut from "
+    "the original in the middle of a sentence.\n\n"
+    "End of the first section:\n---\n{left}\n---\n\n"
+    "Start of the second section:\n---\n{right}\n---\n\n"
+    "Join the end of the first section to the start of the second as one "
+    "continuous text. Output ONLY the joined text."
+)
+
+
+async def _iterate(items: Iterable[ChunkSpan]) -> AsyncIterator[ChunkSpan]:
+    for item in items:
+        yield item
+
+
+async def _prepend(
+    items: Iterable[ChunkSpan], rest: AsyncIterable[ChunkSpan],
+) -> AsyncIterator[ChunkSpan]:
+    for item in items:
+        yield item
+    async for item in rest:
+        yield item
+
+
+def _call_timing(
+    kind: str, index: int, queued: float, latency: float, resp: ModelResponse,
+) -> CallTiming:
+    return CallTiming(
+        kind, index, queued, latency,
+        prompt_tokens=resp.usage.get("prompt_tokens", 0),
+        completion_tokens=resp.usage.get("completion_tokens", 0),
+        provider=resp.provider,
+        model=resp.model,
+    )
+
 
 # ── Pipeline ────────────────────────────────────────────────────────────────
 
@@ -101,25 +206,108 @@ class ProcessingPipeline:
         chunker  = TextChunker(settings.chunk_size, settings.chunk_overlap)
         pipeline = ProcessingPipeline(adapter, chunker)
         result   = await pipeline.run(document, TaskType.SUMMARIZE)
+
+        # or, with every knob taken from Settings:
+        pipeline = ProcessingPipeline.from_settings(settings, adapter)
+
+    Args:
+        adapter:             Model backend used for every LLM call.
+        chunker:             Splits document content into chunks.
+        map_concurrency:     Maximum LLM calls in flight during MAP (default 1).
+        reduce_strategy:     "single" merges all partials in one call; "tree"
+                             merges neighbours hierarchically (summaries only).
+        reduce_token_budget: Approximate input tokens per tree-reduce merge.
+        token_estimator:     Measures partials against the reduce budget
+                             (default HeuristicEstimator).
+        map_store:           Optional store of per-chunk MAP results; chunks
+                             whose text is unchanged since an earlier run
+                             reuse their stored result instead of an LLM call.
+        strip_boilerplate:   Drop lines repeated across the pages of a
+                             streamed PDF before chunking (summaries only).
+                             Only a PageStream has page boundaries, so a
+                             loaded Document is left as it is.
+        dedupe_similarity:   Reuse an earlier chunk's MAP result for exact
+                             copies of it and, in summaries, for chunks at
+                             least this similar to it; None disables.
+        compressor:          Optional extractive pre-pass that shrinks each
+                             chunk of a multi-chunk summary before MAP.
+        seam_aligner:        Stitch translated chunks on their overlaps instead
+                             of a final LLM pass; only seams it can't align
+                             are merged by the model, one small window each.
     """
 
     def __init__(
         self,
         adapter: BaseModelAdapter,
         chunker: TextChunker,
+        *,
+        map_concurrency: int = 1,
+        reduce_strategy: Literal["single", "tree"] = "single",
+        reduce_token_budget: int = 8000,
+        token_estimator: TokenEstimator | None = None,
+        map_store: ResponseCache | None = None,
+        strip_boilerplate: bool = False,
+        dedupe_similarity: float | None = None,
+        compressor: ExtractiveCompressor | None = None,
+        seam_aligner: SeamAligner | None = None,
     ) -> None:
+        if map_concurrency < 1:
+            raise ValueError(f"map_concurrency must be >= 1 (got {map_concurrency}).")
+        if reduce_strategy not in ("single", "tree"):
+            raise ValueError(f"Unknown reduce strategy: {reduce_strategy!r}")
         self._adapter = adapter
         self._chunker = chunker
+        self._map_concurrency = map_concurrency
+        self._reduce_strategy = reduce_strategy
+        self._reduce_budget = reduce_token_budget
+        self._estimator = token_estimator or HeuristicEstimator()
+        self._map_store = map_store
+        self._strip_boilerplate = strip_boilerplate
+        self._dedupe_similarity = dedupe_similarity
+        self._compressor = compressor
+        self._seam_aligner = seam_aligner
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, adapter: BaseModelAdapter,
+    ) -> ProcessingPipeline:
+        """Build a pipeline (chunker, reduce and MAP store) from configuration."""
+        map_store = None
+        if settings.map_store_enabled:
+            map_store = ResponseCache(
+                settings.map_store_path,
+                max_bytes=settings.cache_max_mb * 1024 * 1024,
+                ttl=settings.cache_ttl,
+            )
+        return cls(
+            adapter,
+            create_chunker(settings),
+            map_concurrency=settings.map_concurrency,
+            reduce_strategy=settings.reduce_strategy,
+            reduce_token_budget=settings.reduce_token_budget,
+            token_estimator=create_estimator(settings),
+            map_store=map_store,
+            strip_boilerplate=settings.strip_boilerplate,
+            dedupe_similarity=settings.dedupe_similarity if settings.dedupe_chunks else None,
+            compressor=create_compressor(settings),
+            seam_aligner=create_aligner(settings),
+        )
+
+    async def close(self) -> None:
+        """Release the MAP result store (the adapter is owned by the caller)."""
+        if self._map_store is not None:
+            self._map_store.close()
 
     # ── Main Entry Point ────────────────────────────────────────────────
 
     async def run(
         self,
-        document: Document,
+        document: Document | PageStream,
         task: TaskType,
         *,
         language: str = "English",
         temperature: float = 0.3,
+        map_concurrency: int | None = None,
         ctx: Context | None = None,
         on_progress: Callable[[str], None] | None = None,
     ) -> PipelineResult:
@@ -127,166 +315,666 @@ class ProcessingPipeline:
         Execute the full pipeline.
 
         Args:
-            document:    Loaded document to process.
-            task:        SUMMARIZE or TRANSLATE.
-            language:    Target language (only used for TRANSLATE).
-            temperature: LLM sampling temperature.
-            ctx:         Optional MCP Context for progress/log notifications.
-            on_progress: Optional callback receiving a status message string.
+            document:        Loaded document to process, or a PageStream
+                             from `DocumentLoader.open` to start mapping
+                             while later pages are still being extracted.
+            task:            SUMMARIZE or TRANSLATE.
+            language:        Target language (only used for TRANSLATE).
+            temperature:     LLM sampling temperature.
+            map_concurrency: Override the pipeline's MAP-phase concurrency
+                             for this call.
+            ctx:             Optional MCP Context for progress/log notifications.
+            on_progress:     Optional callback receiving a status message string.
 
         Returns:
             PipelineResult with the final output and metadata.
         """
-        chunks = self._chunker.chunk(document.content)
-        system = _SYSTEM_PROMPTS[task]
-        total = len(chunks)
-
-        logger.info(
-            "Pipeline start: task=%s, file=%s, chunks=%d",
-            task.value, document.filename, total,
-        )
-
-        # Helper to emit status to both MCP and CLI callers
-        def _notify(msg: str) -> None:
-            if on_progress:
-                on_progress(msg)
+        result: PipelineResult | None = None
+        timings = PipelineTimings()
+        async with aclosing(self._events(
+            document, task, language, temperature, map_concurrency, timings,
+            stream_final=False,
+        )) as events:
+            async for event in events:
+                started = time.perf_counter()
+                await self._report(event, ctx, on_progress)
+                timings.add("notify", time.perf_counter() - started)
+                if event.kind == "done":
+                    result = event.result
+        return result
+
+    # ── Streaming ───────────────────────────────────────────────────────
+
+    async def stream_events(
+        self,
+        document: Document | PageStream,
+        task: TaskType,
+        *,
+        language: str = "English",
+        temperature: float = 0.3,
+        map_concurrency: int | None = None,
+        ctx: Context | None = None,
+    ) -> AsyncIterator[PipelineEvent]:
+        """
+        Run the pipeline, yielding progress events and streamed output.
+
+        MAP completions arrive as "mapped" events while the phase runs;
+        the final LLM call (the single chunk, or the REDUCE merge) is
+        streamed token by token as "token" events (a stitched translation
+        arrives piece by piece as its seams are settled). The closing "done"
+        event carries a PipelineResult whose usage covers the non-streamed
+        calls only, since streaming backends don't report token counts.
+        """
+        timings = PipelineTimings()
+        async with aclosing(self._events(
+            document, task, language, temperature, map_concurrency, timings,
+            stream_final=True,
+        )) as events:
+            async for event in events:
+                started = time.perf_counter()
+                await self._report(event, ctx, None)
+                timings.add("notify", time.perf_counter() - started)
+                yield event
 
-        # ── Fast path: single chunk ────────────────────────────────────
-        if total == 1:
-            if ctx:
-                await ctx.report_progress(0, 1)
-                await ctx.info("Processing single chunk...")
-            _notify("Processing with LLM…")
-            prompt = self._make_chunk_prompt(task, chunks[0], 1, 1, language)
-            resp = await self._adapter.generate(
-                prompt, system=system, temperature=temperature,
-            )
-            if ctx:
-                await ctx.report_progress(1, 1)
-                await ctx.info("Complete")
-            _notify("Complete")
-            return PipelineResult(
-                task=task,
-                output=resp.text,
-                document=document,
-                chunks_processed=1,
-                model=resp.model,
-                provider=resp.provider,
-                usage=resp.usage,
-            )
+    async def stream_run(
+        self,
+        document: Document | PageStream,
+        task: TaskType,
+        *,
+        language: str = "English",
+        temperature: float = 0.3,
+    ) -> AsyncIterator[str]:
+        """Stream output tokens only (see stream_events for progress too)."""
+        async with aclosing(self.stream_events(
+            document, task, language=language, temperature=temperature,
+        )) as events:
+            async for event in events:
+                if event.kind == "token":
+                    yield event.text
 
-        # ── MAP phase: process each chunk ──────────────────────────────
-        total_steps = total + 1  # N chunks + 1 reduce step
-        partial_results: list[str] = []
-        total_usage: dict = {"prompt_tokens": 0, "completion_tokens": 0}
-
-        if ctx:
-            await ctx.report_progress(0, total_steps)
-            await ctx.info(f"Document split into {total} chunks")
-        _notify(f"Document split into {total} chunks")
-
-        for i, chunk in enumerate(chunks, 1):
-            logger.debug("Processing chunk %d/%d (%d chars)…", i, total, chunk.char_count)
-            _notify(f"Processing chunk {i}/{total}…")
-            prompt = self._make_chunk_prompt(task, chunk, i, total, language)
-            resp = await self._adapter.generate(
-                prompt, system=system, temperature=temperature,
-            )
-            partial_results.append(resp.text)
-            for k in total_usage:
-                total_usage[k] += resp.usage.get(k, 0)
-            if ctx:
-                await ctx.report_progress(i, total_steps)
-                await ctx.info(f"Processed chunk {i}/{total}")
-            _notify(f"Processed chunk {i}/{total}")
+    # ── Orchestration ───────────────────────────────────────────────────
 
-        # ── REDUCE phase: merge partials ───────────────────────────────
-        if ctx:
-            await ctx.info(f"Merging {total} sections into final output...")
-        _notify(f"Merging {total} sections into final output…")
+    async def _events(
+        self,
+        document: Document | PageStream,
+        task: TaskType,
+        language: str,
+        temperature: float,
+        map_concurrency: int | None,
+        timings: PipelineTimings,
+        *,
+        stream_final: bool,
+    ) -> AsyncIterator[PipelineEvent]:
+        """Shared implementation behind run() and stream_events()."""
+        clock = time.perf_counter
+        run_started = clock()
+        system = _SYSTEM_PROMPTS[task]
+        strip = self._strip_boilerplate and task == TaskType.SUMMARIZE
+        chunks, total = self._chunk_source(document, timings, strip)
 
-        combined = "\n\n---\n\n".join(
-            f"**Section {i}:**\n{text}"
-            for i, text in enumerate(partial_results, 1)
+        logger.info(
+            "Pipeline start: task=%s, file=%s, chunks=%s",
+            task.value, document.filename, total if total is not None else "streaming",
         )
+        async with aclosing(chunks):
+            # Hold the first chunk back until a second arrives: a document
+            # that fits in one chunk skips MAP/REDUCE entirely
+            first = await anext(chunks, None)
+            if first is None:
+                # Everything was stripped (e.g. as boilerplate) before chunking
+                raise ValueError(f"File is empty after extraction: {document.filename}")
+            second = await anext(chunks, None)
+            if second is None:
+                total = 1
+            if total is not None:
+                yield PipelineEvent("chunks", total=total)
+
+            # ── Fast path: single chunk ────────────────────────────────
+            if total == 1:
+                prompt, shared = self._make_chunk_prompt(task, first.text, 1, 1, language)
+                started = clock()
+                if stream_final:
+                    streamed_by.set(None)
+                    pieces: list[str] = []
+                    async for token in self._adapter.stream(
+                        prompt, system=system, temperature=temperature, cache_prefix=shared,
+                    ):
+                        if not pieces:
+                            timings.first_token_s = clock() - run_started
+                        pieces.append(token)
+                        yield PipelineEvent("token", text=token)
+                    resp = self._streamed(pieces)
+                else:
+                    resp = await self._adapter.generate(
+                        prompt, system=system, temperature=temperature, cache_prefix=shared,
+                    )
+                timings.calls.append(_call_timing("map", 1, 0.0, clock() - started, resp))
+                timings.add("map", clock() - started)
+                timings.total_s = clock() - run_started
+                yield PipelineEvent("done", total=1, result=PipelineResult(
+                    task=task,
+                    output=resp.text,
+                    document=self._loaded(document),
+                    chunks_processed=1,
+                    model=resp.model,
+                    provider=resp.provider,
+                    usage=resp.usage,
+                    timings=timings,
+                ))
+                return
+
+            # ── MAP phase: process chunks concurrently ─────────────────
+            partial_results: dict[int, str] = {}
+            total_usage: dict = {"prompt_tokens": 0, "completion_tokens": 0}
+            semaphore = asyncio.Semaphore(map_concurrency or self._map_concurrency)
+            last: ModelResponse | None = None
+            reused = 0
+
+            # Stitching needs the source overlap between neighbouring chunks
+            stitch = self._seam_aligner is not None and task == TaskType.TRANSLATE
+            overlaps: dict[int, Overlap] = {}
+
+            # Tree-reduce merges neighbours while MAP is still running
+            reducer: TreeReducer | None = None
+            if self._reduce_strategy == "tree" and task == TaskType.SUMMARIZE:
+                async def _merge(texts: list[str]) -> ModelResponse:
+                    prompt = _PARTIAL_SUMMARIZE.format(
+                        filename=document.filename, combined=self._combine(texts),
+                    )
+                    waited = clock()
+                    # MAP calls are only started as slots free up, so a merge
+                    # queues behind at most one of them, not the whole document
+                    async with semaphore:
+                        started = clock()
+                        resp = await self._adapter.generate(
+                            prompt, system=system, temperature=temperature,
+                        )
+                    timings.calls.append(_call_timing(
+                        "merge", 0, started - waited, clock() - started, resp,
+                    ))
+                    return resp
+
+                reducer = TreeReducer(
+                    total, _merge, self._reduce_budget, self._estimator.count,
+                )
+
+            async def _positions():
+                """Number chunks as they arrive; settle the total at the end."""
+                nonlocal total
+                pos = 0
+                prev: ChunkSpan | None = None
+                async with aclosing(_prepend((first, second), chunks)) as ordered:
+                    async for chunk in ordered:
+                        if stitch and prev is not None:
+                            overlap = Overlap.between(prev.text, chunk.text)
+                            if not overlap.text:
+                                overlap.separator = prev.gap_to(chunk)
+                            overlaps[pos] = overlap
+                        yield pos, chunk
+                        prev = chunk
+                        pos += 1
+                if total is None:
+                    total = pos
+                    if reducer:
+                        reducer.set_total(pos)
+
+            try:
+                done = 0
+                announced = total is not None
+                map_started = clock()
+                async with aclosing(self._map_chunks(
+                    _positions(), total, task, system, language, temperature, semaphore,
+                    timings,
+                )) as results:
+                    async for idx, resp, hit in results:
+                        partial_results[idx] = resp.text
+                        last = resp
+                        reused += hit
+                        if reducer:
+                            reducer.add(idx, resp.text)
+                        add_usage(total_usage, resp.usage)
+                        done += 1
+                        if not announced and total is not None:
+                            yield PipelineEvent("chunks", completed=done - 1, total=total)
+                            announced = True
+                        yield PipelineEvent(
+                            "mapped", text=resp.text, index=idx + 1,
+                            completed=done, total=total or 0,
+                        )
+                if not announced:
+                    yield PipelineEvent("chunks", completed=done, total=total)
+                timings.add("map", clock() - map_started)
+
+                reduce_started = clock()
+                final_group = (
+                    await reducer.result() if reducer
+                    else [partial_results[i] for i in range(total)]
+                )
+            finally:
+                if reducer:
+                    await reducer.aclose()
+
+        if reused:
+            logger.info("Reused %d/%d stored or duplicate chunk results", reused, total)
+        if reducer:
+            add_usage(total_usage, reducer.usage)
+            logger.debug("Tree reduce used %d intermediate merges", reducer.merges)
 
-        if task == TaskType.SUMMARIZE:
-            merge_prompt = _FINAL_SUMMARIZE.format(
-                filename=document.filename, combined=combined,
-            )
+        # ── REDUCE phase: merge partials ───────────────────────────────
+        yield PipelineEvent("reduce", total=len(final_group))
+
+        if stitch:
+            pieces = []
+            async with aclosing(self._stitch(
+                final_group, overlaps, system, language, temperature, semaphore,
+                timings, total_usage,
+            )) as stitched:
+                async for piece in stitched:
+                    if stream_final:
+                        if not pieces:
+                            timings.first_token_s = clock() - run_started
+                        yield PipelineEvent("token", text=piece)
+                    pieces.append(piece)
+            final = ModelResponse(text="".join(pieces), model=last.model, provider=last.provider)
         else:
-            merge_prompt = _FINAL_TRANSLATE.format(combined=combined)
-
-        logger.debug("Running reduce step…")
-        final = await self._adapter.generate(
-            merge_prompt, system=system, temperature=temperature,
-        )
-        for k in total_usage:
-            total_usage[k] += final.usage.get(k, 0)
-
-        if ctx:
-            await ctx.report_progress(total_steps, total_steps)
-            await ctx.info("Complete")
+            combined = self._combine(final_group)
+
+            if task == TaskType.SUMMARIZE:
+                merge_prompt = _FINAL_SUMMARIZE.format(
+                    filename=document.filename, combined=combined,
+                )
+            else:
+                merge_prompt = _FINAL_TRANSLATE.format(combined=combined)
+
+            logger.debug("Running reduce step…")
+            started = clock()
+            if stream_final:
+                streamed_by.set(None)
+                pieces = []
+                async for token in self._adapter.stream(
+                    merge_prompt, system=system, temperature=temperature,
+                ):
+                    if not pieces:
+                        timings.first_token_s = clock() - run_started
+                    pieces.append(token)
+                    yield PipelineEvent("token", text=token)
+                final = self._streamed(pieces)
+            else:
+                final = await self._adapter.generate(
+                    merge_prompt, system=system, temperature=temperature,
+                )
+            add_usage(total_usage, final.usage)
+            timings.calls.append(_call_timing("reduce", 0, 0.0, clock() - started, final))
+        # Includes waiting for the last tree merges, which overlap MAP
+        timings.add("reduce", clock() - reduce_started)
+        timings.total_s = clock() - run_started
 
         logger.info(
-            "Pipeline complete: %d chunks, %d total tokens",
-            total, sum(total_usage.values()),
+            "Pipeline complete: %d chunks, %d prompt + %d completion tokens",
+            total, total_usage["prompt_tokens"], total_usage["completion_tokens"],
         )
 
-        return PipelineResult(
+        yield PipelineEvent("done", total=total, result=PipelineResult(
             task=task,
             output=final.text,
-            document=document,
+            document=self._loaded(document),
             chunks_processed=total,
             model=final.model,
             provider=final.provider,
             usage=total_usage,
+            chunks_reused=reused,
+            timings=timings,
+        ))
+
+    async def _stitch(
+        self,
+        translations: list[str],
+        overlaps: dict[int, Overlap],
+        system: str,
+        language: str,
+        temperature: float,
+        semaphore: asyncio.Semaphore,
+        timings: PipelineTimings,
+        usage: dict,
+    ) -> AsyncIterator[str]:
+        """
+        Join translated chunks on their overlaps, yielding the output in order.
+
+        Every seam is aligned up front. Seams the aligner can't settle are
+        merged by the model concurrently (gated by `semaphore`), each on
+        a window of a few hundred characters; text is yielded as soon as
+        the seams before it are resolved.
+        """
+        seams = {
+            pos: self._seam_aligner.align(translations[pos - 1], translations[pos], overlap)
+            for pos, overlap in sorted(overlaps.items())
+        }
+
+        async def _merge(pos: int) -> str:
+            seam, overlap = seams[pos], overlaps[pos]
+            prompt = (_SEAM_TRANSLATE if overlap.text else _SEAM_JOIN).format(
+                language=language,
+                overlap=overlap.text,
+                left=translations[pos - 1][seam.left_cut:],
+                right=translations[pos][:seam.right_cut],
+            )
+            waited = time.perf_counter()
+            async with semaphore:
+                started = time.perf_counter()
+                resp = await self._adapter.generate(
+                    prompt, system=system, temperature=temperature,
+                )
+            timings.calls.append(_call_timing(
+                "seam", pos, started - waited, time.perf_counter() - started, resp,
+            ))
+            add_usage(usage, resp.usage)
+            return resp.text.strip()
+
+        merges = {
+            pos: asyncio.create_task(_merge(pos))
+            for pos, seam in seams.items() if seam.joint is None
+        }
+        logger.info(
+            "Stitched %d translation seams locally, %d with the model",
+            len(seams) - len(merges), len(merges),
         )
+        try:
+            for pos, text in enumerate(translations):
+                start = seams[pos].right_cut if pos in seams else 0
+                end = seams[pos + 1].left_cut if pos + 1 in seams else len(text)
+                if text[start:end]:
+                    yield text[start:end]
+                if pos + 1 in seams:
+                    joint = seams[pos + 1].joint
+                    if joint is None:
+                        joint = await merges[pos + 1]
+                    if joint:
+                        yield joint
+        finally:
+            for task in merges.values():
+                task.cancel()
+            await asyncio.gather(*merges.values(), return_exceptions=True)
+
+    def _chunk_source(
+        self, document: Document | PageStream, timings: PipelineTimings, strip: bool,
+    ) -> tuple[AsyncIterator[ChunkSpan], int | None]:
+        """Chunks of `document` as an async iterator, plus the count if known."""
+        if isinstance(document, PageStream):
+            # Only PDF pieces are pages; text files arrive in fixed-size blocks
+            boilerplate = BoilerplateFilter() if strip and document.file_type == ".pdf" else None
+            return self._stream_chunks(document, timings, boilerplate), None
+        started = time.perf_counter()
+        chunks = self._chunker.chunk(document.content)
+        timings.add("chunk", time.perf_counter() - started)
+        return _iterate(chunks), len(chunks)
 
-    # ── Streaming (used by Phase 2 UI later) ───────────────────────────
+    async def _stream_chunks(
+        self,
+        pages: PageStream,
+        timings: PipelineTimings,
+        boilerplate: BoilerplateFilter | None = None,
+    ) -> AsyncIterator[ChunkSpan]:
+        """Chunk a PageStream while its pages are still being extracted."""
+        clock = time.perf_counter
+        stream = self._chunker.stream()
+        # Closed explicitly, so extraction stops as soon as the run does
+        async with aclosing(aiter(pages)) as page_iter:
+            while True:
+                started = clock()
+                page = await anext(page_iter, None)
+                timings.add("load", clock() - started)
+                started = clock()
+                if page is not None:
+                    pieces = boilerplate.feed(page) if boilerplate else [page]
+                else:
+                    pieces = boilerplate.close() if boilerplate else []
+                ready = [chunk for piece in pieces for chunk in stream.feed(piece)]
+                if page is None:
+                    ready += stream.close()
+                timings.add("chunk", clock() - started)
+                for chunk in ready:
+                    yield chunk
+                if page is None:
+                    break
+        if boilerplate and boilerplate.lines_removed:
+            logger.info(
+                "Stripped %d boilerplate lines (%d distinct) from %s",
+                boilerplate.lines_removed, len(boilerplate.boilerplate), pages.filename,
+            )
 
-    async def stream_run(
+    def _streamed(self, pieces: list[str]) -> ModelResponse:
+        """Response for a streamed call, attributed to the backend that served it."""
+        provider, model = streamed_by.get() or (self._adapter.provider, self._adapter.model)
+        return ModelResponse(text="".join(pieces), model=model, provider=provider)
+
+    @staticmethod
+    def _loaded(document: Document | PageStream) -> Document:
+        return document.document if isinstance(document, PageStream) else document
+
+    @staticmethod
+    async def _report(
+        event: PipelineEvent,
+        ctx: Context | None,
+        on_progress: Callable[[str], None] | None,
+    ) -> None:
+        """Translate a pipeline event into MCP notifications and CLI status."""
+        def _notify(msg: str) -> None:
+            if on_progress:
+                on_progress(msg)
+
+        if event.kind == "chunks":
+            if event.total == 1:
+                if ctx:
+                    await ctx.report_progress(0, 1)
+                    await ctx.info("Processing single chunk...")
+                _notify("Processing with LLM…")
+            else:
+                if ctx:
+                    await ctx.report_progress(event.completed, event.total + 1)
+                    await ctx.info(f"Document split into {event.total} chunks")
+                _notify(f"Document split into {event.total} chunks")
+
+        elif event.kind == "mapped":
+            if event.total:
+                msg = f"Processed chunk {event.completed}/{event.total}"
+            else:
+                msg = f"Processed chunk {event.completed}"
+            if ctx:
+                await ctx.report_progress(event.completed, event.total + 1 if event.total else None)
+                await ctx.info(msg)
+            _notify(msg)
+
+        elif event.kind == "reduce":
+            if ctx:
+                await ctx.info(f"Merging {event.total} sections into final output...")
+            _notify(f"Merging {event.total} sections into final output…")
+
+        elif event.kind == "done":
+            steps = 1 if event.total == 1 else event.total + 1
+            if ctx:
+                await ctx.report_progress(steps, steps)
+                await ctx.info("Complete")
+            _notify("Complete")
+
+    # ── MAP Execution ───────────────────────────────────────────────────
+
+    async def _map_chunks(
         self,
-        document: Document,
+        chunks: AsyncIterable[tuple[int, ChunkSpan]],
+        total: int | None,
         task: TaskType,
-        *,
-        language: str = "English",
-        temperature: float = 0.3,
-    ) -> AsyncIterator[str]:
+        system: str,
+        language: str,
+        temperature: float,
+        semaphore: asyncio.Semaphore,
+        timings: PipelineTimings,
+    ) -> AsyncIterator[tuple[int, ModelResponse, bool]]:
         """
-        Stream tokens for single-chunk docs.
-        Falls back to batch + yield for multi-chunk docs.
+        Run the MAP prompt for each (position, chunk) pair, gated by `semaphore`.
+
+        A chunk is taken from `chunks` only once a slot is free for it, so
+        a streamed document is read no further ahead than the calls in
+        flight and other users of `semaphore` (tree merges) wait behind at
+        most one chunk. Yields (chunk position, response, reused) in
+        completion order, so callers can slot results back into chunk
+        order themselves; `reused` marks results served from the MAP store
+        or copied from an earlier duplicate chunk. If the consumer stops
+        early or a call fails, outstanding calls are cancelled.
         """
-        chunks = self._chunker.chunk(document.content)
-        system = _SYSTEM_PROMPTS[task]
+        dedupe: ChunkDeduplicator | None = None
+        if self._dedupe_similarity is not None:
+            # A translation must match its own chunk character for character
+            summarize = task == TaskType.SUMMARIZE
+            dedupe = ChunkDeduplicator(
+                self._dedupe_similarity if summarize else 1.0, normalize=summarize,
+            )
+        originals: dict[int, asyncio.Task] = {}
+        compress = self._compressor is not None and task == TaskType.SUMMARIZE
+        chars_in = chars_out = 0    # chunk text before / after compression, this run
+
+        async def _map_one(
+            pos: int, chunk: ChunkSpan, queued: float,
+        ) -> tuple[int, ModelResponse, bool]:
+            nonlocal chars_in, chars_out
+            # Holds the slot the feeder acquired for it until the call is done
+            try:
+                key = None
+                if self._map_store is not None:
+                    key = self._map_key(task, chunk, system, language, temperature)
+                    hit = await asyncio.to_thread(self._map_store.get, key)
+                    if hit is not None:
+                        return pos, hit, True
+                # Built while holding the slot so at most `map_concurrency`
+                # prompts (each a copy of its chunk) exist at once
+                text = chunk.text
+                if compress:
+                    started = time.perf_counter()
+                    chars_in += len(text)
+                    text = self._compressor.compress(text)
+                    chars_out += len(text)
+                    timings.add("compress", time.perf_counter() - started)
+                prompt, shared = self._make_chunk_prompt(task, text, pos + 1, total, language)
+                logger.debug(
+                    "Processing chunk %d/%s (%d chars)…",
+                    pos + 1, total or "?", chunk.char_count,
+                )
+                started = time.perf_counter()
+                resp = await self._adapter.generate(
+                    prompt, system=system, temperature=temperature, cache_prefix=shared,
+                )
+                timings.calls.append(_call_timing(
+                    "map", pos + 1, queued, time.perf_counter() - started, resp,
+                ))
+            finally:
+                semaphore.release()
+            if key is not None:
+                await asyncio.to_thread(self._map_store.put, key, resp)
+            return pos, resp, False
+
+        async def _copy(pos: int, original: int) -> tuple[int, ModelResponse, bool]:
+            # Shielded: the original's own result is still needed if this is cancelled
+            _, resp, _ = await asyncio.shield(originals[original])
+            return pos, replace(resp, usage={}), True
+
+        finished: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+        tasks: set[asyncio.Task] = set()
+
+        async def _feed() -> None:
+            async for pos, chunk in chunks:
+                original = dedupe.register(pos, chunk.text) if dedupe else None
+                if original is None:
+                    # Wait for a slot before reading on: chunks waiting for
+                    # one would otherwise pile up for the whole document
+                    waited = time.perf_counter()
+                    await semaphore.acquire()
+                    queued = time.perf_counter() - waited
+                    timings.add("queue", queued)
+                    t = asyncio.create_task(_map_one(pos, chunk, queued))
+                    if dedupe:
+                        originals[pos] = t
+                else:
+                    logger.debug(
+                        "Chunk %d repeats chunk %d; reusing its result", pos + 1, original + 1,
+                    )
+                    t = asyncio.create_task(_copy(pos, original))
+                tasks.add(t)
+                t.add_done_callback(finished.put_nowait)
+
+        feeder = asyncio.create_task(_feed())
+        feeder.add_done_callback(finished.put_nowait)
+        try:
+            feeding = True
+            while feeding or tasks:
+                t = await finished.get()
+                if t is feeder:
+                    feeding = False
+                    t.result()  # re-raise chunking / extraction errors
+                else:
+                    tasks.discard(t)
+                    yield t.result()
+            if chars_in:
+                logger.info(
+                    "Extractive pre-pass kept %d of %d chunk characters (%.0f%%)",
+                    chars_out, chars_in, 100 * chars_out / chars_in,
+                )
+        finally:
+            feeder.cancel()
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(feeder, *tasks, return_exceptions=True)
+
+    def _map_key(
+        self,
+        task: TaskType,
+        chunk: ChunkSpan,
+        system: str,
+        language: str,
+        temperature: float,
+    ) -> str:
+        """
+        Identify a chunk's MAP result by content, not position.
 
-        if len(chunks) == 1:
-            prompt = self._make_chunk_prompt(task, chunks[0], 1, 1, language)
-            async for token in self._adapter.stream(
-                prompt, system=system, temperature=temperature,
-            ):
-                yield token
+        The chunk's index and the total chunk count are left out on
+        purpose, so an edit elsewhere in the document doesn't invalidate it.
+        """
+        # Translations depend on the target language, summaries on the pre-pass
+        if task == TaskType.TRANSLATE:
+            variant = language
         else:
-            result = await self.run(
-                document, task, language=language, temperature=temperature,
-            )
-            yield result.output
+            variant = self._compressor.name if self._compressor else ""
+        payload = json.dumps([
+            "map", task.value, variant,
+            self._adapter.provider, self._adapter.model, system, temperature, chunk.text,
+        ], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
     # ── Prompt Construction ─────────────────────────────────────────────
 
+    @staticmethod
+    def _combine(texts: list[str]) -> str:
+        """Join partial results into numbered sections for a merge prompt."""
+        return "\n\n---\n\n".join(
+            f"**Section {i}:**\n{text}"
+            for i, text in enumerate(texts, 1)
+        )
+
     @staticmethod
     def _make_chunk_prompt(
         task: TaskType,
-        chunk: Chunk,
+        text: str,
         idx: int,
-        total: int,
+        total: int | None,
         language: str,
-    ) -> str:
-        """Build the appropriate prompt for a single chunk."""
-        if task == TaskType.SUMMARIZE:
-            return _CHUNK_SUMMARIZE.format(
-                idx=idx, total=total, text=chunk.text,
-            )
-        return _CHUNK_TRANSLATE.format(
-            idx=idx, total=total, text=chunk.text, language=language,
-        )
\ No newline at end of file
+    ) -> tuple[str, int]:
+        """
+        Build the appropriate prompt for a single chunk.
+
+        Returns:
+            The prompt, and the length of its leading part shared by every
+            chunk of the run (passed to the adapter as `cache_prefix`).
+        """
+        shared, body = _CHUNK_SUMMARIZE if task == TaskType.SUMMARIZE else _CHUNK_TRANSLATE
+        shared = shared.format(language=language)
+        # The total isn't known yet while a streamed document is chunked
+        of_total = f" of {total}" if total else ""
+        return shared + body.format(idx=idx, of_total=of_total, text=text), len(shared)
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Hierarchical tree-reduce for long documents.
+
+Instead of concatenating every MAP result into one giant REDUCE prompt,
+neighbouring partials are merged in small groups sized to a token
+budget. Merged outputs form the next level up, which is grouped the
+same way, until a single group fits the budget — that group becomes
+the input of the final merge.
+
+Groups are launched as soon as their members are available, so merge
+work overlaps the MAP phase instead of waiting for the slowest chunk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from transsum.models.base import ModelResponse, add_usage
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class _Level:
+    """Partial results at one height of the reduce tree."""
+    size: int | None = None          # number of items, once known
+    items: dict[int, str] = field(default_factory=dict)
+    next_start: int = 0              # first item not yet assigned to a group
+    emitted: int = 0                 # groups handed to the level above
+
+
+class TreeReducer:
+    """
+    Incrementally merges consecutive partial results into a bounded final group.
+
+    Feed MAP results with `add()` in any order, then await `result()` for
+    the list of texts the final REDUCE prompt should combine.
+
+    Grouping rules:
+      - A group is a run of consecutive items whose estimated tokens fit
+        `token_budget`; it always takes at least two items, so every merge
+        shrinks the level.
+      - A group closes once the next item is available and would overflow
+        the budget, or the level is complete.
+      - A lone trailing item is promoted to the next level without a call.
+      - When a complete level forms one group, it is the final group.
+
+    Args:
+        total:        Number of level-0 inputs that will be added, or None
+                      if not known yet (call `set_total()` once it is).
+        merge:        Coroutine merging a list of consecutive texts into one.
+        token_budget: Approximate maximum tokens of input per merge.
+        estimate:     Token estimator for a text.
+    """
+
+    def __init__(
+        self,
+        total: int | None,
+        merge: Callable[[list[str]], Awaitable[ModelResponse]],
+        token_budget: int,
+        estimate: Callable[[str], int] = estimate_tokens,
+    ) -> None:
+        if total is not None and total < 1:
+            raise ValueError("TreeReducer needs at least one input.")
+        self._levels: list[_Level] = [_Level(size=total)]
+        self._merge = merge
+        self._budget = token_budget
+        self._estimate = estimate
+        self._tasks: set[asyncio.Task] = set()
+        self._final: asyncio.Future[list[str]] = asyncio.get_running_loop().create_future()
+        self.usage: dict = {"prompt_tokens": 0, "completion_tokens": 0}
+        self.merges = 0
+
+    # ── Public API ──────────────────────────────────────────────────────
+
+    def add(self, pos: int, text: str) -> None:
+        """Register the MAP result for chunk position `pos`."""
+        self._put(0, pos, text)
+
+    def set_total(self, total: int) -> None:
+        """Declare the number of level-0 inputs, if it wasn't known up front."""
+        if total < 1:
+            raise ValueError("TreeReducer needs at least one input.")
+        self._levels[0].size = total
+        self._advance(0)
+
+    async def result(self) -> list[str]:
+        """Wait until the final group is ready and return its texts in order."""
+        return await asyncio.shield(self._final)
+
+    async def aclose(self) -> None:
+        """Cancel any merges still in flight."""
+        pending = list(self._tasks)
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if not self._final.done():
+            self._final.cancel()
+        elif not self._final.cancelled():
+            self._final.exception()  # mark a merge failure as retrieved
+
+    # ── Tree Maintenance ────────────────────────────────────────────────
+
+    def _put(self, height: int, pos: int, text: str) -> None:
+        self._levels[height].items[pos] = text
+        self._advance(height)
+
+    def _advance(self, height: int) -> None:
+        """Launch every group that can be closed at `height`."""
+        lvl = self._levels[height]
+        while not self._final.done():
+            start = lvl.next_start
+            end = start
+            tokens = 0
+            while end in lvl.items:
+                cost = self._estimate(lvl.items[end])
+                if end - start >= 2 and tokens + cost > self._budget:
+                    break
+                tokens += cost
+                end += 1
+
+            complete = lvl.size is not None and end == lvl.size
+            overflowed = end in lvl.items
+            if end == start or not (complete or overflowed):
+                return  # wait for more items
+
+            texts = [lvl.items.pop(i) for i in range(start, end)]
+            if start == 0 and complete:
+                logger.debug("Final group ready: %d items at level %d", len(texts), height)
+                self._final.set_result(texts)
+                return
+
+            if len(self._levels) == height + 1:
+                self._levels.append(_Level())
+            slot = lvl.emitted
+            lvl.emitted += 1
+            lvl.next_start = end
+            if complete:
+                self._levels[height + 1].size = lvl.emitted
+
+            if len(texts) == 1:
+                self._put(height + 1, slot, texts[0])
+            else:
+                logger.debug(
+                    "Merging items %d–%d at level %d (~%d tokens)",
+                    start, end - 1, height, tokens,
+                )
+                self._spawn(height + 1, slot, texts)
+
+            if complete:
+                self._advance(height + 1)
+                return
+
+    def _spawn(self, height: int, slot: int, texts: list[str]) -> None:
+        task = asyncio.create_task(self._run_merge(height, slot, texts))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_merge_done)
+
+    async def _run_merge(self, height: int, slot: int, texts: list[str]) -> None:
+        resp = await self._merge(texts)
+        self.merges += 1
+        add_usage(self.usage, resp.usage)
+        self._put(height, slot, resp.text)
+
+    def _on_merge_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled() or self._final.done():
+            return
+        if exc := task.exception():
+            self._final.set_exception(exc)
@@ -0,0 +1,172 @@
+"""
+Deterministic stitching of translated chunks.
+
+Neighbouring chunks share an overlap of source text, so each overlap is
+translated twice: at the end of one chunk's translation and at the
+start of the next. Instead of sending the whole translation back to the
+model to "fix the seams", `SeamAligner` finds where the two renderings
+agree — the longest run of identical tokens near the seam — and cuts
+both translations there, so the overlap appears once.
+
+A seam whose agreement is too short to trust is returned as a small
+window around it (the end of one translation, the start of the next),
+which the pipeline hands to the model on its own. Only those windows
+cost an LLM call, never the full text. Chunks that don't overlap are
+joined with the whitespace that separates them in the source, or by the
+model when they were cut mid-word.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transsum.config import Settings
+
+# CJK characters are single tokens (no spaces between words); otherwise
+# words and punctuation marks
+_TOKEN = re.compile(
+    r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]"
+    r"|\w+|[^\w\s]"
+)
+
+_PROBE = 32        # chars of the next chunk located in the previous one
+_MARGIN = 200      # chars searched beyond the expected overlap, per side
+_MIN_MATCH = 16    # shortest agreement (chars) that can anchor a seam
+_SNAP = 40         # furthest a window edge moves to avoid splitting a word
+
+
+@dataclass
+class Overlap:
+    """
+    Source text shared by two neighbouring chunks.
+
+    Attributes:
+        text:        The shared passage ("" if the chunks don't overlap).
+        left_share:  Its share of the first chunk's characters.
+        right_share: Its share of the second chunk's characters.
+        separator:   Source text between chunks that don't overlap
+                     ("" if unknown or cut mid-word).
+    """
+    text: str
+    left_share: float
+    right_share: float
+    separator: str = ""
+
+    @classmethod
+    def between(cls, left: str, right: str) -> Overlap:
+        """
+        The longest end of `left` that `right` starts with.
+
+        Overlaps shorter than a few dozen characters are ignored, so a
+        chance match of a letter or two is not taken for one.
+        """
+        probe = right[:_PROBE]
+        pos = left.find(probe, max(0, len(left) - len(right))) if probe else -1
+        while pos != -1:
+            if right.startswith(left[pos:]):
+                length = len(left) - pos
+                return cls(left[pos:], length / len(left), length / len(right))
+            pos = left.find(probe, pos + 1)
+        return cls("", 0.0, 0.0)
+
+
+@dataclass
+class Seam:
+    """
+    Where two translations are joined: `left[:left_cut] + joint + right[right_cut:]`.
+
+    Attributes:
+        left_cut:   Offset in the first translation where the seam starts.
+        right_cut:  Offset in the second translation where the rest resumes.
+        confidence: Length of the agreement found, relative to the
+                    expected length of the translated overlap (0–1).
+        joint:      Text between the cuts; None when the seam is below
+                    the aligner's confidence and still needs merging.
+    """
+    left_cut: int
+    right_cut: int
+    confidence: float
+    joint: str | None = ""
+
+
+class SeamAligner:
+    """
+    Aligns neighbouring translations on their overlapping passage.
+
+    The translated overlap is expected to take the same share of each
+    translation as the source overlap takes of its chunk. The aligner
+    searches twice that much (plus a margin, and at most half of either
+    translation) at the end of the first and the start of the second for
+    the longest run of identical tokens, and cuts both at its start.
+
+    When that run is shorter than `min_confidence` of the expected
+    overlap, the seam is returned with `joint=None` and cuts at the edges
+    of the searched windows instead; the caller merges the two windows.
+    Chunks that don't overlap are joined with their source separator;
+    without one, the seam is left to the model on windows of `_MARGIN`
+    characters.
+
+    Args:
+        min_confidence: Smallest confidence stitched without the model.
+    """
+
+    def __init__(self, min_confidence: float = 0.3) -> None:
+        self._min_confidence = min_confidence
+
+    def align(self, left: str, right: str, overlap: Overlap) -> Seam:
+        """Find the seam between two consecutive translations."""
+        if not overlap.text:
+            if overlap.separator:
+                return Seam(len(left), 0, 1.0, overlap.separator)
+            return Seam(
+                _word_edge(left, len(left) - min(len(left) // 2, _MARGIN), 1),
+                _word_edge(right, min(len(right) // 2, _MARGIN), -1),
+                0.0, None,
+            )
+
+        expected_left = overlap.left_share * len(left)
+        expected_right = overlap.right_share * len(right)
+        left_start = len(left) - min(len(left) // 2, int(2 * expected_left) + _MARGIN)
+        right_end = min(len(right) // 2, int(2 * expected_right) + _MARGIN)
+
+        a = [(m.start(), m.end()) for m in _TOKEN.finditer(left, left_start)]
+        b = [(m.start(), m.end()) for m in _TOKEN.finditer(right, 0, right_end)]
+        matcher = SequenceMatcher(
+            None, [left[s:e] for s, e in a], [right[s:e] for s, e in b], autojunk=False,
+        )
+        i, j, size = matcher.find_longest_match(0, len(a), 0, len(b))
+
+        confidence = 0.0
+        if size:
+            matched = a[i + size - 1][1] - a[i][0]
+            expected = max((expected_left + expected_right) / 2, 1.0)
+            if matched >= _MIN_MATCH:
+                confidence = min(1.0, matched / expected)
+        if size and confidence >= self._min_confidence:
+            return Seam(a[i][0], b[j][0], confidence)
+        return Seam(
+            _word_edge(left, left_start, 1), _word_edge(right, right_end, -1),
+            confidence, None,
+        )
+
+
+def _word_edge(text: str, pos: int, step: int) -> int:
+    """Move `pos` by up to _SNAP chars in direction `step` so it doesn't split a word."""
+    for moved in range(_SNAP):
+        at = pos + moved * step
+        if at <= 0 or at >= len(text) or text[at - 1].isspace() or text[at].isspace():
+            return at
+    return pos
+
+
+# ── Factory ─────────────────────────────────────────────────────────────────
+
+def create_aligner(settings: Settings) -> SeamAligner | None:
+    """Build the seam aligner if TRANSLATE_MERGE selects stitching."""
+    if settings.translate_merge != "stitch":
+        return None
+    return SeamAligner(settings.stitch_min_confidence)
@@ -0,0 +1,132 @@
+"""
+On-disk cache of text extracted from documents.
+
+PDF extraction is slow and CPU-bound, yet the same file is often loaded
+again and again (repeat MCP calls on one report, translating a file into
+several languages). `ExtractedTextCache` stores each extraction as a
+UTF-8 file, so a repeat load is one sequential read. PDF extractions
+are stored page by page, so a cache hit streams the same pages as a
+fresh extraction.
+
+Entries are keyed by the file's resolved path, size, mtime and a hash of
+its bytes, so an edited or replaced file never hits a stale entry. The
+directory is capped in size; the least recently used entries (by file
+mtime, refreshed on every hit) are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transsum.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK = 1 << 20
+
+
+class ExtractedTextCache:
+    """
+    Directory of cached extractions, one `<key>.txt` file per document.
+
+    Args:
+        directory: Cache directory (created if missing).
+        max_bytes: Cap on the total size of cached text files.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self._dir = Path(directory).expanduser()
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(path: str | Path) -> str:
+        """Identify a file by resolved path, size, mtime and content hash."""
+        path = Path(path).resolve()
+        st = path.stat()
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            while block := fh.read(_HASH_BLOCK):
+                digest.update(block)
+        payload = json.dumps([str(path), st.st_size, st.st_mtime_ns, digest.hexdigest()])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached text for `key`, or None on a miss."""
+        entry = self._dir / f"{key}.txt"
+        try:
+            text = entry.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        os.utime(entry)  # mark as recently used
+        self.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store `text` under `key`, evicting LRU entries if over the cap."""
+        # Write then rename, so readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp, self._dir / f"{key}.txt")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._dir.glob("*.txt"):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue  # removed by another process
+            entries.append((st.st_mtime, st.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        if total <= self._max_bytes:
+            return
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self._max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+        logger.debug("Extracted-text cache evicted down to %d bytes", total)
+
+    def get_pages(self, key: str) -> list[str] | None:
+        """Return the page texts stored by `put_pages`, or None on a miss."""
+        text = self.get(f"{key}-pages")
+        return None if text is None else json.loads(text)
+
+    def put_pages(self, key: str, pages: list[str]) -> None:
+        """Store an extraction as its list of page texts."""
+        self.put(f"{key}-pages", json.dumps(pages, ensure_ascii=False))
+
+    @property
+    def stats(self) -> dict:
+        """Hit / miss / eviction counters."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+# ── Factory ─────────────────────────────────────────────────────────────────
+
+def create_text_cache(settings: Settings) -> ExtractedTextCache | None:
+    """Build the extracted-text cache if TEXT_CACHE_ENABLED is set."""
+    if not settings.text_cache_enabled:
+        return None
+    return ExtractedTextCache(
+        settings.text_cache_path, max_bytes=settings.text_cache_max_mb * 1024 * 1024,
+    )
@@ -0,0 +1,114 @@
+"""
+Where a pipeline run spent its time.
+
+Every run records a `PipelineTimings` on its PipelineResult, measured
+with `time.perf_counter` (monotonic):
+
+  - stages — "load" (reading or extracting a streamed document), "chunk",
+    "queue" (calls waiting for a MAP concurrency slot, summed over calls),
+    "map", "reduce" and "notify" (progress notifications and callbacks);
+  - calls — one entry per model call with its queueing time, latency and
+    token counts;
+  - time to first token of a streamed final call.
+
+Stages overlap: MAP starts while a streamed document is still being
+loaded and chunked, and "queue" sums waits that happen in parallel, so
+the stages don't add up to the total.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CallTiming:
+    """
+    One model call.
+
+    Attributes:
+        kind:              "map", "merge" (tree-reduce step), "reduce" or
+                           "seam" (a translation seam merged by the model).
+        index:             One-based chunk position for "map" and "seam", else 0.
+        queued_s:          Seconds waiting for a concurrency slot.
+        latency_s:         Seconds from sending the call to its full answer.
+        prompt_tokens:     Input tokens reported for the call.
+        completion_tokens: Output tokens reported for the call.
+        provider, model:   The backend that answered (behind a router, the
+                           backend rather than the router).
+    """
+    kind: str
+    index: int
+    queued_s: float
+    latency_s: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    provider: str = ""
+    model: str = ""
+
+
+@dataclass
+class PipelineTimings:
+    """
+    Timing breakdown of one pipeline run (all values in seconds).
+
+    Attributes:
+        total_s:       Wall time of the run.
+        stages:        Seconds per stage (see module docstring).
+        calls:         Every model call, in completion order.
+        first_token_s: Seconds from the start of the run to the first
+                       streamed output token, when streaming.
+    """
+    total_s: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+    calls: list[CallTiming] = field(default_factory=list)
+    first_token_s: float | None = None
+
+    def add(self, stage: str, seconds: float) -> None:
+        """Add `seconds` to `stage`."""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    @property
+    def chunk_latencies(self) -> list[float]:
+        """Latency of each MAP call, in chunk order."""
+        return [c.latency_s for c in sorted(self.calls, key=lambda c: c.index) if c.kind == "map"]
+
+    @property
+    def prompt_tokens_per_s(self) -> float:
+        """Input tokens processed per second of model call time."""
+        busy = sum(c.latency_s for c in self.calls)
+        return sum(c.prompt_tokens for c in self.calls) / busy if busy else 0.0
+
+    @property
+    def completion_tokens_per_s(self) -> float:
+        """Output tokens generated per second of model call time."""
+        busy = sum(c.latency_s for c in self.calls)
+        return sum(c.completion_tokens for c in self.calls) / busy if busy else 0.0
+
+    def to_dict(self) -> dict:
+        """JSON-ready summary in milliseconds, with MAP latency percentiles."""
+        latencies = self.chunk_latencies
+        ordered = sorted(latencies)
+
+        def pct(q: float) -> float | None:
+            return _ms(ordered[math.ceil(len(ordered) * q) - 1]) if ordered else None
+
+        return {
+            "total_ms": _ms(self.total_s),
+            "stages_ms": {stage: _ms(s) for stage, s in self.stages.items()},
+            "first_token_ms": _ms(self.first_token_s) if self.first_token_s is not None else None,
+            "calls": len(self.calls),
+            "map_latency_ms": {
+                "p50": pct(0.5),
+                "p95": pct(0.95),
+                "max": _ms(ordered[-1]) if ordered else None,
+                "per_chunk": [_ms(s) for s in latencies],
+            },
+            "prompt_tokens_per_s": round(self.prompt_tokens_per_s, 1),
+            "completion_tokens_per_s": round(self.completion_tokens_per_s, 1),
+        }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
@@ -0,0 +1,104 @@
+"""
+Pluggable token estimators.
+
+Character counts are a poor proxy for model context: a CJK character
+is roughly one token while English averages about four characters per
+token, and code sits somewhere in between. Token-budgeted chunking and
+the tree reducer measure text through a `TokenEstimator` instead.
+
+Estimators:
+  - HeuristicEstimator — dependency-free, script-aware approximation.
+  - TiktokenEstimator  — exact BPE counts via the optional `tiktoken`
+                         package (OpenAI encodings; a close match for
+                         Llama 3 family models served by Ollama).
+
+Anthropic only exposes its tokenizer through a network endpoint, which
+is far too slow to call per sentence, so it uses the heuristic.
+"""
+
+from __future__ import annotations
+
+import abc
+import math
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from transsum.config import Settings
+
+# Scripts where one character is about one token
+_CJK = re.compile(
+    r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]'
+)
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+_ASCII_PUNCT = re.compile(r'[!-/:-@\[-`{-~]')
+
+
+class TokenEstimator(abc.ABC):
+    """Counts (or estimates) the tokens a model would see for a text."""
+
+    name: str = "unknown"
+
+    @abc.abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in `text`."""
+        ...
+
+
+class HeuristicEstimator(TokenEstimator):
+    """
+    Fast script-aware estimate, tuned to err slightly high.
+
+    Weights (tokens per character):
+      - ASCII letters, digits, whitespace: 1/4
+      - ASCII punctuation and symbols:     1/2  (code is dense in these)
+      - CJK ideographs, kana, hangul:      1
+      - Other non-ASCII (Cyrillic, …):     1/2
+    """
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        punct = len(_ASCII_PUNCT.findall(text))
+        if text.isascii():
+            cjk = other = 0
+        else:
+            cjk = len(_CJK.findall(text))
+            other = len(_NON_ASCII.findall(text)) - cjk
+        plain = len(text) - punct - cjk - other
+        return math.ceil(plain / 4 + (punct + other) / 2 + cjk)
+
+
+class TiktokenEstimator(TokenEstimator):
+    """
+    Exact counts from a tiktoken BPE encoding.
+
+    Args:
+        encoding: tiktoken encoding name (default "cl100k_base").
+    """
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = "cl100k_base") -> None:
+        try:
+            import tiktoken
+        except ImportError:
+            raise ImportError(
+                "tiktoken is required for TOKEN_ESTIMATOR=tiktoken. "
+                "Install it with: pip install tiktoken"
+            )
+        self._encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+# ── Factory ─────────────────────────────────────────────────────────────────
+
+def create_estimator(settings: Settings) -> TokenEstimator:
+    """Build the estimator selected by TOKEN_ESTIMATOR."""
+    if settings.token_estimator == "tiktoken":
+        return TiktokenEstimator()
+    return HeuristicEstimator()
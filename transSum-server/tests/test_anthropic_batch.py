@@ -0,0 +1,250 @@
+"""
+Tests for the Message Batches adapter.
+
+A small stand-in for the Message Batches API is served on localhost, so
+the real SDK code paths are exercised without network access.
+"""
+
+import asyncio
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from transsum.models.anthropic_batch import AnthropicBatchAdapter
+from transsum.processing.chunker import TextChunker
+from transsum.processing.loader import DocumentLoader
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+
+
+class BatchStandIn:
+    """
+    In-memory Message Batches API.
+
+    Batches end after `polls` status checks. A prompt containing a key
+    of `failures` gets that error type instead of an answer, once.
+    """
+
+    def __init__(self, polls: int = 1, failures: dict[str, str] | None = None) -> None:
+        self.polls = polls
+        self.failures = dict(failures or {})
+        self.batches: dict[str, dict] = {}
+        self.url = ""
+
+    def __enter__(self) -> "BatchStandIn":
+        stand_in = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def _reply(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                status, payload = stand_in.handle(
+                    self.command, self.path, self.rfile.read(length),
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _reply  # noqa: N815 (BaseHTTPRequestHandler's names)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True,
+        ).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _batch(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        ended = batch["status"] == "ended"
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": batch["status"],
+            "request_counts": {
+                "processing": 0 if ended else len(batch["requests"]),
+                "succeeded": len(batch["requests"]) if ended else 0,
+                "errored": 0, "canceled": 0, "expired": 0,
+            },
+            "created_at": "2026-01-01T00:00:00Z",
+            "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T00:05:00Z" if ended else None,
+            "results_url": f"{self.url}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    def _result(self, request: dict) -> dict:
+        prompt = request["params"]["messages"][0]["content"]
+        for marker, error in list(self.failures.items()):
+            if marker in prompt:
+                del self.failures[marker]
+                return {"type": "errored", "error": {
+                    "type": "error", "error": {"type": error, "message": "stand-in failure"},
+                }}
+        return {"type": "succeeded", "message": {
+            "id": "msg_" + request["custom_id"],
+            "type": "message",
+            "role": "assistant",
+            "model": request["params"]["model"],
+            "content": [{"type": "text", "text": f"Answer {len(prompt)}"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": len(prompt) // 4, "output_tokens": 3},
+        }}
+
+    def handle(self, method: str, path: str, body: bytes) -> tuple[int, bytes]:
+        path = path.split("?")[0]
+        if method == "POST" and path == "/v1/messages/batches":
+            batch_id = f"msgbatch_{len(self.batches)}"
+            self.batches[batch_id] = {
+                "requests": json.loads(body)["requests"], "status": "in_progress", "checks": 0,
+            }
+            return 200, json.dumps(self._batch(batch_id)).encode()
+
+        match = re.fullmatch(r"/v1/messages/batches/(\w+)(/results|/cancel)?", path)
+        if match is None:
+            return 404, b'{"type": "error", "error": {"type": "not_found_error", "message": ""}}'
+        batch_id, action = match.groups()
+        batch = self.batches[batch_id]
+        if action == "/cancel":
+            batch["status"] = "canceling"
+        elif action == "/results":
+            lines = [
+                json.dumps({"custom_id": r["custom_id"], "result": self._result(r)})
+                for r in batch["requests"]
+            ]
+            return 200, "\n".join(lines).encode()
+        else:
+            batch["checks"] += 1
+            if batch["checks"] >= self.polls:
+                batch["status"] = "ended"
+        return 200, json.dumps(self._batch(batch_id)).encode()
+
+
+@pytest.fixture
+def stand_in():
+    with BatchStandIn() as server:
+        yield server
+
+
+def _adapter(stand_in: BatchStandIn, **kwargs) -> AnthropicBatchAdapter:
+    options = {"window": 0.01, "poll_interval": 0.01, **kwargs}
+    return AnthropicBatchAdapter(
+        "sk-ant-test", "claude-test", max_retries=1, base_url=stand_in.url, **options,
+    )
+
+
+class TestAnthropicBatchAdapter:
+    """Concurrent calls are collected into Message Batches."""
+
+    def test_concurrent_calls_share_a_batch(self, stand_in):
+        stand_in.polls = 2
+
+        async def _run():
+            adapter = _adapter(stand_in)
+            try:
+                return await asyncio.gather(*(
+                    adapter.generate("x" * n, system="sys") for n in range(1, 6)
+                )), adapter.batches_submitted
+            finally:
+                await adapter.close()
+
+        responses, submitted = asyncio.run(_run())
+        assert submitted == 1
+        assert [r.text for r in responses] == [f"Answer {n}" for n in range(1, 6)]
+        assert responses[0].usage == {"prompt_tokens": 0, "completion_tokens": 3}
+        params = stand_in.batches["msgbatch_0"]["requests"][0]["params"]
+        assert params["system"] == "sys" and params["model"] == "claude-test"
+
+    def test_full_queue_submitted_immediately(self, stand_in):
+        async def _run():
+            adapter = _adapter(stand_in, window=60, max_requests=2)
+            try:
+                await asyncio.gather(*(adapter.generate(f"p{n}") for n in range(4)))
+            finally:
+                await adapter.close()
+
+        asyncio.run(_run())
+        assert [len(b["requests"]) for b in stand_in.batches.values()] == [2, 2]
+
+    def test_map_then_reduce_batches(self, stand_in):
+        doc = DocumentLoader.load_text("A sentence of text here. " * 200)
+
+        async def _run():
+            adapter = _adapter(stand_in)
+            pipeline = ProcessingPipeline(adapter, TextChunker(1000, 100), map_concurrency=100)
+            try:
+                return await pipeline.run(doc, TaskType.SUMMARIZE)
+            finally:
+                await adapter.close()
+
+        result = asyncio.run(_run())
+        sizes = [len(b["requests"]) for b in stand_in.batches.values()]
+        assert sizes == [result.chunks_processed, 1]
+        assert result.output.startswith("Answer")
+
+    def test_transient_error_resubmitted(self, stand_in):
+        stand_in.failures = {"flaky": "overloaded_error"}
+
+        async def _run():
+            adapter = _adapter(stand_in)
+            try:
+                return await asyncio.gather(adapter.generate("flaky"), adapter.generate("fine"))
+            finally:
+                await adapter.close()
+
+        responses = asyncio.run(_run())
+        assert all(r.text.startswith("Answer") for r in responses)
+        assert [len(b["requests"]) for b in stand_in.batches.values()] == [2, 1]
+
+    def test_permanent_error_raises(self, stand_in):
+        stand_in.failures = {"bad": "invalid_request_error"}
+
+        async def _run():
+            adapter = _adapter(stand_in)
+            try:
+                return await asyncio.gather(
+                    adapter.generate("bad"), adapter.generate("good"), return_exceptions=True,
+                )
+            finally:
+                await adapter.close()
+
+        bad, good = asyncio.run(_run())
+        assert isinstance(bad, RuntimeError) and "invalid_request_error" in str(bad)
+        assert good.text == "Answer 4"
+
+    def test_close_fails_waiting_calls(self, stand_in):
+        stand_in.polls = 10_000
+
+        async def _run():
+            adapter = _adapter(stand_in)
+            call = asyncio.create_task(adapter.generate("slow"))
+            # Close only once the batch has reached the API
+            while not stand_in.batches:
+                await asyncio.sleep(0.01)
+            await adapter.close()
+            with pytest.raises(RuntimeError, match="closed before the batch finished"):
+                await call
+
+        asyncio.run(_run())
+
+    def test_close_fails_calls_of_unstarted_batch(self, stand_in):
+        async def _run():
+            adapter = _adapter(stand_in, window=60, max_requests=1)
+            call = asyncio.create_task(adapter.generate("queued"))
+            await asyncio.sleep(0)          # submitted; its batch task hasn't run yet
+            await adapter.close()
+            with pytest.raises(RuntimeError, match="closed"):
+                await asyncio.wait_for(call, 5)
+
+        asyncio.run(_run())
+        assert stand_in.batches == {}
@@ -0,0 +1,133 @@
+"""Tests for CLI batch processing."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from transsum.batch import BatchRunner, collect_inputs, output_path
+from transsum.models.base import ModelResponse
+from transsum.models.limits import ConcurrencyLimitedAdapter
+from transsum.processing.chunker import TextChunker
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+
+
+def _adapter() -> AsyncMock:
+    adapter = AsyncMock()
+    adapter.generate.return_value = ModelResponse(
+        text="Summary.", model="mock-model", provider="mock",
+        usage={"prompt_tokens": 10, "completion_tokens": 5},
+    )
+    return adapter
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """reports/{a.txt, b.md, notes.xyz, sub/c.txt} plus extra/a.txt."""
+    reports = tmp_path / "reports"
+    (reports / "sub").mkdir(parents=True)
+    (reports / "a.txt").write_text("Alpha report.")
+    (reports / "b.md").write_text("Beta report.")
+    (reports / "notes.xyz").write_text("ignored")
+    (reports / "sub" / "c.txt").write_text("Gamma report.")
+    (tmp_path / "extra").mkdir()
+    (tmp_path / "extra" / "a.txt").write_text("Another alpha.")
+    return tmp_path
+
+
+class TestCollectInputs:
+    """Directories, globs and manifests expand to supported files."""
+
+    def test_directory_is_recursive_and_filtered(self, tree):
+        items = collect_inputs([str(tree / "reports")])
+        assert [str(i.relative) for i in items] == ["a.txt", "b.md", "sub/c.txt"]
+
+    def test_glob(self, tree):
+        items = collect_inputs([str(tree / "reports" / "**" / "*.txt")])
+        assert [str(i.relative) for i in items] == ["a.txt", "sub/c.txt"]
+
+    def test_duplicates_removed(self, tree):
+        items = collect_inputs([str(tree / "reports"), str(tree / "reports" / "a.txt")])
+        assert len(items) == 3
+
+    def test_clashing_names_made_unique(self, tree):
+        items = collect_inputs([str(tree / "reports" / "a.txt"), str(tree / "extra")])
+        assert [str(i.relative) for i in items] == ["a.txt", "a-2.txt"]
+
+    def test_manifest_relative_to_its_directory(self, tree):
+        manifest = tree / "nightly.txt"
+        manifest.write_text("# nightly inputs\n\nreports/b.md\nreports/sub\n")
+        items = collect_inputs([], manifest)
+        assert [i.path.name for i in items] == ["b.md", "c.txt"]
+
+    def test_output_path(self, tmp_path):
+        from pathlib import Path
+        rel = Path("q3/report.pdf")
+        summary = output_path(tmp_path, rel, TaskType.SUMMARIZE)
+        assert summary == tmp_path / "q3" / "report.summary.md"
+        assert output_path(tmp_path, rel, TaskType.TRANSLATE, "Brazilian Portuguese") == (
+            tmp_path / "q3" / "report.brazilian-portuguese.md"
+        )
+
+
+class TestBatchRunner:
+    """Every input gets an output file and a JSONL record."""
+
+    @staticmethod
+    def _runner(tmp_path, adapter=None, **kwargs):
+        pipeline = ProcessingPipeline(adapter or _adapter(), TextChunker(1000, 100))
+        return BatchRunner(
+            pipeline, TaskType.SUMMARIZE, tmp_path / "out", tmp_path / "out" / "log.jsonl",
+            **kwargs,
+        )
+
+    def test_outputs_and_log(self, tree):
+        (tree / "reports" / "empty.txt").write_text("   ")
+        items = collect_inputs([str(tree / "reports")])
+        runner = self._runner(tree, jobs=2)
+        records = asyncio.run(runner.run(items))
+
+        assert [r.status for r in records] == ["ok", "ok", "error", "ok"]
+        assert "empty" in records[2].error
+        assert (tree / "out" / "sub" / "c.summary.md").read_text() == "Summary.\n"
+        lines = (tree / "out" / "log.jsonl").read_text().splitlines()
+        logged = [json.loads(line) for line in lines]
+        assert sorted(r["file"] for r in logged) == sorted(str(i.path) for i in items)
+        assert runner.progress.done == 3 and runner.progress.failed == 1
+        assert runner.progress.usage == {"prompt_tokens": 30, "completion_tokens": 15}
+        assert runner.progress.active == {}
+
+    def test_skip_existing(self, tree):
+        items = collect_inputs([str(tree / "reports")])
+        asyncio.run(self._runner(tree).run(items))
+        adapter = _adapter()
+        records = asyncio.run(self._runner(tree, adapter, skip_existing=True).run(items))
+        assert {r.status for r in records} == {"skipped"}
+        adapter.generate.assert_not_called()
+
+    def test_global_cap_across_documents(self, tree):
+        inner = _adapter()
+        response = inner.generate.return_value
+        state = {"now": 0, "peak": 0}
+
+        async def _generate(prompt, **kwargs):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.01)
+            state["now"] -= 1
+            return response
+
+        inner.generate.side_effect = _generate
+        for i in range(6):
+            (tree / "reports" / f"long{i}.txt").write_text("A sentence here. " * 200)
+        items = collect_inputs([str(tree / "reports")])
+        adapter = ConcurrencyLimitedAdapter(inner, 3)
+        pipeline = ProcessingPipeline(adapter, TextChunker(500, 50), map_concurrency=3)
+        runner = BatchRunner(
+            pipeline, TaskType.SUMMARIZE, tree / "out", tree / "log.jsonl", jobs=6,
+        )
+        records = asyncio.run(runner.run(items))
+        assert all(r.status == "ok" for r in records)
+        assert state["peak"] == 3
+        assert adapter.in_flight == 0
@@ -0,0 +1,168 @@
+"""Tests for the persistent LLM response cache."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from transsum.models.base import ModelResponse, streamed_by
+from transsum.models.cache import CachingAdapter, ResponseCache
+
+
+def _inner_adapter(text: str = "Fresh answer.") -> AsyncMock:
+    adapter = AsyncMock()
+    adapter.provider = "mock"
+    adapter.model = "mock-model"
+    adapter.generate.return_value = ModelResponse(
+        text=text, model="mock-model", provider="mock",
+        usage={"prompt_tokens": 10, "completion_tokens": 20}, finish_reason="stop",
+    )
+    return adapter
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=1_000_000)
+    yield c
+    c.close()
+
+
+class TestCachingAdapter:
+    """Repeat requests are answered from the cache."""
+
+    def test_second_call_is_a_hit(self, cache):
+        inner = _inner_adapter()
+        adapter = CachingAdapter(inner, cache)
+
+        first = asyncio.run(adapter.generate("Summarize this.", system="sys"))
+        second = asyncio.run(adapter.generate("Summarize this.", system="sys"))
+
+        assert inner.generate.call_count == 1
+        assert second.text == first.text == "Fresh answer."
+        assert second.finish_reason == "stop"
+        assert second.usage == {}
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    @pytest.mark.parametrize("change", [
+        {"system": "other"}, {"temperature": 0.9}, {"max_tokens": 10},
+    ])
+    def test_key_covers_all_inputs(self, cache, change):
+        inner = _inner_adapter()
+        adapter = CachingAdapter(inner, cache)
+
+        asyncio.run(adapter.generate("Same prompt.", system="sys"))
+        asyncio.run(adapter.generate("Same prompt.", **{"system": "sys", **change}))
+
+        assert inner.generate.call_count == 2
+
+    def test_model_is_part_of_key(self, cache):
+        asyncio.run(CachingAdapter(_inner_adapter(), cache).generate("Prompt."))
+        other = _inner_adapter()
+        other.model = "bigger-model"
+        asyncio.run(CachingAdapter(other, cache).generate("Prompt."))
+        other.generate.assert_called_once()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        first = ResponseCache(path, max_bytes=1_000_000)
+        asyncio.run(CachingAdapter(_inner_adapter(), first).generate("Prompt."))
+        first.close()
+
+        inner = _inner_adapter()
+        second = ResponseCache(path, max_bytes=1_000_000)
+        resp = asyncio.run(CachingAdapter(inner, second).generate("Prompt."))
+        second.close()
+
+        inner.generate.assert_not_called()
+        assert resp.text == "Fresh answer."
+
+    def test_stream_is_cached(self, cache):
+        inner = _inner_adapter()
+
+        async def _stream(prompt, **kwargs):
+            for token in ["a", "b"]:
+                yield token
+
+        inner.stream = MagicMock(side_effect=_stream)
+        adapter = CachingAdapter(inner, cache)
+
+        async def _collect():
+            return [t async for t in adapter.stream("Prompt.")]
+
+        assert asyncio.run(_collect()) == ["a", "b"]
+        assert asyncio.run(_collect()) == ["ab"]
+        inner.stream.assert_called_once()
+
+    def test_stream_cached_under_serving_backend(self, cache):
+        inner = _inner_adapter()
+
+        async def _stream(prompt, **kwargs):
+            # As a router does when a fallback served the stream
+            streamed_by.set(("anthropic", "claude-fallback"))
+            yield "answer"
+
+        inner.stream = MagicMock(side_effect=_stream)
+        adapter = CachingAdapter(inner, cache)
+
+        async def _collect():
+            text = "".join([t async for t in adapter.stream("Prompt.")])
+            return text, streamed_by.get()
+
+        assert asyncio.run(_collect()) == ("answer", ("anthropic", "claude-fallback"))
+        # Replayed from the cache, still attributed to the fallback
+        assert asyncio.run(_collect()) == ("answer", ("anthropic", "claude-fallback"))
+        inner.stream.assert_called_once()
+
+    def test_database_used_off_event_loop(self, cache, monkeypatch):
+        threads = []
+        for name in ("get", "put"):
+            method = getattr(cache, name)
+
+            def _recorded(*args, _method=method):
+                threads.append(threading.get_ident())
+                return _method(*args)
+
+            monkeypatch.setattr(cache, name, _recorded)
+        adapter = CachingAdapter(_inner_adapter(), cache)
+
+        async def _twice():
+            await adapter.generate("Prompt.")
+            await adapter.generate("Prompt.")
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(_twice())
+        assert len(threads) == 3 and loop_thread not in threads
+        assert cache.stats["hits"] == 1
+
+
+class TestResponseCacheBounds:
+    """TTL expiry and LRU eviction."""
+
+    @staticmethod
+    def _resp(text: str) -> ModelResponse:
+        return ModelResponse(text=text, model="m", provider="p")
+
+    def test_expired_entry_is_a_miss(self, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path / "c.sqlite3", max_bytes=1_000_000, ttl=60)
+        cache.put("k", self._resp("old"))
+        monkeypatch.setattr("transsum.models.cache.time.time", lambda: 10**12)
+        assert cache.get("k") is None
+        assert cache.stats["entries"] == 0
+        cache.close()
+
+    def test_lru_eviction_keeps_recent_entries(self, tmp_path, monkeypatch):
+        clock = iter(range(1, 100))
+        monkeypatch.setattr("transsum.models.cache.time.time", lambda: next(clock))
+        cache = ResponseCache(tmp_path / "c.sqlite3", max_bytes=25)
+        cache.put("a", self._resp("x" * 10))
+        cache.put("b", self._resp("y" * 10))
+        cache.get("a")                       # "a" is now more recent than "b"
+        cache.put("c", self._resp("z" * 10))  # 30 bytes > 25: evict LRU
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.evictions == 1
+        cache.close()
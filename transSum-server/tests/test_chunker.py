@@ -1,7 +1,12 @@
 """Tests for the text chunker."""
 
+import re
+
 import pytest
-from transsum.processing.chunker import TextChunker, Chunk
+from transsum.processing.chunker import (
+    ContentDefinedChunker, TextChunker, TokenChunker, Chunk, ChunkSpan, sentence_index,
+)
+from transsum.processing.tokens import HeuristicEstimator
 
 
 class TestSingleChunk:
@@ -66,6 +71,15 @@ class TestSentenceBoundary:
         chunks = chunker.chunk(text)
         assert len(chunks) > 1  # should still split
 
+    def test_index_matches_window_rescan(self):
+        text = "Go! Stop? 3.14 is pi.\nEnd. " * 40 + "tail.\tx.y?"
+        boundaries = sentence_index(text)
+        for start in range(0, len(text), 7):
+            for end in range(start + 1, min(start + 60, len(text)) + 1, 5):
+                matches = list(re.finditer(r'[.!?]\s', text[start:end]))
+                expected = start + matches[-1].end() if matches else end
+                assert TextChunker._find_sentence_boundary(boundaries, start, end) == expected
+
 
 class TestValidation:
     """Constructor validation."""
@@ -89,4 +103,143 @@ class TestChunkDataclass:
     def test_preview_long_text_truncates(self):
         c = Chunk(index=0, text="A" * 200, char_count=200)
         assert len(c.preview) < 200
-        assert c.preview.endswith("…")
\ No newline at end of file
+        assert c.preview.endswith("…")
+
+def _sentences(n: int, seed: str = "") -> str:
+    """Deterministic prose with varied sentence lengths."""
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+    out = []
+    for i in range(n):
+        length = 4 + (i * 7) % 11
+        sentence = " ".join(words[(i + j) % 8] for j in range(length)).capitalize()
+        out.append(f"{sentence} {seed}{i}.")
+    return " ".join(out)
+
+
+class TestContentDefinedChunker:
+    """Boundaries come from content, so edits only disturb nearby chunks."""
+
+    def test_chunks_bounded_and_cover_text(self):
+        text = _sentences(400)
+        chunks = ContentDefinedChunker(chunk_size=1000).chunk(text)
+        assert len(chunks) > 2
+        assert all(c.char_count <= 1000 for c in chunks)
+        assert "".join(c.text for c in chunks).replace(" ", "") == text.replace(" ", "")
+
+    def test_insertion_near_top_keeps_later_chunks(self):
+        text = _sentences(400)
+        edited = text[:300] + " A brand new paragraph was inserted here. " + text[300:]
+        chunker = ContentDefinedChunker(chunk_size=1000)
+
+        before = {c.text for c in chunker.chunk(text)}
+        after = [c.text for c in chunker.chunk(edited)]
+
+        changed = [t for t in after if t not in before]
+        assert len(changed) <= 2
+        assert len(after) > 10
+
+    def test_forced_cut_without_punctuation(self):
+        chunks = ContentDefinedChunker(chunk_size=500).chunk("word " * 400)
+        assert len(chunks) > 1
+        assert all(c.char_count <= 500 for c in chunks)
+
+    def test_short_text_single_chunk(self):
+        chunks = ContentDefinedChunker(chunk_size=1000).chunk("Just one sentence.")
+        assert [c.text for c in chunks] == ["Just one sentence."]
+
+
+class TestTokenChunker:
+    """Chunks are packed to a token budget rather than a character count."""
+
+    def test_short_text_single_chunk(self):
+        chunks = TokenChunker(chunk_tokens=100, overlap_tokens=10).chunk("One sentence.")
+        assert [c.text for c in chunks] == ["One sentence."]
+
+    def test_chunks_fit_token_budget(self):
+        est = HeuristicEstimator()
+        text = _sentences(300)
+        chunks = TokenChunker(chunk_tokens=200, overlap_tokens=20, estimator=est).chunk(text)
+        assert len(chunks) > 5
+        assert all(est.count(c.text) <= 200 for c in chunks)
+
+    def test_cjk_chunks_are_shorter_in_characters(self):
+        chunker = TokenChunker(chunk_tokens=200, overlap_tokens=0)
+        english = chunker.chunk("This is a plain english sentence. " * 200)
+        chinese = chunker.chunk("这是一个普通的中文句子。 " * 200)
+        assert max(c.char_count for c in chinese) < max(c.char_count for c in english) / 2
+
+    def test_overlap_repeats_whole_sentences(self):
+        text = " ".join(f"Sentence number {i} ends here." for i in range(100))
+        chunks = TokenChunker(chunk_tokens=60, overlap_tokens=10).chunk(text)
+        last_sentence = chunks[0].text.rsplit(". ", 1)[-1]
+        assert chunks[1].text.startswith(last_sentence)
+
+    def test_long_unpunctuated_run_is_split(self):
+        est = HeuristicEstimator()
+        chunks = TokenChunker(chunk_tokens=50, overlap_tokens=0).chunk("word " * 500)
+        assert len(chunks) > 1
+        assert all(est.count(c.text) <= 50 for c in chunks)
+
+
+class TestChunkSpan:
+    """Chunkers return offsets into the source rather than copies."""
+
+    def test_text_is_sliced_from_source(self):
+        text = "This is a sentence. " * 50
+        for c in TextChunker(chunk_size=100, overlap=20).chunk(text):
+            assert c.text == text[c.start:c.end]
+            assert c.char_count == c.end - c.start
+
+    def test_stripped_trims_whitespace(self):
+        span = ChunkSpan.stripped(0, "  \n hello world \t ", 0, 18)
+        assert span.text == "hello world"
+
+    def test_stripped_blank_is_none(self):
+        assert ChunkSpan.stripped(0, "   \n  ", 0, 6) is None
+
+    def test_slots_no_instance_dict(self):
+        span = ChunkSpan(0, "abc", 0, 3)
+        assert not hasattr(span, "__dict__")
+
+    def test_preview_matches_chunk(self):
+        text = "A" * 200
+        assert ChunkSpan(0, text, 0, 200).preview == Chunk(0, text, 200).preview
+
+
+class TestChunkStream:
+    """Incremental chunking matches batch chunking of the whole text."""
+
+    @staticmethod
+    def _pieces(text: str, step: int) -> list[str]:
+        return [text[i:i + step] for i in range(0, len(text), step)]
+
+    def test_window_stream_matches_batch(self):
+        text = _sentences(300)
+        chunker = TextChunker(chunk_size=500, overlap=60)
+        for step in (7, 130, 999, len(text)):
+            stream = chunker.stream()
+            pieces = self._pieces("  \n" + text + " \n", step)
+            streamed = [c for p in pieces for c in stream.feed(p)]
+            streamed += stream.close()
+            assert [c.text for c in streamed] == [c.text for c in chunker.chunk(text)]
+            assert [c.index for c in streamed] == list(range(len(streamed)))
+
+    def test_window_stream_releases_chunks_early(self):
+        stream = TextChunker(chunk_size=200, overlap=20).stream()
+        early = []
+        for piece in self._pieces(_sentences(100), 100):
+            early += stream.feed(piece)
+        assert len(early) > 3
+
+    def test_short_stream_single_chunk(self):
+        stream = TextChunker(chunk_size=200, overlap=20).stream()
+        assert stream.feed("Just one sentence. ") == []
+        assert [c.text for c in stream.close()] == ["Just one sentence."]
+
+    def test_content_defined_stream_buffers(self):
+        text = _sentences(200)
+        chunker = ContentDefinedChunker(chunk_size=800)
+        stream = chunker.stream()
+        assert stream.feed(text[:5000]) == []
+        stream.feed(text[5000:])
+        assert [c.text for c in stream.close()] == [c.text for c in chunker.chunk(text)]
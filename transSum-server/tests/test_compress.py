@@ -0,0 +1,110 @@
+"""Tests for the extractive pre-compression pass."""
+
+import asyncio
+
+import pytest
+
+from tests.test_pipeline import _mock_adapter
+from transsum.config import Settings
+from transsum.processing.chunker import TextChunker
+from transsum.processing.compress import (
+    ExtractiveCompressor,
+    TextRankScorer,
+    create_compressor,
+    split_sentences,
+)
+from transsum.processing.loader import DocumentLoader
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+
+_ON_TOPIC = [
+    "The team reviewed the marketing budget for the LinkedIn campaign.",
+    "Marketing agreed the LinkedIn campaign budget needs a review in March.",
+    "The LinkedIn campaign budget was approved by the marketing team.",
+]
+_FILLER = ["Yeah, okay, sure thing.", "Can everyone hear me now?", "Sorry, I was on mute."]
+
+
+def _transcript(turns: int = 24) -> str:
+    lines = []
+    for i in range(turns):
+        lines.append(f"Speaker {i % 3 + 1}")
+        lines.append(_ON_TOPIC[i % 3] if i % 2 else _FILLER[i % 3])
+    return "\n".join(lines)
+
+
+class TestSplitSentences:
+
+    def test_round_trips(self):
+        text = "Hi there. How are you?\nFine!  Ok\n\nEnd"
+        sentences = split_sentences(text)
+        assert "".join(sentences) == text
+        assert sentences == ["Hi there. ", "How are you?\n", "Fine!  ", "Ok\n\n", "End"]
+
+
+class TestExtractiveCompressor:
+
+    def test_keeps_central_sentences_and_labels(self):
+        text = _transcript()
+        out = ExtractiveCompressor(0.5).compress(text)
+
+        assert len(out) < 0.7 * len(text)
+        assert "Sorry, I was on mute." not in out
+        assert "LinkedIn campaign" in out
+        assert out.count("Speaker ") == text.count("Speaker ")
+
+    def test_order_preserved(self):
+        text = "\n".join(f"Item {i}: {_ON_TOPIC[i % 3]}" for i in range(20))
+        out = ExtractiveCompressor(0.5).compress(text)
+        numbers = [int(line.split(":")[0].split()[1]) for line in out.split("\n") if line]
+        assert len(numbers) < 20 and numbers == sorted(numbers)
+
+    def test_short_chunk_unchanged(self):
+        text = "One short sentence here. And another one there."
+        assert ExtractiveCompressor(0.3).compress(text) == text
+
+    def test_invalid_ratio_rejected(self):
+        with pytest.raises(ValueError):
+            ExtractiveCompressor(0)
+
+    def test_textrank(self):
+        pytest.importorskip("numpy")
+        out = ExtractiveCompressor(0.5, TextRankScorer()).compress(_transcript())
+        assert "LinkedIn campaign" in out and "Sorry, I was on mute." not in out
+
+    def test_factory(self):
+        assert create_compressor(Settings(compress_ratio=1.0)) is None
+        assert create_compressor(Settings(compress_ratio=0.4)).name == "tfidf:0.4"
+
+
+class TestPipelineCompression:
+
+    def test_map_prompts_shrink_for_summaries_only(self):
+        text = _transcript(96)
+
+        def _prompt_chars(task):
+            adapter = _mock_adapter()
+            pipeline = ProcessingPipeline(
+                adapter, TextChunker(1500, 0), compressor=ExtractiveCompressor(0.4),
+            )
+            doc = DocumentLoader.load_text(text)
+            result = asyncio.run(pipeline.run(doc, task, language="French"))
+            calls = adapter.generate.call_args_list[:-1]      # the MAP calls
+            return sum(len(c.args[0]) for c in calls), result
+
+        summarized, result = _prompt_chars(TaskType.SUMMARIZE)
+        translated, _ = _prompt_chars(TaskType.TRANSLATE)
+        assert summarized < 0.75 * translated
+        assert result.timings.stages["compress"] > 0
+
+    def test_logged_ratio_covers_one_run(self, caplog):
+        pipeline = ProcessingPipeline(
+            _mock_adapter(), TextChunker(1500, 0), compressor=ExtractiveCompressor(0.4),
+        )
+        doc = DocumentLoader.load_text(_transcript(96))
+
+        with caplog.at_level("INFO"):
+            for _ in range(2):
+                asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        logged = [r.getMessage() for r in caplog.records if "pre-pass kept" in r.getMessage()]
+        assert len(logged) == 2 and logged[0] == logged[1]
@@ -26,6 +26,15 @@ class TestSettingsDefaults:
         assert s.chunk_size == 4000
         assert s.chunk_overlap == 200
 
+    def test_default_map_concurrency(self):
+        s = Settings()
+        assert s.map_concurrency == 4
+
+    def test_lossy_chunk_reuse_is_opt_in(self):
+        s = Settings()
+        assert s.dedupe_chunks and s.dedupe_similarity == 1.0
+        assert not s.strip_boilerplate
+
 
 class TestAnthropicValidation:
     """Ensure Anthropic config is validated properly."""
@@ -83,4 +92,10 @@ class TestChunkValidation:
         os.environ["CHUNK_OVERLAP"] = "100"
         s = Settings()
         assert s.chunk_size == 2000
-        assert s.chunk_overlap == 100
\ No newline at end of file
+        assert s.chunk_overlap == 100
+
+    def test_overlap_tokens_must_be_less_than_chunk_tokens(self, monkeypatch):
+        monkeypatch.setenv("CHUNK_TOKENS", "500")
+        monkeypatch.setenv("OVERLAP_TOKENS", "500")
+        with pytest.raises(Exception, match="OVERLAP_TOKENS"):
+            Settings()
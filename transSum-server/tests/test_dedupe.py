@@ -0,0 +1,157 @@
+"""Tests for boilerplate stripping and duplicate-chunk reuse."""
+
+import asyncio
+
+from tests.test_pipeline import _mock_adapter
+from transsum.processing.chunker import TextChunker
+from transsum.processing.dedupe import BoilerplateFilter, ChunkDeduplicator
+from transsum.processing.loader import DocumentLoader, PageStream
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+from transsum.processing.text_cache import ExtractedTextCache
+
+
+def _page(i: int) -> str:
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota"]
+    body = "\n".join(
+        f"Line {k} of page {i}: " + " ".join(words[(i + k + j) % 9] for j in range(i % 4 + 6))
+        for k in range(5)
+    )
+    return f"ACME Corp — Confidential\n{body}\nPage {i} of 12"
+
+
+class TestBoilerplateFilter:
+
+    def test_strips_lines_repeated_across_pages(self):
+        filt = BoilerplateFilter(window=4)
+        out = []
+        for i in range(12):
+            out += filt.feed(_page(i))
+        out += filt.close()
+
+        assert len(out) == 12
+        assert all(f"Line 2 of page {i}" in page for i, page in enumerate(out))
+        # Only the first copy of the header and page footer is kept
+        assert "Confidential" in out[0] and "Page 0 of 12" in out[0]
+        assert not any("Confidential" in page or "of 12" in page for page in out[1:])
+        assert filt.lines_removed == 22
+
+    def test_numbers_matter_away_from_page_edges(self):
+        pages = [f"Header\nIntro {i}\nTotal {i * 7}\nMore {i}\nText {i}\nFooter" for i in range(6)]
+        filt = BoilerplateFilter(window=6)
+        for page in pages:
+            filt.feed(page)
+        out = filt.close()
+        assert all(f"Total {i * 7}" in page for i, page in enumerate(out))
+        assert not any("Header" in page for page in out[1:])
+
+    def test_holds_back_only_the_window(self):
+        filt = BoilerplateFilter(window=3)
+        assert filt.feed(_page(0)) == [] and filt.feed(_page(1)) == []
+        assert len(filt.feed(_page(2))) == 3
+        assert len(filt.feed(_page(3))) == 1
+
+    def test_short_document_left_alone(self):
+        filt = BoilerplateFilter()
+        pages = filt.feed(_page(0)) + filt.feed(_page(1)) + filt.close()
+        assert pages == [_page(0), _page(1)]
+
+
+class TestChunkDeduplicator:
+
+    TEXT = " ".join(f"word{i}" for i in range(400))
+
+    def test_exact_copy_ignores_case_and_spacing(self):
+        dedupe = ChunkDeduplicator(1.0)
+        assert dedupe.register(0, self.TEXT) is None
+        assert dedupe.register(1, "  " + self.TEXT.upper().replace(" ", "\n")) == 0
+
+    def test_exact_copy_without_normalizing(self):
+        dedupe = ChunkDeduplicator(1.0, normalize=False)
+        assert dedupe.register(0, self.TEXT) is None
+        assert dedupe.register(1, self.TEXT.upper()) is None
+        assert dedupe.register(2, self.TEXT) == 0
+
+    def test_near_copy(self):
+        dedupe = ChunkDeduplicator(0.9)
+        near = self.TEXT.replace("word200", "changed")
+        assert dedupe.register(0, self.TEXT) is None
+        assert dedupe.register(1, near) == 0
+        # An exact copy of the near copy resolves to the same original
+        assert dedupe.register(2, near) == 0
+
+    def test_exact_only_ignores_near_copy(self):
+        dedupe = ChunkDeduplicator(1.0)
+        dedupe.register(0, self.TEXT)
+        assert dedupe.register(1, self.TEXT.replace("word200", "changed")) is None
+
+    def test_different_text_kept(self):
+        dedupe = ChunkDeduplicator(0.9)
+        dedupe.register(0, self.TEXT)
+        assert dedupe.register(1, " ".join(f"other{i}" for i in range(400))) is None
+
+
+class TestPipelineDedupe:
+
+    def test_repeated_chunks_mapped_once(self):
+        adapter = _mock_adapter()
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(50, 0), map_concurrency=4, dedupe_similarity=0.9,
+        )
+        doc = DocumentLoader.load_text("Same words. " * 100)
+
+        result = asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        # One MAP call for the repeated chunk (plus the short tail), one reduce
+        assert adapter.generate.call_count <= 3
+        assert result.chunks_reused == result.chunks_processed - (adapter.generate.call_count - 1)
+        assert result.usage["prompt_tokens"] == 10 * adapter.generate.call_count
+
+    def test_translation_copies_must_match_case(self):
+        adapter = _mock_adapter()
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(50, 0), map_concurrency=4, dedupe_similarity=1.0,
+        )
+        doc = DocumentLoader.load_text("Order ID. " * 50 + "Order id. " * 50)
+
+        asyncio.run(pipeline.run(doc, TaskType.TRANSLATE, language="French"))
+
+        prompts = [c.args[0] for c in adapter.generate.call_args_list[:-1]]
+        assert any("Order ID." in p for p in prompts)
+        assert any("Order id." in p for p in prompts)
+        assert len(prompts) < 10    # exact copies are still mapped once
+
+    def test_boilerplate_stripped_from_streamed_pdf(self):
+        adapter = _mock_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(400, 0), strip_boilerplate=True)
+        stream = PageStream("report.pdf", ".pdf", iter([_page(i) for i in range(12)]))
+
+        result = asyncio.run(pipeline.run(stream, TaskType.SUMMARIZE))
+
+        prompts = [call.args[0] for call in adapter.generate.call_args_list]
+        assert sum(p.count("Confidential") for p in prompts[:-1]) == 1
+        # The document itself is left intact
+        assert result.document.content.count("Confidential") == 12
+
+    def test_boilerplate_stripped_on_text_cache_hit(self, tmp_path):
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"%PDF stand-in")
+        cache = ExtractedTextCache(tmp_path / "cache", max_bytes=1_000_000)
+        cache.put_pages(cache.key_for(path), [_page(i) for i in range(12)])
+        adapter = _mock_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(400, 0), strip_boilerplate=True)
+
+        stream = DocumentLoader.open(path, text_cache=cache)
+        asyncio.run(pipeline.run(stream, TaskType.SUMMARIZE))
+
+        prompts = [call.args[0] for call in adapter.generate.call_args_list]
+        assert sum(p.count("Confidential") for p in prompts[:-1]) == 1
+
+    def test_translation_keeps_boilerplate(self):
+        adapter = _mock_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(400, 0), strip_boilerplate=True)
+        stream = PageStream("report.pdf", ".pdf", iter([_page(i) for i in range(12)]))
+
+        asyncio.run(pipeline.run(stream, TaskType.TRANSLATE, language="French"))
+
+        prompts = [call.args[0] for call in adapter.generate.call_args_list]
+        assert sum(p.count("Confidential") for p in prompts[:-1]) == 12
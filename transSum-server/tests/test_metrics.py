@@ -0,0 +1,151 @@
+"""Tests for the MCP server's Prometheus metrics."""
+
+import asyncio
+
+import pytest
+
+from tests.test_pipeline import _mock_adapter
+from transsum.config import Settings
+from transsum.mcp import server
+from transsum.mcp.metrics import MetricsRegistry, ServerMetrics
+from transsum.models import pool
+from transsum.models.base import ModelResponse
+from transsum.models.cache import CachingAdapter, ResponseCache
+from transsum.models.pool import AdapterPool
+from transsum.models.router import RouterAdapter
+from transsum.processing.chunker import TextChunker
+from transsum.processing.loader import DocumentLoader
+from transsum.processing.pipeline import PipelineResult, ProcessingPipeline, TaskType
+from transsum.processing.timings import CallTiming, PipelineTimings
+
+
+class TestRegistry:
+
+    def test_counter_and_gauge_exposition(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls.", ("tool",))
+        busy = registry.gauge("busy", "In flight.")
+        calls.inc(tool="a")
+        calls.inc(2, tool='say "hi"')
+        busy.inc()
+        busy.dec()
+
+        text = registry.render()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{tool="a"} 1\n' in text
+        assert 'calls_total{tool="say \\"hi\\""} 2\n' in text
+        assert "busy 0\n" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", ("kind",))
+        for value in (0.004, 0.3, 0.3, 999):
+            latency.observe(value, kind="map")
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{kind="map",le="0.005"} 1\n' in text
+        assert 'latency_seconds_bucket{kind="map",le="0.25"} 1\n' in text
+        assert 'latency_seconds_bucket{kind="map",le="0.5"} 3\n' in text
+        assert 'latency_seconds_bucket{kind="map",le="+Inf"} 4\n' in text
+        assert 'latency_seconds_count{kind="map"} 4\n' in text
+        assert latency.count(kind="map") == 4
+
+
+class TestServerMetrics:
+
+    def test_track_counts_outcomes(self):
+        metrics = ServerMetrics()
+
+        async def _run():
+            async with metrics.track("summarize_text"):
+                assert metrics.tools_in_flight.value(tool="summarize_text") == 1
+            with pytest.raises(ValueError):
+                async with metrics.track("summarize_text"):
+                    raise ValueError("bad input")
+
+        asyncio.run(_run())
+        assert metrics.tools_in_flight.value(tool="summarize_text") == 0
+        assert metrics.tool_calls.value(tool="summarize_text", status="ok") == 1
+        assert metrics.tool_calls.value(tool="summarize_text", status="error") == 1
+        assert metrics.tool_errors.value(tool="summarize_text", error="ValueError") == 1
+        assert metrics.tool_seconds.count(tool="summarize_text") == 2
+
+    def test_record_result(self):
+        metrics = ServerMetrics()
+        timings = PipelineTimings(total_s=1.0, stages={"map": 0.8, "reduce": 0.2})
+        timings.calls = [CallTiming("map", 1, 0.0, 0.4), CallTiming("reduce", 0, 0.0, 0.2)]
+        metrics.record(PipelineResult(
+            output="x", task=TaskType.SUMMARIZE, chunks_processed=3, chunks_reused=1,
+            document=DocumentLoader.load_text("x"), model="m", provider="p", timings=timings,
+            usage={"prompt_tokens": 30, "completion_tokens": 12, "load_ms": 900},
+        ))
+
+        assert metrics.stage_seconds.count(stage="map") == 1
+        assert metrics.llm_seconds.count(provider="p", model="m", kind="reduce") == 1
+        assert metrics.tokens.value(provider="p", model="m", type="prompt") == 30
+        assert metrics.tokens.value(provider="p", model="m", type="completion") == 12
+        assert metrics.chunks.value(status="mapped") == 2
+        assert metrics.chunks.value(status="reused") == 1
+
+    def test_latency_labelled_by_serving_backend(self):
+        def _backend(name, fail=False):
+            backend = _mock_adapter()
+            backend.provider, backend.model = name, "m"
+            if fail:
+                backend.generate.side_effect = RuntimeError("down")
+            else:
+                backend.generate.return_value = ModelResponse(text="x", model="m", provider=name)
+
+            async def _stream(prompt, **kwargs):
+                if fail:
+                    raise RuntimeError("down")
+                yield "x"
+
+            backend.stream = _stream
+            return backend
+
+        router = RouterAdapter([_backend("ollama", fail=True), _backend("anthropic")])
+        pipeline = ProcessingPipeline(router, TextChunker(100, 0))
+        doc = DocumentLoader.load_text("A sentence of text here. " * 20)
+
+        async def _run():
+            async for event in pipeline.stream_events(doc, TaskType.SUMMARIZE):
+                if event.kind == "done":
+                    return event.result
+
+        metrics = ServerMetrics()
+        metrics.record(asyncio.run(_run()))
+        for kind in ("map", "reduce"):
+            assert metrics.llm_seconds.count(provider="anthropic", model="m", kind=kind) > 0
+            assert metrics.llm_seconds.count(provider="router", model=router.model, kind=kind) == 0
+
+
+class TestMetricsRoute:
+
+    def test_tool_call_shows_up_in_scrape(self, monkeypatch):
+        monkeypatch.setattr(server, "_metrics", ServerMetrics())
+        monkeypatch.setattr(server, "create_adapter", lambda settings: _mock_adapter())
+        asyncio.run(server.translate_text("Hello world.", target_language="French"))
+
+        response = asyncio.run(server.metrics(None))
+        body = response.body.decode()
+        assert response.media_type.startswith("text/plain")
+        assert 'transsum_tool_calls_total{tool="translate_text",status="ok"} 1' in body
+        assert 'transsum_tokens_total{provider="mock",model="mock-model",type="prompt"} 10' in body
+
+    def test_scrape_with_response_cache(self, monkeypatch, tmp_path):
+        inner = _mock_adapter()
+        inner.provider, inner.model = "mock", "mock-model"
+        cache = ResponseCache(tmp_path / "responses.sqlite3", max_bytes=1 << 20)
+        monkeypatch.setattr(pool, "create_adapter", lambda settings: CachingAdapter(inner, cache))
+        monkeypatch.setattr(server, "_pool", AdapterPool())
+
+        async def _run():
+            adapter = server._pool.get(Settings())
+            await adapter.generate("p")
+            await adapter.generate("p")
+            return await server.metrics(None)
+
+        body = asyncio.run(_run()).body.decode()
+        assert 'transsum_response_cache_lookups_total{result="hit"} 1' in body
+        assert 'transsum_response_cache_lookups_total{result="miss"} 1' in body
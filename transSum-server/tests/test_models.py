@@ -1,11 +1,13 @@
 """Tests for the model adapter factory."""
 
 import os
+
 import pytest
+
 from transsum.config import Settings
+from transsum.models.anthropic_adapter import AnthropicAdapter
 from transsum.models.factory import create_adapter
 from transsum.models.ollama import OllamaAdapter
-from transsum.models.anthropic_adapter import AnthropicAdapter
 
 
 class TestFactory:
@@ -33,6 +35,14 @@ class TestFactory:
         adapter = create_adapter(settings)
         assert isinstance(adapter, AnthropicAdapter)
 
+    def test_anthropic_batch_mode(self, monkeypatch):
+        from transsum.models.anthropic_batch import AnthropicBatchAdapter
+        monkeypatch.setenv("MODEL_PROVIDER", "anthropic")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+        monkeypatch.setenv("ANTHROPIC_BATCH", "true")
+        adapter = create_adapter(Settings())
+        assert isinstance(adapter, AnthropicBatchAdapter)
+
     def test_ollama_respects_custom_model(self):
         os.environ["MODEL_PROVIDER"] = "ollama"
         os.environ["OLLAMA_MODEL"] = "mistral"
@@ -41,9 +51,339 @@ class TestFactory:
         assert isinstance(adapter, OllamaAdapter)
         assert adapter._model == "mistral"
 
+    def test_cache_wraps_adapter(self, tmp_path):
+        from transsum.models.cache import CachingAdapter
+
+        os.environ["MODEL_PROVIDER"] = "ollama"
+        os.environ["OLLAMA_MODEL"] = "llama3.1"
+        settings = Settings(cache_enabled=True, cache_path=str(tmp_path / "c.sqlite3"))
+        adapter = create_adapter(settings)
+        assert isinstance(adapter, CachingAdapter)
+        assert adapter.provider == "ollama"
+        assert adapter.model == "llama3.1"
+        adapter.cache.close()
+
     def test_ollama_respects_custom_url(self):
         os.environ["MODEL_PROVIDER"] = "ollama"
         os.environ["OLLAMA_BASE_URL"] = "http://gpu-server:11434"
         settings = Settings()
         adapter = create_adapter(settings)
-        assert "gpu-server" in adapter._base_url
\ No newline at end of file
+        assert "gpu-server" in adapter._base_url
+
+class TestAdapterPool:
+    """Pooled adapters are shared per configuration and closed with the last lease."""
+
+    def setup_method(self):
+        os.environ["MODEL_PROVIDER"] = "ollama"
+        os.environ.pop("ANTHROPIC_API_KEY", None)
+
+    def test_same_settings_share_adapter(self):
+        from transsum.models.pool import AdapterPool
+
+        pool = AdapterPool()
+        assert pool.get(Settings()) is pool.get(Settings())
+
+    def test_different_model_gets_new_adapter(self):
+        from transsum.models.pool import AdapterPool
+
+        pool = AdapterPool()
+        a = pool.get(Settings(ollama_model="llama3.1"))
+        b = pool.get(Settings(ollama_model="mistral"))
+        assert a is not b
+        assert b.model == "mistral"
+
+    def test_closed_after_last_lease(self):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from transsum.models.pool import AdapterPool
+
+        async def _run():
+            pool = AdapterPool()
+            async with pool.lease():
+                async with pool.lease():
+                    adapter = pool.get(Settings())
+                    adapter.close = AsyncMock()
+                adapter.close.assert_not_called()
+            adapter.close.assert_awaited_once()
+
+        asyncio.run(_run())
+
+
+class TestConcurrencyLimitedAdapter:
+    """Calls beyond the limit wait for a free slot."""
+
+    def test_stream_holds_slot_until_closed(self):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from transsum.models.limits import ConcurrencyLimitedAdapter
+
+        inner = AsyncMock()
+
+        async def _stream(prompt, **kwargs):
+            yield "a"
+            yield "b"
+
+        inner.stream = _stream
+        adapter = ConcurrencyLimitedAdapter(inner, 1)
+
+        async def _run():
+            stream = adapter.stream("p")
+            assert await anext(stream) == "a"
+            assert adapter.in_flight == 1
+            waiting = asyncio.create_task(adapter.generate("q"))
+            await asyncio.sleep(0)
+            assert not waiting.done()
+            await stream.aclose()
+            await waiting
+            assert adapter.in_flight == 0
+
+        asyncio.run(_run())
+
+    def test_invalid_limit(self):
+        from transsum.models.limits import ConcurrencyLimitedAdapter
+        with pytest.raises(ValueError):
+            ConcurrencyLimitedAdapter(None, 0)
+
+
+class TestAnthropicPromptCache:
+    """The shared prompt prefix is marked with cache_control."""
+
+    SHARED = "Shared instructions and reference text. " * 100   # ~1,000 tokens
+
+    def test_prefix_becomes_cached_block(self):
+        adapter = AnthropicAdapter(api_key="sk-ant-test", prompt_cache=True)
+        prompt = self.SHARED + "Variable."
+        params = adapter._params(prompt, "System.", 0.3, 100, cache_prefix=len(self.SHARED))
+        first, second = params["messages"][0]["content"]
+        assert first == {
+            "type": "text", "text": self.SHARED, "cache_control": {"type": "ephemeral"},
+        }
+        assert second == {"type": "text", "text": "Variable."}
+        assert params["system"] == "System."
+
+    def test_short_prefix_sent_plain_with_warning(self, caplog):
+        adapter = AnthropicAdapter(api_key="sk-ant-test", prompt_cache=True)
+        with caplog.at_level("WARNING"):
+            for _ in range(2):
+                params = adapter._params(
+                    "Shared. Variable.", "System.", 0.3, 100, cache_prefix=8,
+                )
+        assert params["messages"][0]["content"] == "Shared. Variable."
+        assert params["system"] == "System."
+        # Warned once, not on every call
+        assert sum("no effect" in r.message for r in caplog.records) == 1
+
+    def test_haiku_needs_longer_prefix(self):
+        adapter = AnthropicAdapter(
+            api_key="sk-ant-test", model="claude-3-5-haiku-latest", prompt_cache=True,
+        )
+        prompt = self.SHARED + "Variable."
+        params = adapter._params(prompt, "", 0.3, 100, cache_prefix=len(self.SHARED))
+        assert params["messages"][0]["content"] == prompt
+
+    def test_disabled_sends_plain_prompt(self):
+        adapter = AnthropicAdapter(api_key="sk-ant-test")
+        params = adapter._params("Shared. Variable.", "System.", 0.3, 100, cache_prefix=8)
+        assert params["messages"][0]["content"] == "Shared. Variable."
+
+    def test_usage_reports_cache_tokens(self):
+        from types import SimpleNamespace
+        usage = SimpleNamespace(
+            input_tokens=40, output_tokens=10,
+            cache_read_input_tokens=1200, cache_creation_input_tokens=0,
+        )
+        assert AnthropicAdapter._usage(usage) == {
+            "prompt_tokens": 40, "completion_tokens": 10,
+            "cache_read_tokens": 1200, "cache_write_tokens": 0,
+        }
+
+
+class TestOllamaLifecycle:
+    """keep_alive on every request, preload via /api/ps + /api/generate."""
+
+    @staticmethod
+    def _adapter(handler, **kwargs):
+        import httpx
+
+        adapter = OllamaAdapter(model="llama3.1", max_retries=1, **kwargs)
+        adapter._client = httpx.AsyncClient(
+            base_url="http://ollama", transport=httpx.MockTransport(handler),
+        )
+        return adapter
+
+    def test_keep_alive_and_load_time_reported(self):
+        import asyncio
+        import json
+
+        import httpx
+
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={
+                "message": {"content": "ok"}, "done_reason": "stop",
+                "prompt_eval_count": 10, "eval_count": 2, "load_duration": 12_500_000_000,
+            })
+
+        adapter = self._adapter(handler, keep_alive="600")
+        resp = asyncio.run(adapter.generate("p"))
+        assert bodies[0]["keep_alive"] == 600
+        assert resp.usage == {"prompt_tokens": 10, "completion_tokens": 2, "load_ms": 12500}
+
+    def test_warm_model_reports_no_load(self):
+        import asyncio
+
+        import httpx
+
+        def handler(request):
+            return httpx.Response(200, json={
+                "message": {"content": "ok"}, "done_reason": "stop",
+                "prompt_eval_count": 10, "eval_count": 2, "load_duration": 15_000_000,
+            })
+
+        resp = asyncio.run(self._adapter(handler).generate("p"))
+        assert "load_ms" not in resp.usage
+
+    def test_warm_up_loads_missing_model(self):
+        import asyncio
+
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path == "/api/ps":
+                return httpx.Response(200, json={"models": [{"model": "mistral:latest"}]})
+            return httpx.Response(200, json={"done": True, "load_duration": 10**9})
+
+        adapter = self._adapter(handler, keep_alive="30m")
+        asyncio.run(adapter.warm_up())
+        assert calls == ["/api/ps", "/api/generate"]
+
+    def test_warm_up_skips_loaded_model(self):
+        import asyncio
+
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(200, json={"models": [{"model": "llama3.1:latest"}]})
+
+        adapter = self._adapter(handler)
+        assert asyncio.run(adapter.is_loaded())
+        asyncio.run(adapter.warm_up())
+        assert calls == ["/api/ps", "/api/ps"]
+
+    def test_warm_up_failure_is_not_raised(self):
+        import asyncio
+
+        import httpx
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        asyncio.run(self._adapter(handler).warm_up())
+
+    def test_invalid_keep_alive_rejected(self):
+        with pytest.raises(ValueError):
+            Settings(ollama_keep_alive="forever")
+
+
+class TestRouterAdapter:
+    """Failover across backends, and hedging slow calls to the next one."""
+
+    @staticmethod
+    def _backend(name, delay=0.0, error=None):
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from transsum.models.base import ModelResponse
+
+        backend = MagicMock()
+        backend.provider, backend.model = name, "m"
+        backend.cancelled = False
+
+        async def _generate(prompt, **kwargs):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                backend.cancelled = True
+                raise
+            if error:
+                raise error
+            return ModelResponse(text=name, model="m", provider=name)
+
+        backend.generate = _generate
+        return backend
+
+    def test_fails_over_on_error(self):
+        import asyncio
+
+        from transsum.models.router import RouterAdapter
+
+        router = RouterAdapter([
+            self._backend("ollama", error=RuntimeError("Ollama down")),
+            self._backend("anthropic"),
+        ])
+        assert asyncio.run(router.generate("p")).text == "anthropic"
+        assert router.failovers == 1
+
+    def test_fails_over_on_timeout(self):
+        import asyncio
+
+        from transsum.models.router import RouterAdapter
+
+        slow = self._backend("ollama", delay=5)
+        router = RouterAdapter([slow, self._backend("anthropic")], timeout=0.05)
+        assert asyncio.run(router.generate("p")).text == "anthropic"
+        assert slow.cancelled
+
+    def test_all_failing_raises(self):
+        import asyncio
+
+        from transsum.models.router import RouterAdapter
+
+        router = RouterAdapter([
+            self._backend("a", error=RuntimeError("x")),
+            self._backend("b", error=RuntimeError("y")),
+        ])
+        with pytest.raises(RuntimeError, match="All 2 backends failed"):
+            asyncio.run(router.generate("p"))
+
+    def test_hedge_first_answer_wins(self):
+        import asyncio
+
+        from transsum.models.router import RouterAdapter
+
+        slow = self._backend("primary", delay=5)
+        router = RouterAdapter([slow, self._backend("secondary")], hedge=True, hedge_after=0.05)
+        assert asyncio.run(router.generate("p")).text == "secondary"
+        assert router.hedges == 1
+        assert slow.cancelled
+
+    def test_hedge_delay_is_p95(self):
+        from transsum.models.router import RouterAdapter
+
+        router = RouterAdapter([self._backend("a"), self._backend("b")], hedge=True)
+        assert router.hedge_delay(0) is None
+        router._latencies[0].extend(i / 100 for i in range(1, 101))
+        assert router.hedge_delay(0) == pytest.approx(0.95)
+
+    def test_factory_builds_router(self, monkeypatch):
+        from transsum.models.router import RouterAdapter
+
+        monkeypatch.setenv("MODEL_PROVIDER", "ollama")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+        adapter = create_adapter(Settings(fallback_providers="anthropic"))
+        assert isinstance(adapter, RouterAdapter)
+        assert [b.provider for b in adapter.backends] == ["ollama", "anthropic"]
+
+    def test_unknown_fallback_rejected(self):
+        with pytest.raises(ValueError):
+            Settings(fallback_providers="openai")
@@ -5,11 +5,18 @@ Uses a mock adapter so no real LLM calls are made.
 """
 
 import asyncio
+import re
+import threading
+import tracemalloc
+from contextlib import aclosing
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from transsum.models.base import ModelResponse
-from transsum.processing.loader import DocumentLoader
+from transsum.processing import loader as loader_module
+from transsum.processing.loader import DocumentLoader, PageStream
+from transsum.processing.text_cache import ExtractedTextCache
 from transsum.processing.chunker import TextChunker
 from transsum.processing.pipeline import ProcessingPipeline, TaskType
 
@@ -87,6 +94,476 @@ class TestMultiChunkPipeline:
         assert result.usage["prompt_tokens"] == 10 * total_calls
         assert result.usage["completion_tokens"] == 20 * total_calls
 
+    def test_model_load_is_longest_not_summed(self):
+        adapter = _mock_adapter("Result.")
+        # Calls that waited on one model load all report (part of) it
+        adapter.generate.side_effect = [
+            ModelResponse(
+                text="Result.", model="mock-model", provider="mock",
+                usage={"prompt_tokens": 10, "completion_tokens": 20, "load_ms": ms},
+            )
+            for ms in (9000, 8500, 8800, *[0] * 20)
+        ]
+        pipeline = ProcessingPipeline(adapter, TextChunker(chunk_size=50, overlap=10))
+        doc = DocumentLoader.load_text("Word " * 100)
+        result = asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        assert result.usage["load_ms"] == 9000
+        assert result.usage["prompt_tokens"] == 10 * adapter.generate.call_count
+
+
+class TestPromptPrefix:
+    """Chunk prompts start with a prefix shared by every chunk."""
+
+    def test_cache_prefix_identical_across_chunks(self):
+        adapter = _mock_adapter()
+        adapter.generate.return_value.usage = {
+            "prompt_tokens": 10, "completion_tokens": 20, "cache_read_tokens": 100,
+        }
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10))
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        result = asyncio.run(pipeline.run(doc, TaskType.TRANSLATE, language="French"))
+
+        calls = adapter.generate.call_args_list[:-1]      # MAP calls
+        prefixes = {c.args[0][:c.kwargs["cache_prefix"]] for c in calls}
+        assert len(calls) > 1 and len(prefixes) == 1
+        assert "French" in prefixes.pop()
+        assert result.usage["cache_read_tokens"] == 100 * adapter.generate.call_count
+
+
+class TestConcurrentMap:
+    """The MAP phase runs chunks concurrently but keeps results in order."""
+
+    @staticmethod
+    def _echo_adapter() -> AsyncMock:
+        """Adapter that echoes the chunk number, finishing later chunks first."""
+        state = {"in_flight": 0, "peak": 0}
+
+        async def _generate(prompt, **kwargs):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            label = prompt.split("(chunk ")[1].split(" of")[0] if "(chunk " in prompt else "merge"
+            await asyncio.sleep(0.02 / int(label) if label.isdigit() else 0)
+            state["in_flight"] -= 1
+            text = prompt if label == "merge" else f"<{label}>"
+            return ModelResponse(
+                text=text, model="mock-model", provider="mock",
+                usage={"prompt_tokens": 1, "completion_tokens": 2},
+            )
+
+        adapter = AsyncMock()
+        adapter.generate.side_effect = _generate
+        adapter.state = state
+        return adapter
+
+    def test_partials_kept_in_chunk_order(self):
+        adapter = self._echo_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=8)
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        result = asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        labels = [f"<{i}>" for i in range(1, result.chunks_processed + 1)]
+        positions = [result.output.index(label) for label in labels]
+        assert positions == sorted(positions)
+
+    def test_in_flight_calls_bounded(self):
+        adapter = self._echo_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=3)
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        assert adapter.state["peak"] == 3
+
+    def test_per_call_override(self):
+        adapter = self._echo_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=8)
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE, map_concurrency=1))
+
+        assert adapter.state["peak"] == 1
+
+    def test_progress_is_monotonic(self):
+        adapter = self._echo_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=8)
+        doc = DocumentLoader.load_text("Word " * 100)
+        messages: list[str] = []
+
+        result = asyncio.run(
+            pipeline.run(doc, TaskType.SUMMARIZE, on_progress=messages.append)
+        )
+
+        total = result.chunks_processed
+        processed = [m for m in messages if m.startswith("Processed chunk")]
+        assert processed == [f"Processed chunk {i}/{total}" for i in range(1, total + 1)]
+
+    def test_failure_cancels_outstanding_calls(self):
+        adapter = _mock_adapter()
+        adapter.generate.side_effect = RuntimeError("backend down")
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=4)
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        with pytest.raises(RuntimeError, match="backend down"):
+            asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+    def test_invalid_concurrency_rejected(self):
+        with pytest.raises(ValueError, match="map_concurrency"):
+            ProcessingPipeline(_mock_adapter(), TextChunker(50, 10), map_concurrency=0)
+
+
+class TestTreeReducePipeline:
+    """REDUCE_STRATEGY=tree bounds the final merge prompt."""
+
+    def test_final_prompt_bounded(self):
+        adapter = _mock_adapter("A fairly short partial summary of this section.")
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(50, 10),
+            map_concurrency=4, reduce_strategy="tree", reduce_token_budget=50,
+        )
+        doc = DocumentLoader.load_text("Word " * 400)
+
+        single = ProcessingPipeline(_mock_adapter(), TextChunker(50, 10))
+        baseline = asyncio.run(single.run(doc, TaskType.SUMMARIZE))
+        result = asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        final_prompt = adapter.generate.call_args_list[-1].args[0]
+        assert result.chunks_processed == baseline.chunks_processed
+        assert adapter.generate.call_count > baseline.chunks_processed + 1
+        # Each partial is ~12 estimated tokens, so a 50-token budget fits 4
+        assert final_prompt.count("**Section") <= 4
+        assert result.usage["prompt_tokens"] == 10 * adapter.generate.call_count
+
+    def test_merges_start_during_map(self):
+        order: list[str] = []
+
+        async def _generate(prompt, **kwargs):
+            order.append("merge" if prompt.startswith("Below are summaries") else "map")
+            await asyncio.sleep(0.002)
+            return ModelResponse(
+                text="A fairly short partial summary of this section.",
+                model="mock-model", provider="mock",
+            )
+
+        adapter = _mock_adapter()
+        adapter.generate.side_effect = _generate
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(50, 10),
+            map_concurrency=4, reduce_strategy="tree", reduce_token_budget=50,
+        )
+        doc = DocumentLoader.load_text("Word " * 1000)
+
+        asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+
+        last_map = len(order) - 1 - order[::-1].index("map")
+        assert order.index("merge") < last_map // 2
+
+    def test_translate_keeps_single_reduce(self):
+        adapter = _mock_adapter("Traduit.")
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(50, 10), reduce_strategy="tree", reduce_token_budget=50,
+        )
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        result = asyncio.run(pipeline.run(doc, TaskType.TRANSLATE, language="French"))
+
+        assert adapter.generate.call_count == result.chunks_processed + 1
+
+    def test_unknown_strategy_rejected(self):
+        with pytest.raises(ValueError, match="reduce strategy"):
+            ProcessingPipeline(_mock_adapter(), TextChunker(50, 10), reduce_strategy="fold")
+
+
+def _streaming_adapter(tokens: list[str]) -> AsyncMock:
+    """Mock adapter whose stream() yields `tokens` and generate() a fixed reply."""
+    adapter = _mock_adapter("Partial.")
+    adapter.model = "mock-model"
+    adapter.provider = "mock"
+
+    async def _stream(prompt, **kwargs):
+        for token in tokens:
+            yield token
+
+    adapter.stream = MagicMock(side_effect=_stream)
+    return adapter
+
+
+async def _collect(aiter) -> list:
+    return [item async for item in aiter]
+
+
+class TestStreamEvents:
+    """stream_events streams map progress and the final output."""
+
+    def test_multi_chunk_streams_reduce(self):
+        adapter = _streaming_adapter(["Final ", "merged ", "output."])
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=4)
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        events = asyncio.run(_collect(pipeline.stream_events(doc, TaskType.SUMMARIZE)))
+        kinds = [e.kind for e in events]
+        total = events[0].total
+
+        assert kinds[0] == "chunks"
+        assert kinds.count("mapped") == total
+        assert kinds.index("reduce") > max(i for i, k in enumerate(kinds) if k == "mapped")
+        assert [e.text for e in events if e.kind == "token"] == ["Final ", "merged ", "output."]
+        assert kinds[-1] == "done"
+        assert events[-1].result.output == "Final merged output."
+        assert events[-1].result.model == "mock-model"
+        # Only the MAP calls use generate(); the reduce is streamed
+        assert adapter.generate.call_count == total
+        adapter.stream.assert_called_once()
+
+    def test_single_chunk_streams_directly(self):
+        adapter = _streaming_adapter(["Short ", "summary."])
+        pipeline = ProcessingPipeline(adapter, TextChunker(10000, 200))
+        doc = DocumentLoader.load_text("A short document.")
+
+        events = asyncio.run(_collect(pipeline.stream_events(doc, TaskType.SUMMARIZE)))
+
+        assert [e.kind for e in events] == ["chunks", "token", "token", "done"]
+        assert events[-1].result.output == "Short summary."
+        adapter.generate.assert_not_called()
+
+    def test_stream_run_yields_tokens_for_multi_chunk(self):
+        adapter = _streaming_adapter(["a", "b", "c"])
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10))
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        tokens = asyncio.run(_collect(pipeline.stream_run(doc, TaskType.TRANSLATE)))
+
+        assert tokens == ["a", "b", "c"]
+
+
+class TestIncrementalMap:
+    """A MAP store lets re-runs skip chunks whose text is unchanged."""
+
+    @staticmethod
+    def _pipeline(adapter, tmp_path):
+        from transsum.models.cache import ResponseCache
+        from transsum.processing.chunker import ContentDefinedChunker
+
+        store = ResponseCache(tmp_path / "map.sqlite3", max_bytes=10_000_000)
+        return ProcessingPipeline(
+            adapter, ContentDefinedChunker(chunk_size=600), map_store=store,
+        )
+
+    def test_edit_only_remaps_changed_chunks(self, tmp_path):
+        text = " ".join(f"Sentence number {i} talks about topic {i % 7}." for i in range(300))
+        edited = text.replace("Sentence number 150 ", "Sentence number one-fifty ")
+
+        first_adapter = _mock_adapter("Partial.")
+        first_adapter.provider, first_adapter.model = "mock", "mock-model"
+        pipeline = self._pipeline(first_adapter, tmp_path)
+        first = asyncio.run(pipeline.run(DocumentLoader.load_text(text), TaskType.SUMMARIZE))
+        asyncio.run(pipeline.close())
+
+        second_adapter = _mock_adapter("Partial.")
+        second_adapter.provider, second_adapter.model = "mock", "mock-model"
+        pipeline = self._pipeline(second_adapter, tmp_path)
+        second = asyncio.run(pipeline.run(DocumentLoader.load_text(edited), TaskType.SUMMARIZE))
+        asyncio.run(pipeline.close())
+
+        assert first.chunks_reused == 0
+        assert second.chunks_reused >= second.chunks_processed - 2
+        # changed chunks + the reduce step
+        assert second_adapter.generate.call_count <= 3
+
+
+class TestPageStreaming:
+    """A PageStream is mapped while later pages are still being extracted."""
+
+    @staticmethod
+    def _pages(n: int, gate=None):
+        for i in range(n):
+            if gate is not None and i == n - 1:
+                # Hold back the last page until MAP has started
+                assert gate.wait(5), "MAP did not start before extraction finished"
+            yield f"Page {i} text. " * 20
+
+    def test_same_result_as_loaded_document(self):
+        pages = list(self._pages(6))
+        doc = DocumentLoader.load_text("\n\n".join(pages))
+        stream = PageStream("report.pdf", ".pdf", iter(pages))
+
+        async def _run(document):
+            pipeline = ProcessingPipeline(_mock_adapter(), TextChunker(400, 40))
+            return await pipeline.run(document, TaskType.SUMMARIZE)
+
+        batch = asyncio.run(_run(doc))
+        streamed = asyncio.run(_run(stream))
+        assert streamed.chunks_processed == batch.chunks_processed > 1
+        assert streamed.document.content == doc.content
+        assert streamed.document.filename == "report.pdf"
+
+    def test_map_starts_before_last_page(self):
+        gate = threading.Event()
+        adapter = _streaming_adapter(["Done."])
+        response = adapter.generate.return_value
+
+        async def _generate(prompt, **kwargs):
+            gate.set()
+            return response
+
+        adapter.generate.side_effect = _generate
+        stream = PageStream("scan.pdf", ".pdf", self._pages(6, gate))
+        pipeline = ProcessingPipeline(adapter, TextChunker(400, 40), map_concurrency=2)
+        events = asyncio.run(_collect(pipeline.stream_events(stream, TaskType.TRANSLATE)))
+
+        kinds = [e.kind for e in events]
+        assert kinds.index("mapped") < kinds.index("chunks")
+        assert events[-1].result.chunks_processed == kinds.count("mapped")
+
+    def test_reading_waits_for_map_slots(self):
+        state = {"read": 0, "mapped": 0, "ahead": 0}
+
+        def _pages():
+            for page in self._pages(60):
+                state["ahead"] = max(state["ahead"], state["read"] - state["mapped"])
+                state["read"] += 1
+                yield page
+
+        async def _generate(prompt, **kwargs):
+            # Pages up to the last one this chunk reaches have been mapped
+            pages = [int(n) + 1 for n in re.findall(r"Page (\d+) text", prompt)]
+            state["mapped"] = max([state["mapped"], *pages])
+            await asyncio.sleep(0.005)
+            return ModelResponse(text="Partial.", model="mock-model", provider="mock")
+
+        adapter = _mock_adapter()
+        adapter.generate.side_effect = _generate
+        stream = PageStream("long.pdf", ".pdf", _pages(), keep_text=False)
+        pipeline = ProcessingPipeline(adapter, TextChunker(400, 40), map_concurrency=2)
+        result = asyncio.run(pipeline.run(stream, TaskType.SUMMARIZE))
+
+        assert result.chunks_processed > 30
+        # A chunk waiting for a slot and the chunker's window, not the document
+        assert state["ahead"] <= 5
+
+    def test_single_page_uses_fast_path(self):
+        adapter = _mock_adapter()
+        stream = PageStream("one.pdf", ".pdf", iter(["Short page."]))
+        pipeline = ProcessingPipeline(adapter, TextChunker(1000, 100))
+        result = asyncio.run(pipeline.run(stream, TaskType.SUMMARIZE))
+        assert result.chunks_processed == 1
+        assert adapter.generate.call_count == 1
+
+    def test_open_text_file(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_text("  Some notes.  ")
+        stream = DocumentLoader.open(path)
+        assert asyncio.run(_collect(stream)) == ["  Some notes.  "]
+        assert stream.document.content == "Some notes."
+
+    def test_open_empty_file_raises_on_read(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_text("   ")
+        with pytest.raises(ValueError, match="empty"):
+            asyncio.run(_collect(DocumentLoader.open(path)))
+
+    def test_stream_without_chunks_raises_empty(self):
+        chunker = MagicMock()
+        chunker.stream.return_value.feed.return_value = []
+        chunker.stream.return_value.close.return_value = []
+        pipeline = ProcessingPipeline(_mock_adapter(), chunker)
+        stream = PageStream("blank.pdf", ".pdf", iter(["Only boilerplate."]))
+        with pytest.raises(ValueError, match="empty after extraction: blank.pdf"):
+            asyncio.run(_collect(pipeline.stream_events(stream, TaskType.SUMMARIZE)))
+
+    def test_abandoned_stream_closes_pages(self):
+        closed = threading.Event()
+
+        def _pages():
+            try:
+                yield from self._pages(4)
+            finally:
+                closed.set()
+
+        pages = _pages()   # held here, so garbage collection can't close it
+
+        async def _read_one():
+            stream = PageStream("report.pdf", ".pdf", pages)
+            async with aclosing(aiter(stream)) as pieces:
+                await anext(pieces)
+            assert closed.is_set()
+
+        asyncio.run(_read_one())
+
+    def test_cancelled_read_closes_pages_after_page(self):
+        started, release, closed = threading.Event(), threading.Event(), threading.Event()
+
+        def _pages():
+            try:
+                started.set()
+                assert release.wait(5)
+                yield "Page text."
+            finally:
+                closed.set()
+
+        pages = _pages()
+
+        async def _cancel_mid_page():
+            task = asyncio.ensure_future(_collect(PageStream("slow.pdf", ".pdf", pages)))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert not closed.is_set()
+            release.set()
+            # Closed once the worker thread hands the page back
+            assert await asyncio.to_thread(closed.wait, 5)
+
+        asyncio.run(_cancel_mid_page())
+
+
+class TestTimings:
+    """Every result carries a per-stage and per-call timing breakdown."""
+
+    def test_map_reduce_breakdown(self):
+        adapter = TestConcurrentMap._echo_adapter()
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10), map_concurrency=2)
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        result = asyncio.run(pipeline.run(doc, TaskType.SUMMARIZE))
+        timings = result.timings
+
+        assert {"chunk", "queue", "map", "reduce", "notify"} <= set(timings.stages)
+        assert len(timings.chunk_latencies) == result.chunks_processed
+        assert [c.kind for c in timings.calls].count("reduce") == 1
+        assert timings.total_s >= timings.stages["map"] > 0
+        # With two slots, later chunks wait for one
+        assert timings.stages["queue"] > 0
+        assert timings.first_token_s is None
+
+        summary = timings.to_dict()
+        assert summary["calls"] == len(timings.calls)
+        assert summary["map_latency_ms"]["p95"] == summary["map_latency_ms"]["max"]
+        assert summary["completion_tokens_per_s"] > summary["prompt_tokens_per_s"] > 0
+
+    def test_streamed_first_token(self):
+        adapter = _streaming_adapter(["Final ", "output."])
+        pipeline = ProcessingPipeline(adapter, TextChunker(50, 10))
+        doc = DocumentLoader.load_text("Word " * 100)
+
+        events = asyncio.run(_collect(pipeline.stream_events(doc, TaskType.SUMMARIZE)))
+        timings = events[-1].result.timings
+
+        assert 0 < timings.first_token_s <= timings.total_s
+        assert timings.to_dict()["first_token_ms"] is not None
+
+    def test_streamed_document_records_load(self):
+        pages = [f"Page {i} text. " * 20 for i in range(4)]
+        stream = PageStream("report.pdf", ".pdf", iter(pages))
+        pipeline = ProcessingPipeline(_mock_adapter(), TextChunker(400, 40))
+
+        result = asyncio.run(pipeline.run(stream, TaskType.SUMMARIZE))
+
+        assert result.timings.stages["load"] > 0
+        assert result.timings.stages["chunk"] > 0
+
 
 class TestPipelineMetadata:
     """Verify metadata is passed through correctly."""
@@ -147,10 +624,167 @@ class TestDocumentLoader:
             DocumentLoader.load(path)
 
 
+class TestTextFileReading:
+    """Plain-text files are decoded from a memory map, block by block."""
+
+    SAMPLES = [
+        "",
+        "   \n\t ",
+        "one",
+        "  leading and trailing  \n",
+        "word\u3000wide\u00a0space  — ünïcode 日本語テキスト\n\n",
+        "a b\nc\t\td " * 50,
+    ]
+
+    def test_stats_match_strip_and_split(self, monkeypatch):
+        monkeypatch.setattr(loader_module, "_STATS_SLICE", 3)
+        for text in self.SAMPLES:
+            for size in (1, 2, 5, 1000):
+                stats = loader_module._TextStats()
+                for i in range(0, len(text), size):
+                    stats.feed(text[i:i + size])
+                assert stats.char_count == len(text.strip()), (text, size)
+                assert stats.word_count == len(text.split()), (text, size)
+
+    def test_load_matches_read_text(self, tmp_path):
+        path = tmp_path / "log.txt"
+        text = "\n  Ünïcode log — 日本語 line.\r\n" * 40 + "\t\n"
+        path.write_bytes(text.encode("utf-8") + b"\xff end \n")
+        expected = path.read_text(encoding="utf-8", errors="replace").strip()
+        doc = DocumentLoader.load(path)
+        assert doc.content == expected
+        assert doc.word_count == len(expected.split())
+
+    def test_open_splits_multibyte_characters_safely(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader_module, "_TEXT_BLOCK", 7)
+        path = tmp_path / "export.csv"
+        path.write_bytes("id,name\r\n1,José\r\n2,日本\r3,Zoë\n".encode() * 5)
+        stream = DocumentLoader.open(path)
+        pieces = asyncio.run(_collect(stream))
+        assert len(pieces) > 1
+        assert "".join(pieces) == path.read_text(encoding="utf-8")
+        loaded = DocumentLoader.load(path)
+        assert stream.document == loaded
+
+    def test_pipeline_memory_does_not_grow_with_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader_module, "_TEXT_BLOCK", 64 * 1024)
+        path = tmp_path / "big.txt"
+        with path.open("w", encoding="utf-8") as f:
+            for i in range(100_000):
+                f.write(f"Line {i} of a long log export, with nothing remarkable in it.\n")
+
+        class _SlowAdapter:
+            # Not a mock: mocks keep every prompt they are called with
+            model, provider = "mock-model", "mock"
+
+            async def generate(self, prompt, **kwargs):
+                await asyncio.sleep(0.001)
+                return ModelResponse(text="Partial.", model=self.model, provider=self.provider)
+
+        pipeline = ProcessingPipeline(_SlowAdapter(), TextChunker(4000, 200), map_concurrency=4)
+        stream = DocumentLoader.open(path, keep_text=False)
+        tracemalloc.start()
+        try:
+            result = asyncio.run(pipeline.run(stream, TaskType.SUMMARIZE))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert result.chunks_processed > 1000
+        # Per-chunk results and timings remain, but chunk text doesn't pile up
+        assert peak < path.stat().st_size / 2
+
+
+def _write_pdf(path, pages: list[str]) -> None:
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    objs = ["<< /Type /Catalog /Pages 2 0 R >>", "",
+            "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objs.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objs.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objs)} 0 R >>"
+        )
+        kids.append(f"{len(objs)} 0 R")
+    objs[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, body in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+class TestPdfExtraction:
+    """PDF pages can be extracted by a process pool, in order."""
+
+    def test_parallel_matches_serial(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader_module, "_PARALLEL_MIN_PAGES", 2)
+        path = tmp_path / "report.pdf"
+        _write_pdf(path, [f"Page {i} says hello." for i in range(9)])
+
+        serial = DocumentLoader.load(path)
+        parallel = DocumentLoader.load(path, pdf_workers=2)
+        assert parallel.content == serial.content
+        assert serial.content.startswith("Page 0 says hello.")
+
+    def test_small_pdf_stays_serial(self, tmp_path, monkeypatch):
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("process pool started for a small PDF")
+
+        monkeypatch.setattr(loader_module, "ProcessPoolExecutor", _no_pool)
+        path = tmp_path / "short.pdf"
+        _write_pdf(path, ["One.", "Two."])
+        doc = DocumentLoader.load(path, pdf_workers=4)
+        assert doc.content == "One.\n\nTwo."
+
+    def test_text_cache_skips_reextraction(self, tmp_path, monkeypatch):
+        path = tmp_path / "report.pdf"
+        _write_pdf(path, ["First page.", "Second page."])
+        cache = ExtractedTextCache(tmp_path / "cache", max_bytes=1_000_000)
+        first = DocumentLoader.load(path, text_cache=cache)
+
+        def _no_extract(*args, **kwargs):
+            raise AssertionError("PDF re-extracted despite cache")
+
+        monkeypatch.setattr(DocumentLoader, "_iter_pdf_pages", staticmethod(_no_extract))
+        again = DocumentLoader.load(path, text_cache=cache)
+        streamed = asyncio.run(_collect(DocumentLoader.open(path, text_cache=cache)))
+        assert again.content == first.content == "First page.\n\nSecond page."
+        # Page by page, as when the PDF was first extracted
+        assert streamed == ["First page.", "\n\nSecond page."]
+
+    def test_stream_without_kept_text(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader_module, "_TEXT_BLOCK", 64)
+        path = tmp_path / "log.txt"
+        path.write_text("A line of the log.\n" * 100, encoding="utf-8")
+        stream = DocumentLoader.open(path, keep_text=False)
+        pieces = asyncio.run(_collect(stream))
+        loaded = DocumentLoader.load(path)
+        assert len(pieces) > 1 and stream._seen == []
+        assert stream.document.content == ""
+        assert stream.document.word_count == loaded.word_count
+        assert stream.document.char_count == loaded.char_count
+
+    def test_streamed_pages_in_order(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(loader_module, "_PARALLEL_MIN_PAGES", 2)
+        path = tmp_path / "report.pdf"
+        _write_pdf(path, [f"Page {i}." for i in range(6)])
+        pieces = asyncio.run(_collect(DocumentLoader.open(path, pdf_workers=3)))
+        assert "".join(pieces) == "\n\n".join(f"Page {i}." for i in range(6))
+
+
 # ── Quality Check Tests ──────────────────────────────────────────────────────
 
 from mcp.types import TextContent, CreateMessageResult
-from transsum.mcp.server import _quality_check, _check_roots
+from transsum.mcp.server import _quality_check, _check_roots, _pipeline
 
 
 def _mock_ctx(response_text: str) -> MagicMock:
@@ -233,4 +867,39 @@ class TestCheckRoots:
 
     def test_empty_roots_allows_access(self):
         ctx = _mock_roots_ctx([])
-        asyncio.run(_check_roots(ctx, "/any/path.txt"))  # Should not raise
\ No newline at end of file
+        asyncio.run(_check_roots(ctx, "/any/path.txt"))  # Should not raise
+
+# ── Adapter Pool in the MCP Server ──────────────────────────────────────────
+
+
+class TestServerPipeline:
+    """Tool calls reuse the pooled adapter from the lifespan context."""
+
+    def test_pooled_adapter_reused_and_left_open(self):
+        adapter = _mock_adapter()
+        pool = MagicMock()
+        pool.get.return_value = adapter
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context = pool
+
+        async def _run():
+            async with _pipeline(ctx) as first:
+                pass
+            async with _pipeline(ctx) as second:
+                pass
+            return first, second
+
+        first, second = asyncio.run(_run())
+        assert first._adapter is second._adapter is adapter
+        adapter.close.assert_not_called()
+
+    def test_without_ctx_adapter_is_closed(self, monkeypatch):
+        adapter = _mock_adapter()
+        monkeypatch.setattr("transsum.mcp.server.create_adapter", lambda settings: adapter)
+
+        async def _run():
+            async with _pipeline(None):
+                pass
+
+        asyncio.run(_run())
+        adapter.close.assert_awaited_once()
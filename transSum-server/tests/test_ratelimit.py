@@ -0,0 +1,218 @@
+"""Tests for the shared rate limiter and the adapters' rate-limit signals."""
+
+import asyncio
+import sqlite3
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from transsum.models import ratelimit
+from transsum.models.anthropic_adapter import AnthropicAdapter
+from transsum.models.base import ModelResponse, RateLimitError
+from transsum.models.ollama import OllamaAdapter
+from transsum.models.ratelimit import RateLimitedAdapter, RateLimiter, RateLimitHeaders
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake wall clock; sleeping advances it instantly and is recorded."""
+    class _Clock:
+        def __init__(self):
+            self.now = 1_000_000.0
+            self.slept: list[float] = []
+
+    fake = _Clock()
+
+    async def _sleep(seconds):
+        fake.slept.append(seconds)
+        fake.now += seconds
+
+    monkeypatch.setattr(ratelimit.time, "time", lambda: fake.now)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", _sleep)
+    return fake
+
+
+class TestHeaders:
+
+    def test_anthropic_headers(self):
+        h = RateLimitHeaders.parse({
+            "Anthropic-RateLimit-Requests-Remaining": "0",
+            "anthropic-ratelimit-requests-reset": "2099-01-01T00:00:00Z",
+            "anthropic-ratelimit-tokens-remaining": "12000",
+            "retry-after": "7",
+        })
+        assert h.requests_remaining == 0
+        assert h.requests_reset > 0
+        assert h.tokens_remaining == 12000
+        assert h.retry_after == 7.0
+
+    def test_gateway_durations(self):
+        h = RateLimitHeaders.parse({
+            "x-ratelimit-remaining-tokens": "500",
+            "x-ratelimit-reset-tokens": "1m30s",
+            "x-ratelimit-reset-requests": "250ms",
+        })
+        assert h.tokens_remaining == 500
+        assert h.tokens_reset == 90.0
+        assert h.requests_reset == 0.25
+        assert h.retry_after is None
+
+
+class TestRateLimiter:
+
+    def test_requests_per_minute(self, clock):
+        limiter = RateLimiter(rpm=2)
+
+        async def _run():
+            for _ in range(3):
+                await limiter.acquire()
+
+        asyncio.run(_run())
+        assert clock.slept == [pytest.approx(30.0)]
+
+    def test_tokens_settled_with_usage(self, clock):
+        limiter = RateLimiter(tpm=1000)
+
+        async def _run():
+            await limiter.acquire(100)
+            await limiter.settle(100, 1000)    # the call used far more than estimated
+            await limiter.acquire(100)
+
+        asyncio.run(_run())
+        assert clock.slept == [pytest.approx(6.0)]
+
+    def test_state_file_shared(self, clock, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+        first = RateLimiter(rpm=2, state_path=path, key="k")
+        second = RateLimiter(rpm=2, state_path=path, key="k")
+
+        async def _run():
+            await first.acquire()
+            await first.acquire()
+            await second.acquire()
+
+        asyncio.run(_run())
+        assert clock.slept == [pytest.approx(30.0)]
+        first.close()
+        second.close()
+
+    def test_state_lock_waited_off_the_event_loop(self, tmp_path):
+        path = tmp_path / "limits.sqlite3"
+        limiter = RateLimiter(rpm=60, state_path=path, key="k")
+        holder = sqlite3.connect(path, isolation_level=None)
+        holder.execute("BEGIN IMMEDIATE")     # another process holds the write lock
+
+        async def _run():
+            task = asyncio.ensure_future(limiter.acquire())
+            for _ in range(5):
+                await asyncio.sleep(0.01)      # the loop keeps running meanwhile
+            assert not task.done()
+            holder.execute("COMMIT")
+            await asyncio.wait_for(task, 5)
+
+        asyncio.run(_run())
+        holder.close()
+        limiter.close()
+
+    def test_pause_from_headers(self, clock):
+        limiter = RateLimiter(rpm=100)
+
+        async def _run():
+            await limiter.observe(RateLimitHeaders(requests_remaining=0, requests_reset=12.0))
+            await limiter.acquire()
+
+        asyncio.run(_run())
+        assert clock.slept == [pytest.approx(12.0)]
+
+
+class TestRateLimitedAdapter:
+
+    def test_retries_after_provider_delay(self, clock):
+        inner = AsyncMock()
+        inner.generate.side_effect = [
+            RateLimitError("slow down", retry_after=20.0),
+            ModelResponse(text="ok", model="m", provider="p"),
+        ]
+        adapter = RateLimitedAdapter(inner, RateLimiter(rpm=60), max_retries=3)
+
+        resp = asyncio.run(adapter.generate("prompt"))
+        assert resp.text == "ok"
+        assert inner.generate.await_count == 2
+        assert 20.0 <= sum(clock.slept) <= 21.0
+
+    def test_gives_up_after_max_retries(self, clock):
+        inner = AsyncMock()
+        inner.generate.side_effect = RateLimitError("slow down")
+        adapter = RateLimitedAdapter(inner, RateLimiter(rpm=60), max_retries=2)
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(adapter.generate("prompt"))
+        assert inner.generate.await_count == 2
+
+    def test_reserves_output_and_settles_to_usage(self, clock):
+        limiter = RateLimiter(tpm=1000)
+        during: list[float] = []
+
+        async def _generate(prompt, **kwargs):
+            during.append(limiter._store._state.tokens)
+            return ModelResponse(
+                text="ok", model="m", provider="p",
+                usage={"prompt_tokens": 100, "completion_tokens": 100},
+            )
+
+        inner = AsyncMock()
+        inner.generate.side_effect = _generate
+        adapter = RateLimitedAdapter(inner, limiter, estimate=lambda text: 100)
+
+        asyncio.run(adapter.generate("prompt", max_tokens=800))
+        # While the call runs, its possible output is reserved too
+        assert during == [pytest.approx(100)]
+        assert limiter._store._state.tokens == pytest.approx(800)
+
+    def test_failed_call_refunded(self, clock):
+        inner = AsyncMock()
+        inner.generate.side_effect = RuntimeError("backend down")
+        limiter = RateLimiter(tpm=1000)
+        adapter = RateLimitedAdapter(inner, limiter, estimate=lambda text: 100)
+
+        with pytest.raises(RuntimeError, match="backend down"):
+            asyncio.run(adapter.generate("prompt", max_tokens=800))
+        assert limiter._store._state.tokens == pytest.approx(1000)
+        assert inner.generate.await_count == 1
+
+
+class TestProviderSignals:
+    """Adapters surface 429s as RateLimitError with the provider's delay."""
+
+    def test_anthropic_429(self):
+        from types import SimpleNamespace
+
+        import anthropic
+
+        exc = anthropic.RateLimitError.__new__(anthropic.RateLimitError)
+        exc.response = SimpleNamespace(headers={
+            "retry-after": "9", "anthropic-ratelimit-requests-remaining": "0",
+            "request-id": "req_1",
+        })
+        adapter = AnthropicAdapter(api_key="sk-test")
+        adapter._client = AsyncMock()
+        adapter._client.messages.with_raw_response.create.side_effect = exc
+
+        with pytest.raises(RateLimitError) as err:
+            asyncio.run(adapter.generate("hi"))
+        assert err.value.retry_after == 9.0
+        assert err.value.headers == {
+            "retry-after": "9", "anthropic-ratelimit-requests-remaining": "0",
+        }
+
+    def test_ollama_busy_backs_off(self, clock):
+        adapter = OllamaAdapter(max_retries=3)
+        adapter._client = httpx.AsyncClient(
+            base_url="http://ollama",
+            transport=httpx.MockTransport(lambda request: httpx.Response(503)),
+        )
+        with pytest.raises(RateLimitError):
+            asyncio.run(adapter.generate("hi"))
+        assert len(clock.slept) == 2
+        assert 0.5 <= clock.slept[0] <= 1.0 and 1.0 <= clock.slept[1] <= 2.0
@@ -0,0 +1,119 @@
+"""Tests for the hierarchical tree reducer."""
+
+import asyncio
+
+import pytest
+
+from transsum.models.base import ModelResponse
+from transsum.processing.reducer import TreeReducer
+
+
+def _joining_merge(calls: list[list[str]]):
+    """Merge coroutine that records its inputs and joins them with '+'."""
+    async def _merge(texts: list[str]) -> ModelResponse:
+        calls.append(list(texts))
+        await asyncio.sleep(0)
+        return ModelResponse(
+            text="+".join(texts), model="m", provider="mock",
+            usage={"prompt_tokens": 1, "completion_tokens": 1},
+        )
+    return _merge
+
+
+def _reduce(texts: list[str], budget: int, order: list[int] | None = None):
+    """Feed `texts` (optionally out of order) and return (final group, merge calls)."""
+    calls: list[list[str]] = []
+
+    async def _run():
+        reducer = TreeReducer(
+            len(texts), _joining_merge(calls), token_budget=budget, estimate=len,
+        )
+        for pos in order or range(len(texts)):
+            reducer.add(pos, texts[pos])
+            await asyncio.sleep(0)
+        try:
+            return await reducer.result(), reducer
+        finally:
+            await reducer.aclose()
+
+    final, reducer = asyncio.run(_run())
+    return final, calls, reducer
+
+
+class TestTreeReducer:
+    """Grouping, ordering and bounding behaviour."""
+
+    def test_everything_fits_budget_makes_no_merges(self):
+        final, calls, _ = _reduce(["a", "b", "c"], budget=100)
+        assert final == ["a", "b", "c"]
+        assert calls == []
+
+    def test_groups_respect_budget(self):
+        texts = [f"{i:02d}" for i in range(16)]  # 2 "tokens" each
+        final, calls, _ = _reduce(texts, budget=6)
+        # A group only exceeds the budget when two items alone overflow it
+        assert all(len(c) == 2 or sum(map(len, c)) <= 6 for c in calls)
+        assert len(final) == 2 or sum(map(len, final)) <= 6
+
+    def test_order_preserved_out_of_order_arrival(self):
+        texts = [f"{i:02d}" for i in range(16)]
+        order = list(reversed(range(16)))
+        final, _, _ = _reduce(texts, budget=6, order=order)
+        flat = "+".join(final).split("+")
+        assert flat == texts
+
+    def test_merges_start_before_all_inputs_arrive(self):
+        calls: list[list[str]] = []
+
+        async def _run():
+            reducer = TreeReducer(8, _joining_merge(calls), token_budget=4, estimate=len)
+            for pos in range(4):
+                reducer.add(pos, "xx")
+            await asyncio.sleep(0.01)
+            started = len(calls)
+            for pos in range(4, 8):
+                reducer.add(pos, "xx")
+            await reducer.result()
+            await reducer.aclose()
+            return started
+
+        assert asyncio.run(_run()) >= 1
+
+    def test_usage_accumulated(self):
+        texts = [f"{i:02d}" for i in range(8)]
+        _, calls, reducer = _reduce(texts, budget=4)
+        assert reducer.merges == len(calls)
+        assert reducer.usage["prompt_tokens"] == len(calls)
+
+    def test_merge_failure_propagates(self):
+        async def _fail(texts):
+            raise RuntimeError("merge failed")
+
+        async def _run():
+            reducer = TreeReducer(4, _fail, token_budget=2, estimate=len)
+            for pos in range(4):
+                reducer.add(pos, "xx")
+            try:
+                await reducer.result()
+            finally:
+                await reducer.aclose()
+
+        with pytest.raises(RuntimeError, match="merge failed"):
+            asyncio.run(_run())
+
+    def test_total_declared_later(self):
+        calls: list[list[str]] = []
+
+        async def _run():
+            reducer = TreeReducer(None, _joining_merge(calls), token_budget=4, estimate=len)
+            for pos, text in enumerate(["aa", "bb", "cc", "dd", "ee"]):
+                reducer.add(pos, text)
+                await asyncio.sleep(0)
+            reducer.set_total(5)
+            try:
+                return await reducer.result()
+            finally:
+                await reducer.aclose()
+
+        final = asyncio.run(_run())
+        assert "".join(final).replace("+", "") == "aabbccddee"
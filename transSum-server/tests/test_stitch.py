@@ -0,0 +1,183 @@
+"""Tests for overlap-aligned stitching of translated chunks."""
+
+import asyncio
+import itertools
+import re
+from unittest.mock import AsyncMock
+
+from tests.test_pipeline import _mock_adapter
+from transsum.config import Settings
+from transsum.models.base import ModelResponse
+from transsum.processing.chunker import TextChunker
+from transsum.processing.loader import DocumentLoader, PageStream
+from transsum.processing.pipeline import ProcessingPipeline, TaskType
+from transsum.processing.stitch import Overlap, SeamAligner, create_aligner
+
+_TEXT = " ".join(f"Sentence number {i} talks about topic {i * 7}." for i in range(300))
+
+
+def _translator(render=str.upper) -> AsyncMock:
+    """An adapter that "translates" a chunk with `render` and joins seams as "JOINED"."""
+    async def _generate(prompt, **kwargs):
+        if prompt.startswith("Two consecutive sections"):
+            text = "JOINED"
+        else:
+            text = render(re.search(r"---\n(.*)\n---$", prompt, re.DOTALL).group(1))
+        return ModelResponse(
+            text=text, model="mock-model", provider="mock",
+            usage={"prompt_tokens": 10, "completion_tokens": 20},
+        )
+
+    adapter = AsyncMock()
+    adapter.generate.side_effect = _generate
+    adapter.model, adapter.provider = "mock-model", "mock"
+    return adapter
+
+
+class TestOverlap:
+
+    def test_finds_shared_passage(self):
+        left = "The first part of the text. " * 4 + "And this passage is shared by both."
+        right = "And this passage is shared by both. Then the second part follows."
+        overlap = Overlap.between(left, right)
+        assert overlap.text == "And this passage is shared by both."
+        assert overlap.right_share == len(overlap.text) / len(right)
+
+    def test_disjoint_chunks(self):
+        assert Overlap.between("One chunk of text here.", "Another, unrelated chunk.").text == ""
+
+
+class TestSeamAligner:
+
+    LEFT = "Il pleut depuis ce matin. " * 6 + "Nous restons donc à la maison ce soir."
+    RIGHT = "Nous restons donc à la maison ce soir. " + "Demain, le soleil reviendra. " * 6
+
+    def _overlap(self):
+        shared = "We are therefore staying at home tonight."
+        return Overlap(shared, len(shared) / 190, len(shared) / 205)
+
+    def test_cuts_at_agreement(self):
+        seam = SeamAligner().align(self.LEFT, self.RIGHT, self._overlap())
+        joined = self.LEFT[:seam.left_cut] + seam.joint + self.RIGHT[seam.right_cut:]
+        assert seam.confidence > 0.5
+        assert joined.count("Nous restons donc") == 1
+        assert joined.startswith(self.LEFT[:-40]) and joined.endswith(self.RIGHT[40:])
+
+    def test_disagreement_needs_model(self):
+        right = "Alors nous restons chez nous ce soir. " + "Demain, le soleil reviendra. " * 6
+        seam = SeamAligner().align(self.LEFT, right, self._overlap())
+        assert seam.joint is None
+        # Windows are bounded and don't split words
+        assert len(self.LEFT) - seam.left_cut < len(self.LEFT) // 2 + 1
+        assert self.LEFT[seam.left_cut - 1] == " " and right[seam.right_cut] == " "
+
+    def test_cjk_aligned_by_character(self):
+        left = "今日は朝から雨が降っている。" * 3 + "だから今夜は家にいることにした。"
+        right = "だから今夜は家にいることにした。" + "明日は晴れるでしょう。" * 3
+        overlap = Overlap("So I stayed home tonight.", 0.3, 0.4)
+        seam = SeamAligner().align(left, right, overlap)
+        assert seam.joint == ""
+        assert (left[:seam.left_cut] + right[seam.right_cut:]).count("だから今夜") == 1
+
+    def test_no_overlap_joined_by_source_separator(self):
+        seam = SeamAligner().align("Fin.", "Début.", Overlap("", 0.0, 0.0, "\n"))
+        assert (seam.left_cut, seam.right_cut, seam.joint) == (4, 0, "\n")
+
+    def test_no_overlap_without_separator_needs_model(self):
+        seam = SeamAligner().align(self.LEFT, self.RIGHT, Overlap("", 0.0, 0.0))
+        assert seam.joint is None
+        assert 0 < seam.left_cut < len(self.LEFT) and 0 < seam.right_cut < len(self.RIGHT)
+
+    def test_factory(self):
+        assert create_aligner(Settings()) is None
+        assert isinstance(create_aligner(Settings(translate_merge="stitch")), SeamAligner)
+
+
+class TestPipelineStitching:
+
+    def _run(self, adapter, **kwargs):
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(1000, 200), seam_aligner=SeamAligner(), **kwargs,
+        )
+        doc = DocumentLoader.load_text(_TEXT)
+        return asyncio.run(pipeline.run(doc, TaskType.TRANSLATE, language="French"))
+
+    def test_no_reduce_call(self):
+        adapter = _translator()
+        result = self._run(adapter)
+
+        assert result.output == _TEXT.upper()
+        assert adapter.generate.call_count == result.chunks_processed
+        assert {c.kind for c in result.timings.calls} == {"map"}
+
+    def test_low_confidence_seams_merged_on_windows(self):
+        # Each chunk is "translated" differently, so no seam can be aligned
+        chunks = itertools.count()
+
+        def _render(text):
+            n = next(chunks)
+            return " ".join(f"{word}{n}" for word in text.split())
+
+        adapter = _translator(_render)
+        result = self._run(adapter)
+
+        seams = [c for c in result.timings.calls if c.kind == "seam"]
+        assert len(seams) == result.chunks_processed - 1
+        assert result.output.count("JOINED") == len(seams)
+        prompts = [c.args[0] for c in adapter.generate.call_args_list]
+        assert max(len(p) for p in prompts if p.startswith("Two consecutive")) < 2000
+
+    def test_streamed_tokens_form_output(self):
+        pipeline = ProcessingPipeline(
+            _translator(), TextChunker(1000, 200), seam_aligner=SeamAligner(),
+        )
+        doc = DocumentLoader.load_text(_TEXT)
+
+        async def _collect():
+            return [t async for t in pipeline.stream_run(doc, TaskType.TRANSLATE)]
+
+        tokens = asyncio.run(_collect())
+        assert len(tokens) > 1 and "".join(tokens) == _TEXT.upper()
+
+    def test_disjoint_chunks_keep_source_separators(self):
+        text = "\n\n".join(_TEXT[i:i + 700].strip() for i in range(0, 2100, 700))
+        adapter = _translator(lambda t: t)
+        result = self._run_text(adapter, text, TextChunker(1000, 0))
+
+        assert result.output == text
+        assert {c.kind for c in result.timings.calls} == {"map"}
+
+    def test_streamed_disjoint_chunks_keep_source_separators(self):
+        # Chunks are cut from successive buffers of the stream
+        pages = [_TEXT[i:i + 300].strip() for i in range(0, 2700, 300)]
+        pipeline = ProcessingPipeline(
+            _translator(lambda t: t), TextChunker(1000, 0), seam_aligner=SeamAligner(),
+        )
+        stream = PageStream("report.pdf", ".pdf", iter(pages))
+        result = asyncio.run(pipeline.run(stream, TaskType.TRANSLATE, language="French"))
+
+        assert result.chunks_processed > 2
+        assert result.output == "\n\n".join(pages)
+
+    def test_chunks_cut_mid_word_joined_by_model(self):
+        adapter = _translator()
+        text = "".join(f"{i:05d}" for i in range(500))  # no spaces to cut at
+        result = self._run_text(adapter, text, TextChunker(1000, 0))
+
+        seams = [c for c in result.timings.calls if c.kind == "seam"]
+        assert len(seams) == 2 and result.output.count("JOINED") == 2
+        prompts = [c.args[0] for c in adapter.generate.call_args_list]
+        assert any("middle of a sentence" in p for p in prompts)
+
+    def _run_text(self, adapter, text, chunker):
+        pipeline = ProcessingPipeline(adapter, chunker, seam_aligner=SeamAligner())
+        doc = DocumentLoader.load_text(text)
+        return asyncio.run(pipeline.run(doc, TaskType.TRANSLATE, language="French"))
+
+    def test_summaries_still_reduced(self):
+        adapter = _mock_adapter()
+        pipeline = ProcessingPipeline(
+            adapter, TextChunker(1000, 200), seam_aligner=SeamAligner(),
+        )
+        result = asyncio.run(pipeline.run(DocumentLoader.load_text(_TEXT), TaskType.SUMMARIZE))
+        assert result.timings.calls[-1].kind == "reduce"
@@ -0,0 +1,62 @@
+"""Tests for the extracted-text cache."""
+
+import os
+
+import pytest
+
+from transsum.processing.text_cache import ExtractedTextCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractedTextCache(tmp_path / "cache", max_bytes=1_000_000)
+
+
+class TestKeys:
+    """Keys follow the file's identity and content."""
+
+    def test_same_file_same_key(self, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF one")
+        assert ExtractedTextCache.key_for(path) == ExtractedTextCache.key_for(path)
+
+    def test_content_change_changes_key(self, tmp_path):
+        path = tmp_path / "a.pdf"
+        path.write_bytes(b"%PDF one")
+        st = path.stat()
+        before = ExtractedTextCache.key_for(path)
+        path.write_bytes(b"%PDF two")  # same size
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert ExtractedTextCache.key_for(path) != before
+
+
+class TestStore:
+    """Round trips, misses and LRU eviction."""
+
+    def test_round_trip(self, cache):
+        cache.put("k", "Extracted text — ünïcode.")
+        assert cache.get("k") == "Extracted text — ünïcode."
+        assert cache.stats["hits"] == 1
+
+    def test_pages_round_trip(self, cache):
+        cache.put_pages("k", ["Page one.", "Page two — ünïcode."])
+        assert cache.get_pages("k") == ["Page one.", "Page two — ünïcode."]
+        assert cache.get_pages("other") is None
+
+    def test_miss(self, cache):
+        assert cache.get("missing") is None
+        assert cache.stats["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ExtractedTextCache(tmp_path / "cache", max_bytes=250)
+        cache.put("a", "a" * 100)
+        cache.put("b", "b" * 100)
+        os.utime(tmp_path / "cache" / "a.txt", (1, 1))
+        os.utime(tmp_path / "cache" / "b.txt", (2, 2))
+        assert cache.get("a") is not None   # refreshes a
+
+        cache.put("c", "c" * 100)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats["evictions"] == 1
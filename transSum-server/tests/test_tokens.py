@@ -0,0 +1,47 @@
+"""Tests for the token estimators."""
+
+import pytest
+
+from transsum.config import Settings
+from transsum.processing.tokens import HeuristicEstimator, TiktokenEstimator, create_estimator
+
+
+class TestHeuristicEstimator:
+    """Script-aware estimates."""
+
+    def test_empty_text_is_zero(self):
+        assert HeuristicEstimator().count("") == 0
+
+    def test_english_about_four_chars_per_token(self):
+        text = "the quick brown fox jumps over the lazy dog " * 20
+        assert HeuristicEstimator().count(text) == pytest.approx(len(text) / 4, rel=0.05)
+
+    def test_cjk_counts_one_token_per_character(self):
+        text = "大型语言模型将文本分割成词元" * 10
+        assert HeuristicEstimator().count(text) == len(text)
+
+    def test_code_denser_than_prose(self):
+        est = HeuristicEstimator()
+        code = "x = {'a': [1, 2], 'b': (3, 4)};\n" * 10
+        prose = "an ordinary english sentence here\n" * 10
+        assert est.count(code) > est.count(prose)
+
+
+class TestFactory:
+    """create_estimator follows TOKEN_ESTIMATOR."""
+
+    def test_default_is_heuristic(self):
+        assert isinstance(create_estimator(Settings()), HeuristicEstimator)
+
+    def test_tiktoken_missing_raises_helpful_error(self, monkeypatch):
+        import builtins
+        real_import = builtins.__import__
+
+        def fake_import(name, *args, **kwargs):
+            if name == "tiktoken":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", fake_import)
+        with pytest.raises(ImportError, match="pip install tiktoken"):
+            TiktokenEstimator()